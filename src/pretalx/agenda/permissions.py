@@ -9,7 +9,7 @@ def is_agenda_visible(user, event):
         event
         and event.is_public
         and event.settings.show_schedule
-        and event.schedules.filter(version__isnull=False).exists()
+        and event.current_schedule
     )
 
 
@@ -41,10 +41,7 @@ def is_feedback_ready(user, submission):
 
 @rules.predicate
 def is_speaker_viewable(user, profile):
-    is_speaker = profile.user.submissions.filter(
-        slots__schedule=profile.event.current_schedule
-    ).exists()
-    return is_speaker and is_agenda_visible(user, profile.event)
+    return profile.is_published and is_agenda_visible(user, profile.event)
 
 
 rules.add_perm(
@@ -145,6 +145,4 @@ class ExportTalkICalView(
 
 
 class ExportSpeakerView(PretalxExportContextMixin, BuildableDetailView, SpeakerView):
-    queryset = SpeakerProfile.objects.filter(
-        user__submissions__slots__schedule__published__isnull=False
-    ).distinct()
+    queryset = SpeakerProfile.objects.filter(is_published=True)
@@ -7,11 +7,11 @@ from django.http import (
     Http404, HttpResponse, HttpResponseNotModified, HttpResponsePermanentRedirect,
 )
 from django.urls import resolve, reverse
-from django.utils.functional import cached_property
-from django.utils.timezone import now
+from django.utils.functional import SimpleLazyObject, cached_property
 from django.views.generic import TemplateView
 
-from pretalx.common.mixins.views import PermissionRequired
+from pretalx.common.cache import get_event_data_version
+from pretalx.common.mixins.views import PageCacheMixin, PermissionRequired
 from pretalx.common.signals import register_data_exporters
 
 
@@ -109,9 +109,10 @@ class ExporterView(ScheduleDataView):
             raise Http404()
 
 
-class ScheduleView(ScheduleDataView):
+class ScheduleView(PageCacheMixin, ScheduleDataView):
     template_name = 'agenda/schedule.html'
     permission_required = 'agenda.view_schedule'
+    fragment_cache_timeout = 60 * 60 * 24
 
     def get_permission_object(self):
         return self.request.event
@@ -124,22 +125,27 @@ class ScheduleView(ScheduleDataView):
         return super().get_object()
 
     def get_context_data(self, *args, **kwargs):
-        from pretalx.schedule.exporters import ScheduleData
-
         context = super().get_context_data(*args, **kwargs)
         context['exporters'] = list(
             exporter(self.request.event)
             for _, exporter in register_data_exporters.send(self.request.event)
         )
-        timezone = pytz.timezone(self.request.event.timezone)
         if 'schedule' not in context:
             return context
 
-        context['data'] = ScheduleData(
-            event=self.request.event, schedule=context['schedule']
-        ).data
+        schedule = context['schedule']
+        # The grid is cached as a template fragment, so we only build it on demand
+        context['data'] = SimpleLazyObject(lambda: self.get_schedule_data(schedule))
+        context['data_version'] = get_event_data_version(self.request.event)
         context['search'] = self.request.GET.get('q')
-        for date in context['data']:
+        return context
+
+    def get_schedule_data(self, schedule):
+        from pretalx.schedule.exporters import ScheduleData
+
+        timezone = pytz.timezone(self.request.event.timezone)
+        data = ScheduleData(event=self.request.event, schedule=schedule).data
+        for date in data:
             if date.get('first_start') and date.get('last_end'):
                 start = (
                     date.get('first_start')
@@ -161,8 +167,7 @@ class ScheduleView(ScheduleDataView):
                             * 2
                         )
                         talk.height = int(talk.duration * 2)
-                        talk.is_active = talk.start <= now() <= talk.end
-        return context
+        return data
 
 
 class ChangelogView(PermissionRequired, TemplateView):
@@ -1,10 +1,10 @@
 from django.http import HttpResponseRedirect
 from django.views.generic import TemplateView
 
-from pretalx.common.mixins.views import PermissionRequired
+from pretalx.common.mixins.views import PageCacheMixin, PermissionRequired
 
 
-class SneakpeekView(PermissionRequired, TemplateView):
+class SneakpeekView(PageCacheMixin, PermissionRequired, TemplateView):
     template_name = 'agenda/sneakpeek.html'
     permission_required = 'agenda.view_sneak_peek'
 
@@ -8,12 +8,12 @@ from django.http import HttpResponse
 from django.utils.decorators import method_decorator
 from django.views.generic import DetailView
 
-from pretalx.common.mixins.views import PermissionRequired
+from pretalx.common.mixins.views import PageCacheMixin, PermissionRequired
 from pretalx.person.models import SpeakerProfile
 
 
 @method_decorator(csp_update(IMG_SRC="https://www.gravatar.com"), name='dispatch')
-class SpeakerView(PermissionRequired, DetailView):
+class SpeakerView(PageCacheMixin, PermissionRequired, DetailView):
     template_name = 'agenda/speaker.html'
     context_object_name = 'profile'
     permission_required = 'agenda.view_speaker'
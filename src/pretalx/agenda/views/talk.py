@@ -12,7 +12,7 @@ from django.utils.translation import ugettext_lazy as _
 from django.views.generic import DetailView, FormView, ListView
 
 from pretalx.cfp.views.event import EventPageMixin
-from pretalx.common.mixins.views import Filterable, PermissionRequired
+from pretalx.common.mixins.views import Filterable, PageCacheMixin, PermissionRequired
 from pretalx.common.phrases import phrases
 from pretalx.person.models.profile import SpeakerProfile
 from pretalx.schedule.models import TalkSlot
@@ -20,15 +20,12 @@ from pretalx.submission.forms import FeedbackForm
 from pretalx.submission.models import Feedback, Submission
 
 
-class TalkList(PermissionRequired, Filterable, ListView):
+class TalkList(PageCacheMixin, PermissionRequired, Filterable, ListView):
     context_object_name = 'talks'
     model = Submission
     template_name = 'agenda/talks.html'
     permission_required = 'agenda.view_schedule'
-    default_filters = (
-        'submission__speakers__name__icontains',
-        'submission__title__icontains',
-    )
+    search_index = 'submission'
 
     def get_queryset(self):
         return self.filter_queryset(self.request.event.talks)
@@ -42,11 +39,11 @@ class TalkList(PermissionRequired, Filterable, ListView):
         return context
 
 
-class SpeakerList(PermissionRequired, Filterable, ListView):
+class SpeakerList(PageCacheMixin, PermissionRequired, Filterable, ListView):
     context_object_name = 'speakers'
     template_name = 'agenda/speakers.html'
     permission_required = 'agenda.view_schedule'
-    default_filters = ('user__name__icontains',)
+    search_index = 'speaker'
 
     def get_queryset(self):
         qs = SpeakerProfile.objects.filter(
@@ -63,7 +60,7 @@ class SpeakerList(PermissionRequired, Filterable, ListView):
         return context
 
 
-class TalkView(PermissionRequired, DetailView):
+class TalkView(PageCacheMixin, PermissionRequired, DetailView):
     context_object_name = 'talk'
     model = Submission
     slug_field = 'code'
@@ -151,11 +148,7 @@ class FeedbackView(PermissionRequired, FormView):
     permission_required = 'agenda.give_feedback'
 
     def get_object(self):
-        return Submission.objects.filter(
-            event=self.request.event,
-            code__iexact=self.kwargs['slug'],
-            slots__in=self.request.event.current_schedule.talks.filter(is_visible=True),
-        ).first()
+        return self.request.event.talks.filter(code__iexact=self.kwargs['slug']).first()
 
     def get(self, *args, **kwargs):
         talk = self.get_object()
@@ -0,0 +1,25 @@
+from rest_framework.filters import SearchFilter
+
+from pretalx.common.search import search_filter, search_rank
+
+
+class SearchIndexFilter(SearchFilter):
+    """
+    Searches the full-text index on views defining a ``search_index``, see
+    :class:`pretalx.common.mixins.views.Filterable`, and falls back to the
+    ``search_fields`` otherwise.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_index = getattr(view, 'search_index', None)
+        query = ' '.join(self.get_search_terms(request))
+        if not search_index or not query:
+            return super().filter_queryset(request, queryset, view)
+        field = getattr(view, 'search_index_field', 'pk')
+        queryset = queryset.filter(
+            search_filter(query, request.event, kind=search_index, field=field)
+        )
+        rank = search_rank(query, kind=search_index, field=field)
+        if rank is not None:
+            queryset = queryset.annotate(search_rank=rank).order_by('-search_rank')
+        return queryset
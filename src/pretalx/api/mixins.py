@@ -0,0 +1,75 @@
+import hashlib
+
+from django.core.cache import cache
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+from rest_framework.response import Response
+
+from pretalx.common.cache import get_event_data_version
+
+
+class ConditionalCacheMixin:
+    """
+    Adds strong validators and response caching to read-only event API endpoints.
+
+    Responses are keyed by the endpoint and its query parameters, the
+    permission tier of the requesting user, and the data version of the event,
+    which changes whenever the underlying data does. Requests with a matching
+    ``If-None-Match`` header are answered without building a queryset.
+    """
+
+    cache_timeout = 60 * 60
+
+    def get_permission_tier(self):
+        user = self.request.user
+        event = self.request.event
+        if user.has_perm('orga.view_schedule', event):
+            return 'orga'
+        if user.has_perm('orga.view_submissions', event):
+            return 'reviewer'
+        return 'public'
+
+    def get_cache_key(self):
+        request = self.request
+        query = sorted(
+            (key, value)
+            for key in request.GET
+            for value in request.GET.getlist(key)
+        )
+        identifier = ':'.join(
+            [
+                get_event_data_version(request.event),
+                self.get_permission_tier(),
+                request.get_host(),
+                request.path,
+                str(query),
+            ]
+        )
+        digest = hashlib.sha1(identifier.encode()).hexdigest()
+        return f'api_response_{request.event.pk}_{digest}', digest
+
+    def _cached_response(self, handler, request, *args, **kwargs):
+        key, digest = self.get_cache_key()
+        etag = quote_etag(digest)
+        if_none_match = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+        if etag in if_none_match or '*' in if_none_match:
+            response = HttpResponseNotModified()
+        else:
+            data = cache.get(key)
+            if data is None:
+                response = handler(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+                cache.set(key, response.data, self.cache_timeout)
+            else:
+                response = Response(data)
+        response['ETag'] = etag
+        patch_vary_headers(response, ('Cookie', 'Authorization'))
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(super().retrieve, request, *args, **kwargs)
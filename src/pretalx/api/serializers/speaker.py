@@ -12,11 +12,11 @@ class SubmitterSerializer(ModelSerializer):
 
     def get_biography(self, obj):
         if self.context.get('request') and self.context['request'].event:
-            return getattr(
-                obj.profiles.filter(event=self.context['request'].event).first(),
-                'biography',
-                '',
-            )
+            # Iterating over all profiles makes use of prefetched profiles
+            event_id = self.context['request'].event.pk
+            for profile in obj.profiles.all():
+                if profile.event_id == event_id:
+                    return profile.biography
         return ''
 
     class Meta:
@@ -32,11 +32,8 @@ class SpeakerSerializer(ModelSerializer):
 
     @staticmethod
     def get_submissions(obj):
-        talks = (
-            obj.event.current_schedule.talks.all() if obj.event.current_schedule else []
-        )
         return obj.user.submissions.filter(
-            event=obj.event, slots__in=talks
+            event=obj.event, is_published=True
         ).values_list('code', flat=True)
 
     class Meta:
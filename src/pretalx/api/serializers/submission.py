@@ -1,3 +1,5 @@
+from django.core.exceptions import ObjectDoesNotExist
+from django.utils.functional import cached_property
 from i18nfield.rest_framework import I18nAwareModelSerializer
 from rest_framework.serializers import (
     ModelSerializer, SerializerMethodField, SlugRelatedField,
@@ -6,7 +8,7 @@ from rest_framework.serializers import (
 from pretalx.api.serializers.question import AnswerSerializer
 from pretalx.api.serializers.speaker import SubmitterSerializer
 from pretalx.schedule.models import Schedule, TalkSlot
-from pretalx.submission.models import Answer, Submission, SubmissionStates
+from pretalx.submission.models import ReviewAggregate, Submission, SubmissionStates
 
 
 class SlotSerializer(I18nAwareModelSerializer):
@@ -17,14 +19,28 @@ class SlotSerializer(I18nAwareModelSerializer):
         fields = ('room', 'start', 'end')
 
 
+class ReviewAggregateSerializer(ModelSerializer):
+    class Meta:
+        model = ReviewAggregate
+        fields = (
+            'score_count',
+            'mean_score',
+            'median_score',
+            'score_deviation',
+            'positive_overrides',
+            'negative_overrides',
+        )
+
+
 class SubmissionSerializer(I18nAwareModelSerializer):
     speakers = SubmitterSerializer(many=True)
     submission_type = SlugRelatedField(slug_field='name', read_only=True)
-    slot = SlotSerializer(TalkSlot.objects.filter(is_visible=True), read_only=True)
+    slot = SerializerMethodField()
     duration = SerializerMethodField()
     answers = SerializerMethodField()
+    review_scores = SerializerMethodField()
 
-    @property
+    @cached_property
     def is_orga(self):
         request = self.context.get('request')
         if request:
@@ -35,13 +51,28 @@ class SubmissionSerializer(I18nAwareModelSerializer):
     def get_duration(obj):
         return obj.export_duration
 
+    @staticmethod
+    def get_slot(obj):
+        # The API views prefetch the slots of the current schedule
+        if hasattr(obj, 'current_slots'):
+            slot = obj.current_slots[0] if obj.current_slots else None
+        else:
+            slot = obj.slot
+        return SlotSerializer(slot).data if slot else None
+
     def get_answers(self, obj):
         if self.is_orga:
-            return AnswerSerializer(
-                Answer.objects.filter(submission=obj), many=True
-            ).data
+            return AnswerSerializer(obj.answers.all(), many=True).data
         return []
 
+    def get_review_scores(self, obj):
+        if not self.is_orga:
+            return None
+        try:
+            return ReviewAggregateSerializer(obj.review_aggregate).data
+        except ObjectDoesNotExist:
+            return None
+
     class Meta:
         model = Submission
         fields = (
@@ -59,6 +90,7 @@ class SubmissionSerializer(I18nAwareModelSerializer):
             'slot',
             'image',
             'answers',
+            'review_scores',
         )
 
 
@@ -1,15 +1,16 @@
 from rest_framework import viewsets
 
+from pretalx.api.mixins import ConditionalCacheMixin
 from pretalx.api.serializers.speaker import SpeakerOrgaSerializer, SpeakerSerializer
 from pretalx.person.models import SpeakerProfile
 
 
-class SpeakerViewSet(viewsets.ReadOnlyModelViewSet):
+class SpeakerViewSet(ConditionalCacheMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = SpeakerSerializer
     queryset = SpeakerProfile.objects.none()
     lookup_field = 'user__code__iexact'
     filter_fields = ('user__name',)
-    search_fields = ('user__name',)
+    search_index = 'speaker'
 
     def get_serializer_class(self):
         if self.request.user.has_perm('orga.view_speakers', self.request.event):
@@ -24,7 +25,7 @@ class SpeakerViewSet(viewsets.ReadOnlyModelViewSet):
             and self.request.event.settings.show_schedule
         ):
             return SpeakerProfile.objects.filter(
-                user__submissions__slots__in=self.request.event.current_schedule.talks.all()
+                event=self.request.event, is_published=True
             )
         return SpeakerProfile.objects.none()
 
@@ -1,48 +1,74 @@
+from django.db.models import Prefetch
+from django.utils.functional import cached_property
 from rest_framework import viewsets
 
+from pretalx.api.mixins import ConditionalCacheMixin
 from pretalx.api.serializers.submission import (
     ScheduleListSerializer, ScheduleSerializer, SubmissionSerializer,
 )
-from pretalx.schedule.models import Schedule
-from pretalx.submission.models import Submission
+from pretalx.person.models import SpeakerProfile
+from pretalx.schedule.models import Schedule, TalkSlot
+from pretalx.submission.models import Answer, Submission
 
 
-class SubmissionViewSet(viewsets.ReadOnlyModelViewSet):
+class SubmissionViewSet(ConditionalCacheMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = SubmissionSerializer
     queryset = Submission.objects.none()
     lookup_field = 'code__iexact'
     filter_fields = ('state', 'content_locale', 'submission_type')
-    search_fields = ('title', 'speakers__name')
+    search_index = 'submission'
+
+    @cached_property
+    def is_orga(self):
+        return self.request.user.has_perm('orga.view_submissions', self.request.event)
+
+    def with_related(self, queryset):
+        """Loads everything the serializer shows with a constant number of queries."""
+        schedule = self.request.event.current_schedule
+        queryset = queryset.select_related('submission_type').prefetch_related(
+            'speakers',
+            Prefetch(
+                'speakers__profiles',
+                queryset=SpeakerProfile.objects.filter(event=self.request.event),
+            ),
+            Prefetch(
+                'slots',
+                queryset=schedule.talks.select_related('room')
+                if schedule
+                else TalkSlot.objects.none(),
+                to_attr='current_slots',
+            ),
+        )
+        if self.is_orga:
+            queryset = queryset.select_related('review_aggregate').prefetch_related(
+                Prefetch(
+                    'answers',
+                    queryset=Answer.objects.select_related(
+                        'question', 'person'
+                    ).prefetch_related('question__options', 'options'),
+                )
+            )
+        return queryset
 
     def get_base_queryset(self):
-        if self.request.user.has_perm('orga.view_submissions', self.request.event):
-            return self.request.event.submissions.all()
-        if (
-            not self.request.user.has_perm('agenda.view_schedule', self.request.event)
-            or not self.request.event.current_schedule
-        ):
+        if self.is_orga:
+            return self.with_related(self.request.event.submissions.all())
+        if not self.request.user.has_perm('agenda.view_schedule', self.request.event):
             return Submission.objects.none()
-        return self.request.event.submissions.filter(
-            slots__in=self.request.event.current_schedule.talks.filter(is_visible=True)
-        )
+        return self.with_related(self.request.event.talks)
 
     def get_queryset(self):
-        return self.get_base_queryset() or self.queryset
+        return self.get_base_queryset()
 
 
 class TalkViewSet(SubmissionViewSet):
     def get_queryset(self):
-        if (
-            not self.request.user.has_perm('agenda.view_schedule', self.request.event)
-            or not self.request.event.current_schedule
-        ):
+        if not self.request.user.has_perm('agenda.view_schedule', self.request.event):
             return Submission.objects.none()
-        return self.request.event.submissions.filter(
-            slots__in=self.request.event.current_schedule.talks.filter(is_visible=True)
-        )
+        return self.with_related(self.request.event.talks)
 
 
-class ScheduleViewSet(viewsets.ReadOnlyModelViewSet):
+class ScheduleViewSet(ConditionalCacheMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = ScheduleSerializer
     queryset = Schedule.objects.none()
     lookup_field = 'version__iexact'
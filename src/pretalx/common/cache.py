@@ -0,0 +1,317 @@
+import hashlib
+import time
+from urllib.parse import urlparse
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.http import Http404
+from django.http.request import split_domain_port
+from django.utils.crypto import get_random_string
+
+from pretalx.common import metrics
+
+EVENT_DATA_VERSION_KEY = 'pretalx_event_data_version_{event_id}'
+EVENT_SLUG_KEY = 'pretalx_event_slug_{digest}'
+EVENT_SLUG_TIMEOUT = 60 * 60
+EVENT_SCHEDULES_VERSION_KEY = 'pretalx_event_schedules_version_{event_id}'
+EVENT_SCHEDULES_KEY = 'pretalx_event_schedules_{event_id}_{version}'
+EVENT_SCHEDULES_TIMEOUT = 60 * 60
+SUBMISSION_TIMELINE_KEY = 'pretalx_submission_timeline_{event_id}'
+CUSTOM_DOMAINS_KEY = 'pretalx_custom_domains'
+CUSTOM_DOMAINS_TIMEOUT = 60 * 60
+CUSTOM_DOMAINS_LOCAL_TIMEOUT = 10
+PUBLIC_USER_FIELDS = {'name', 'email', 'avatar', 'get_gravatar'}
+
+_custom_domains = {'expires': 0, 'events': {}, 'hosts': {}}
+
+
+def _count_lookup(name: str, value):
+    metrics.cache_lookups.inc(cache=name, result='miss' if value is None else 'hit')
+
+
+def _new_version() -> str:
+    return get_random_string(16)
+
+
+def get_version(key: str, stored: dict = None) -> str:
+    """
+    Returns the opaque version token stored under ``key``, creating it if needed.
+
+    The token lives in the cache only. If it is missing (because it was never
+    set, or because the cache evicted it), a new one is generated – so
+    anything keyed by the old token is invalidated, never served stale.
+    ``stored`` may contain the result of a previous ``get_many`` call.
+    """
+    version = cache.get(key) if stored is None else stored.get(key)
+    if version is None:
+        version = _new_version()
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key) or version
+    return version
+
+
+def bump_version(key: str):
+    """
+    Invalidates everything keyed by the current version token under ``key``.
+
+    Inside a transaction we bump once right away and once after the commit,
+    so that nothing computed from the pre-commit state can end up being
+    cached under the new version.
+    """
+    cache.set(key, _new_version(), timeout=None)
+    if connection.in_atomic_block:
+        transaction.on_commit(lambda: cache.set(key, _new_version(), timeout=None))
+
+
+def set_after_commit(key: str, value, timeout: int):
+    """
+    Stores a value in the cache – or, inside a transaction, once it has been
+    committed, so that values computed from a rolled back state are never cached.
+    """
+    if connection.in_atomic_block:
+        transaction.on_commit(lambda: cache.set(key, value, timeout))
+    else:
+        cache.set(key, value, timeout)
+
+
+def get_event_data_version(event) -> str:
+    """Returns a version token that changes whenever the public data of an event changes."""
+    return get_version(EVENT_DATA_VERSION_KEY.format(event_id=event.pk))
+
+
+def bump_event_data_version(event_id: int):
+    if event_id:
+        bump_version(EVENT_DATA_VERSION_KEY.format(event_id=event_id))
+
+
+def get_event_by_slug(slug: str):
+    """
+    Returns a fresh :class:`~pretalx.event.models.event.Event` instance for a
+    case-insensitive slug, or raises :class:`~django.http.Http404`.
+
+    The field values of the event are cached (and invalidated whenever the
+    event is saved), so that resolving the event of a request usually does not
+    need a database query. Every call returns a new instance, so that nothing
+    cached on the instance is shared between requests.
+    """
+    from pretalx.event.models import Event
+
+    key = _event_slug_key(slug)
+    fields = [field.attname for field in Event._meta.concrete_fields]
+    values = cache.get(key)
+    _count_lookup('event', values)
+    if values is None:
+        values = Event.objects.filter(slug__iexact=slug).values_list(*fields).first()
+        if values is None:
+            raise Http404('No event matches the given query.')
+        cache.set(key, values, EVENT_SLUG_TIMEOUT)
+    return Event.from_db('default', fields, values)
+
+
+def _event_slug_key(slug: str) -> str:
+    # Slugs in API URLs are not validated, so we cannot use them in keys directly
+    digest = hashlib.sha1(slug.lower().encode()).hexdigest()
+    return EVENT_SLUG_KEY.format(digest=digest)
+
+
+def _forget_event_slug(slug: str):
+    key = _event_slug_key(slug)
+    cache.delete(key)
+    if connection.in_atomic_block:
+        transaction.on_commit(lambda: cache.delete(key))
+
+
+def get_event_schedules(event) -> dict:
+    """
+    Returns the WIP schedule and the current (latest released) schedule of an
+    event as ``{'wip': …, 'current': …}``. Either may be ``None``.
+
+    The schedules are cached across requests, keyed by a version token that
+    changes whenever a schedule of the event is saved or deleted, e.g. on
+    release. Requests that read the old schedules can thus only store them
+    under the old version.
+    """
+    from pretalx.schedule.models import Schedule
+
+    version = get_version(EVENT_SCHEDULES_VERSION_KEY.format(event_id=event.pk))
+    key = EVENT_SCHEDULES_KEY.format(event_id=event.pk, version=version)
+    fields = [field.attname for field in Schedule._meta.concrete_fields]
+    values = cache.get(key)
+    _count_lookup('schedules', values)
+    if values is None:
+        values = {
+            'wip': event.schedules.filter(version__isnull=True)
+            .values_list(*fields)
+            .first(),
+            'current': event.schedules.filter(published__isnull=False)
+            .order_by('-published')
+            .values_list(*fields)
+            .first(),
+        }
+        set_after_commit(key, values, EVENT_SCHEDULES_TIMEOUT)
+    schedules = {}
+    for name, schedule_values in values.items():
+        schedules[name] = None
+        if schedule_values:
+            schedules[name] = Schedule.from_db('default', fields, schedule_values)
+            schedules[name].event = event
+    return schedules
+
+
+def _forget_event_schedules(event_id: int):
+    bump_version(EVENT_SCHEDULES_VERSION_KEY.format(event_id=event_id))
+
+
+def _load_custom_domains():
+    if _custom_domains['expires'] > time.monotonic():
+        return _custom_domains
+    events = cache.get(CUSTOM_DOMAINS_KEY)
+    _count_lookup('custom_domains', events)
+    if events is None:
+        from pretalx.event.models.event import Event_SettingsStore
+
+        events = dict(
+            Event_SettingsStore.objects.filter(key='custom_domain')
+            .exclude(value='')
+            .values_list('object_id', 'value')
+        )
+        cache.set(CUSTOM_DOMAINS_KEY, events, CUSTOM_DOMAINS_TIMEOUT)
+    hosts = {}
+    for event_id, url in events.items():
+        # Events may share a domain, e.g. when it is copied to a new event
+        hosts.setdefault(split_domain_port(urlparse(url).netloc), set()).add(event_id)
+    _custom_domains.update(
+        expires=time.monotonic() + CUSTOM_DOMAINS_LOCAL_TIMEOUT,
+        events=events,
+        hosts=hosts,
+    )
+    return _custom_domains
+
+
+def get_custom_domain(event) -> str:
+    """
+    Returns the custom domain URL of an event, or an empty string.
+
+    The routing table of all custom domains is kept in the cache, and for a few
+    seconds in every process, so this is usually a plain dictionary lookup.
+    It is rebuilt whenever the ``custom_domain`` setting of any event changes.
+    """
+    if not event or not event.pk:
+        return ''
+    return _load_custom_domains()['events'].get(event.pk, '')
+
+
+def get_event_ids_for_host(domain: str, port: str) -> set:
+    """Returns the ids of all events using the given host as custom domain."""
+    return _load_custom_domains()['hosts'].get((domain, port), set())
+
+
+def _forget_custom_domains():
+    _custom_domains['expires'] = 0
+    cache.delete(CUSTOM_DOMAINS_KEY)
+    if connection.in_atomic_block:
+        transaction.on_commit(_forget_custom_domains)
+
+
+def _get_event_id(instance):
+    if hasattr(instance, 'event_id'):
+        return instance.event_id
+    if hasattr(instance, 'question_id'):
+        from pretalx.submission.models import Question
+
+        parent = Question.all_objects.filter(pk=instance.question_id)
+    elif hasattr(instance, 'schedule_id'):
+        from pretalx.schedule.models import Schedule
+
+        parent = Schedule.objects.filter(pk=instance.schedule_id)
+    else:
+        from pretalx.submission.models import Submission
+
+        parent = Submission.all_objects.filter(pk=instance.submission_id)
+    return parent.values_list('event_id', flat=True).first()
+
+
+@receiver(post_save, sender='submission.Submission')
+@receiver(post_delete, sender='submission.Submission')
+@receiver(post_save, sender='submission.SubmissionType')
+@receiver(post_delete, sender='submission.SubmissionType')
+@receiver(post_save, sender='submission.Answer')
+@receiver(post_delete, sender='submission.Answer')
+@receiver(post_save, sender='submission.Review')
+@receiver(post_delete, sender='submission.Review')
+@receiver(post_save, sender='schedule.TalkSlot')
+@receiver(post_delete, sender='schedule.TalkSlot')
+@receiver(post_save, sender='schedule.Schedule')
+@receiver(post_delete, sender='schedule.Schedule')
+@receiver(post_save, sender='schedule.Room')
+@receiver(post_delete, sender='schedule.Room')
+@receiver(post_save, sender='person.SpeakerProfile')
+@receiver(post_delete, sender='person.SpeakerProfile')
+def _bump_on_event_data_change(sender, instance, **kwargs):
+    bump_event_data_version(_get_event_id(instance))
+
+
+@receiver(post_save, sender='schedule.Schedule')
+@receiver(post_delete, sender='schedule.Schedule')
+def _forget_schedules_on_change(sender, instance, **kwargs):
+    _forget_event_schedules(instance.event_id)
+
+
+@receiver(post_save, sender='common.ActivityLog')
+def _forget_timeline_on_submission(sender, instance, created, **kwargs):
+    if created and instance.action_type == 'pretalx.submission.create':
+        key = SUBMISSION_TIMELINE_KEY.format(event_id=instance.event_id)
+        cache.delete(key)
+        if connection.in_atomic_block:
+            transaction.on_commit(lambda: cache.delete(key))
+
+
+@receiver(post_save, sender='event.Event')
+def _bump_on_event_change(sender, instance, **kwargs):
+    _forget_event_slug(instance.slug)
+    if kwargs.get('created'):
+        # Event ids can be re-used, e.g. after a rollback
+        _forget_custom_domains()
+    bump_event_data_version(instance.pk)
+
+
+@receiver(post_delete, sender='event.Event')
+def _forget_deleted_event(sender, instance, **kwargs):
+    _forget_event_slug(instance.slug)
+    _forget_custom_domains()
+
+
+@receiver(post_save, sender='event.Event_SettingsStore')
+@receiver(post_delete, sender='event.Event_SettingsStore')
+def _bump_on_event_settings_change(sender, instance, **kwargs):
+    if instance.key == 'custom_domain':
+        _forget_custom_domains()
+    bump_event_data_version(instance.object_id)
+
+
+@receiver(m2m_changed, sender='submission.Submission_speakers')
+def _bump_on_speaker_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith('post_'):
+        return
+    if not reverse:
+        bump_event_data_version(instance.event_id)
+        return
+    from pretalx.submission.models import Submission
+
+    submissions = Submission.all_objects.filter(pk__in=pk_set or [])
+    for event_id in submissions.values_list('event_id', flat=True).distinct():
+        bump_event_data_version(event_id)
+
+
+@receiver(post_save, sender='person.User')
+def _bump_on_user_change(sender, instance, created, update_fields, **kwargs):
+    if created or (update_fields and not PUBLIC_USER_FIELDS & set(update_fields)):
+        return
+    from pretalx.person.models import SpeakerProfile
+
+    for event_id in SpeakerProfile.objects.filter(user=instance).values_list(
+        'event_id', flat=True
+    ):
+        bump_event_data_version(event_id)
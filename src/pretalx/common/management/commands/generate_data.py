@@ -0,0 +1,64 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from pretalx.event.generate import generate_event
+from pretalx.event.models import Event, Organiser
+
+COUNTS = (
+    ('submissions', 1000),
+    ('speakers', 800),
+    ('reviewers', 20),
+    ('reviews', 5000),
+    ('questions', 4),
+    ('rooms', 8),
+    ('availabilities', 2),
+    ('schedules', 3),
+    ('mails', 2000),
+    ('days', 3),
+)
+
+
+class Command(BaseCommand):
+    help = 'Generates events with synthetic data for profiling and testing'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--slug',
+            type=str,
+            default='generated',
+            help='Slug of the generated event. Further events get a numeric suffix.',
+        )
+        parser.add_argument('--events', type=int, default=1)
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='The same seed always generates the same data.',
+        )
+        for name, default in COUNTS:
+            parser.add_argument(f'--{name}', type=int, default=default)
+
+    def handle(self, *args, **options):
+        slug = options['slug']
+        slugs = [slug]
+        slugs += [f'{slug}-{index}' for index in range(2, options['events'] + 1)]
+        existing = Event.objects.filter(slug__in=slugs).values_list('slug', flat=True)
+        if existing:
+            raise CommandError(f'Events already exist: {", ".join(existing)}')
+        organiser, _ = Organiser.objects.get_or_create(
+            slug='generated', defaults={'name': 'Generated events'}
+        )
+        counts = {name: options[name] for name, _ in COUNTS}
+
+        for index, event_slug in enumerate(slugs):
+            start = time.monotonic()
+            event = generate_event(
+                organiser, event_slug, seed=options['seed'] + index, **counts
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'Generated event "{event.slug}" in '
+                    f'{time.monotonic() - start:.1f} seconds.'
+                )
+            )
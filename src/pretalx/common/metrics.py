@@ -0,0 +1,267 @@
+"""
+Collects metrics about requests, database queries, caches and background tasks,
+and renders them in the Prometheus text format for the ``/metrics`` endpoint.
+
+Values are collected per request or task and stored in one go at its end. If
+redis is configured, all pretalx processes store their values in redis and the
+endpoint reports the sum of all of them. Otherwise, every process only reports
+its own values.
+"""
+import threading
+import time
+from collections import Counter as CounterDict
+
+from celery.signals import task_failure, task_postrun, task_prerun
+from django.conf import settings
+
+METRICS_KEY = 'pretalx_metrics'
+REGISTRY = []
+_local = threading.local()
+_values = CounterDict()
+_values_lock = threading.Lock()
+_task_starts = {}
+
+
+def _format_value(value) -> str:
+    value = float(value)
+    if value == float('inf'):
+        return '+Inf'
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _series(name: str, labels: dict) -> str:
+    if not labels:
+        return name
+    labels = ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return f'{name}{{{labels}}}'
+
+
+def _pending() -> CounterDict:
+    if not hasattr(_local, 'pending'):
+        _local.pending = CounterDict()
+    return _local.pending
+
+
+class Metric:
+    kind = None
+
+    def __init__(self, name: str, description: str, labelnames=()):
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        REGISTRY.append(self)
+
+    @property
+    def series_names(self) -> set:
+        return {self.name}
+
+    def _labels(self, labels: dict) -> dict:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f'{self.name} needs the labels {", ".join(self.labelnames)}.'
+            )
+        return {key: labels[key] for key in self.labelnames}
+
+    def _add(self, name: str, labels: dict, amount):
+        if settings.METRICS_ENABLED:
+            _pending()[_series(name, labels)] += amount
+
+    def collect(self, values: dict):
+        """Returns ``(series, value)`` tuples for the stored ``values``."""
+        return sorted(
+            (series, value)
+            for series, value in values.items()
+            if series.partition('{')[0] in self.series_names
+        )
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        self._add(self.name, self._labels(labels), amount)
+
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, description, labelnames=(), buckets=()):
+        super().__init__(name, description, labelnames)
+        self.buckets = tuple(buckets) + (float('inf'),)
+
+    @property
+    def series_names(self) -> set:
+        return {f'{self.name}_bucket', f'{self.name}_sum', f'{self.name}_count'}
+
+    def observe(self, value, **labels):
+        labels = self._labels(labels)
+        # Every bucket is stored, even if empty, so that all series are complete
+        for bucket in self.buckets:
+            self._add(
+                f'{self.name}_bucket',
+                {**labels, 'le': _format_value(bucket)},
+                int(value <= bucket),
+            )
+        self._add(f'{self.name}_sum', labels, value)
+        self._add(f'{self.name}_count', labels, 1)
+
+
+class Gauge(Metric):
+    """
+    A value that is computed when the metrics are requested, by calling
+    ``function``, which returns ``(labels, value)`` tuples.
+    """
+
+    kind = 'gauge'
+
+    def __init__(self, name, description, labelnames=(), function=None):
+        super().__init__(name, description, labelnames)
+        self.function = function
+
+    def collect(self, values: dict):
+        return [
+            (_series(self.name, self._labels(labels)), value)
+            for labels, value in self.function()
+        ]
+
+
+def flush():
+    """Stores all values collected in this thread."""
+    pending = _pending()
+    if not pending:
+        return
+    values = dict(pending)
+    pending.clear()
+    if settings.HAS_REDIS:
+        from django_redis import get_redis_connection
+
+        pipeline = get_redis_connection('redis').pipeline(transaction=False)
+        for series, amount in values.items():
+            pipeline.hincrbyfloat(METRICS_KEY, series, amount)
+        pipeline.execute()
+    else:
+        with _values_lock:
+            _values.update(values)
+
+
+def get_values() -> dict:
+    if settings.HAS_REDIS:
+        from django_redis import get_redis_connection
+
+        values = get_redis_connection('redis').hgetall(METRICS_KEY)
+        return {series.decode(): float(value) for series, value in values.items()}
+    with _values_lock:
+        return dict(_values)
+
+
+def render() -> str:
+    values = get_values()
+    lines = []
+    for metric in REGISTRY:
+        lines.append(f'# HELP {metric.name} {metric.description}')
+        lines.append(f'# TYPE {metric.name} {metric.kind}')
+        lines += [
+            f'{series} {_format_value(value)}'
+            for series, value in metric.collect(values)
+        ]
+    return '\n'.join(lines) + '\n'
+
+
+def _outbox_mails():
+    from django.db.models import Count
+    from pretalx.mail.models import QueuedMail
+
+    counts = (
+        QueuedMail.objects.filter(sent__isnull=True)
+        .order_by()
+        .values('event__slug')
+        .annotate(count=Count('id'))
+    )
+    return [({'event': row['event__slug']}, row['count']) for row in counts]
+
+
+def _active_sessions():
+    # Sessions that are only stored in a cache cannot be counted
+    if settings.SESSION_ENGINE not in (
+        'django.contrib.sessions.backends.db',
+        'django.contrib.sessions.backends.cached_db',
+    ):
+        return []
+    from django.contrib.sessions.models import Session
+    from django.utils.timezone import now
+
+    return [({}, Session.objects.filter(expire_date__gt=now()).count())]
+
+
+SECONDS_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+request_duration = Histogram(
+    'pretalx_request_duration_seconds',
+    'Time spent on answering requests, by URL name.',
+    ('view', 'method'),
+    buckets=SECONDS_BUCKETS,
+)
+request_count = Counter(
+    'pretalx_requests_total',
+    'Answered requests, by URL name and status code.',
+    ('view', 'method', 'status'),
+)
+request_queries = Histogram(
+    'pretalx_request_queries',
+    'Database queries per request, by URL name.',
+    ('view',),
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+request_query_duration = Histogram(
+    'pretalx_request_query_duration_seconds',
+    'Time spent on database queries per request, by URL name.',
+    ('view',),
+    buckets=SECONDS_BUCKETS,
+)
+cache_lookups = Counter(
+    'pretalx_cache_lookups_total',
+    'Lookups in the cache, by cached data and result (hit or miss).',
+    ('cache', 'result'),
+)
+task_duration = Histogram(
+    'pretalx_task_duration_seconds',
+    'Time spent on background tasks, by task name.',
+    ('task',),
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 300, 900),
+)
+task_failures = Counter(
+    'pretalx_task_failures_total', 'Failed background tasks, by task name.', ('task',)
+)
+outbox_mails = Gauge(
+    'pretalx_outbox_mails',
+    'Mails in the outbox that have not been sent, by event.',
+    ('event',),
+    function=_outbox_mails,
+)
+active_sessions = Gauge(
+    'pretalx_active_sessions',
+    'Sessions that have not expired yet.',
+    function=_active_sessions,
+)
+
+
+@task_prerun.connect
+def _start_task(task_id, **kwargs):
+    # The slow log shares the start time, and may have set it already
+    _task_starts.setdefault(task_id, time.monotonic())
+
+
+@task_failure.connect
+def _count_task_failure(sender, **kwargs):
+    task_failures.inc(task=sender.name)
+
+
+@task_postrun.connect
+def _finish_task(task_id, task, **kwargs):
+    start = _task_starts.pop(task_id, None)
+    if start is not None:
+        task_duration.observe(time.monotonic() - start, task=task.name)
+    flush()
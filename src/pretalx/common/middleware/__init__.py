@@ -1,9 +1,15 @@
 from .domains import CsrfViewMiddleware, MultiDomainMiddleware, SessionMiddleware
 from .event import EventPermissionMiddleware
+from .metrics import MetricsMiddleware
+from .profiling import ProfilingMiddleware
+from .slowlog import SlowLogMiddleware
 
 __all__ = [
     'CsrfViewMiddleware',
     'EventPermissionMiddleware',
+    'MetricsMiddleware',
     'MultiDomainMiddleware',
+    'ProfilingMiddleware',
     'SessionMiddleware',
+    'SlowLogMiddleware',
 ]
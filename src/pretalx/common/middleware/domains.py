@@ -1,5 +1,5 @@
 import time
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 
 from django.conf import settings
 from django.contrib.sessions.middleware import (
@@ -8,12 +8,12 @@ from django.contrib.sessions.middleware import (
 from django.core.exceptions import DisallowedHost
 from django.http.request import split_domain_port
 from django.middleware.csrf import CsrfViewMiddleware as BaseCsrfMiddleware
-from django.shortcuts import get_object_or_404, redirect
+from django.shortcuts import redirect
 from django.urls import resolve
 from django.utils.cache import patch_vary_headers
 from django.utils.http import cookie_date
 
-from pretalx.event.models import Event
+from pretalx.common.cache import get_event_by_slug, get_event_ids_for_host
 
 LOCAL_HOST_NAMES = ('testserver', 'localhost')
 
@@ -44,16 +44,16 @@ class MultiDomainMiddleware:
         request.port = int(port) if port else None
         request.uses_custom_domain = False
 
-        event_slug = resolve(request.path).kwargs.get('event')
+        # The URL and the event are resolved once, here, and re-used by all
+        # later middlewares and views.
+        request.resolver_match = resolve(request.path_info)
+        event_slug = request.resolver_match.kwargs.get('event')
         if event_slug:
-            event = get_object_or_404(Event, slug__iexact=event_slug)
+            event = get_event_by_slug(event_slug)
             request.event = event
-            if event.settings.custom_domain:
-                custom_domain = urlparse(event.settings.custom_domain)
-                event_domain, event_port = split_domain_port(custom_domain.netloc)
-                if event_domain == domain and event_port == port:
-                    request.uses_custom_domain = True
-                    return
+            if event.pk in get_event_ids_for_host(domain, port):
+                request.uses_custom_domain = True
+                return
 
         default_domain, default_port = split_domain_port(settings.SITE_NETLOC)
         if domain == default_domain:
@@ -79,20 +79,15 @@ class SessionMiddleware(BaseSessionMiddleware):
 
     We do this because we need to handle cookie domains differently depending on
     whether we are on the main domain or a custom domain.
+
+    Sessions are only created once something is stored in them, so that
+    anonymous visitors of public pages do not cause any session writes.
     """
 
     def __init__(self, get_response, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.get_response = get_response
 
-    def process_request(self, request):
-        super().process_request(request)
-
-        if not request.session.session_key:
-            # We need to create session even if we do not yet store something there, because we need the session
-            # key for e.g. saving the user's cart
-            request.session.create()
-
     def process_response(self, request, response):
         try:
             accessed = request.session.accessed
@@ -10,6 +10,7 @@ from django.utils.translation.trans_real import (
     get_supported_language_variant, language_code_re, parse_accept_lang_header,
 )
 
+from pretalx.common.cache import get_custom_domain, get_event_by_slug
 from pretalx.event.models import Event, Organiser, Team
 
 
@@ -52,7 +53,7 @@ class EventPermissionMiddleware:
         return None
 
     def __call__(self, request):
-        url = resolve(request.path_info)
+        url = request.resolver_match or resolve(request.path_info)
 
         organiser_slug = url.kwargs.get('organiser')
         if organiser_slug:
@@ -70,8 +71,8 @@ class EventPermissionMiddleware:
                     request.is_orga = request.user.is_administrator or has_perms
 
         event_slug = url.kwargs.get('event')
-        if event_slug:
-            request.event = get_object_or_404(Event, slug__iexact=event_slug)
+        if event_slug and not hasattr(request, 'event'):
+            request.event = get_event_by_slug(event_slug)
 
         self._set_orga_events(request)
         self._select_locale(request)
@@ -84,12 +85,12 @@ class EventPermissionMiddleware:
                 return redirect(url)
         elif (
             getattr(request, 'event', None)
-            and request.event.settings.custom_domain
+            and get_custom_domain(request.event)
             and not request.uses_custom_domain
             and not ('agenda' in url.namespaces and url.url_name == 'export')
         ):
             return redirect(
-                urljoin(request.event.settings.custom_domain, request.get_full_path())
+                urljoin(get_custom_domain(request.event), request.get_full_path())
             )
         return self.get_response(request)
 
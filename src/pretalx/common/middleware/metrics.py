@@ -0,0 +1,82 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connection
+
+from pretalx.common import metrics, slowlog
+
+_local = threading.local()
+
+
+class QueryTimer:
+    """
+    Counts and times database queries, as a database execute wrapper, and
+    reports slow queries to :mod:`pretalx.common.slowlog`.
+
+    Use :func:`time_queries` to install it: there is only one timer per thread,
+    and everything measuring queries compares its values before and after.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.monotonic()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.monotonic() - start
+            self.count += 1
+            self.duration += duration
+            slowlog.log_query(sql, duration)
+
+
+@contextmanager
+def time_queries():
+    """Yields the query timer of this thread, and installs it if necessary."""
+    timer = getattr(_local, 'query_timer', None)
+    if timer is not None:
+        yield timer
+        return
+    timer = _local.query_timer = QueryTimer()
+    try:
+        with connection.execute_wrapper(timer):
+            yield timer
+    finally:
+        _local.query_timer = None
+
+
+class MetricsMiddleware:
+    """
+    Records the duration and the database queries of every request by URL
+    name, if metrics are enabled.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.METRICS_ENABLED:
+            return self.get_response(request)
+
+        start = time.monotonic()
+        with time_queries() as queries:
+            query_count, query_duration = queries.count, queries.duration
+            response = self.get_response(request)
+        duration = time.monotonic() - start
+
+        match = getattr(request, 'resolver_match', None)
+        view = match.view_name if match else 'unresolved'
+        metrics.request_duration.observe(duration, view=view, method=request.method)
+        metrics.request_count.inc(
+            view=view, method=request.method, status=response.status_code
+        )
+        metrics.request_queries.observe(queries.count - query_count, view=view)
+        metrics.request_query_duration.observe(
+            queries.duration - query_duration, view=view
+        )
+        metrics.flush()
+        return response
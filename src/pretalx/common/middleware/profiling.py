@@ -0,0 +1,40 @@
+from django.http import HttpResponse
+
+from pretalx.common.profiling import RequestProfile
+
+
+class ProfilingMiddleware:
+    """
+    Profiles a request if an administrator asks for it with the ``_profile``
+    query parameter or the ``X-Pretalx-Profile`` header, and responds with the
+    profile instead of the page.
+
+    ``_profile=pstats`` downloads the profile for ``pstats`` or snakeviz, any
+    other value shows a summary of the slowest functions and queries.
+    """
+
+    parameter = '_profile'
+    header = 'HTTP_X_PRETALX_PROFILE'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        profile_format = request.GET.get(self.parameter) or request.META.get(
+            self.header
+        )
+        if not profile_format or not getattr(request.user, 'is_administrator', False):
+            return self.get_response(request)
+
+        profile = RequestProfile(self.get_response, request)
+        if profile_format == 'pstats':
+            response = HttpResponse(
+                profile.pstats_data(), content_type='application/octet-stream'
+            )
+            response['Content-Disposition'] = 'attachment; filename="pretalx.prof"'
+        else:
+            response = HttpResponse(
+                profile.summary(), content_type='text/plain; charset=utf-8'
+            )
+        response['Cache-Control'] = 'no-store'
+        return response
@@ -0,0 +1,31 @@
+import uuid
+
+from pretalx.common import slowlog
+
+
+class SlowLogMiddleware:
+    """
+    Logs requests and database queries that take longer than the configured
+    thresholds, see :mod:`pretalx.common.slowlog`.
+
+    Every request gets a request id to find its log entries by, taken from the
+    ``X-Request-ID`` header if a reverse proxy has set it.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not slowlog.is_enabled():
+            return self.get_response(request)
+
+        request.request_id = request.META.get('HTTP_X_REQUEST_ID') or uuid.uuid4().hex
+        tracked = slowlog.enter(request=request)
+        status = None
+        try:
+            response = self.get_response(request)
+            status = response.status_code
+        finally:
+            slowlog.leave(tracked, 'Slow request', status=status)
+        response['X-Request-ID'] = request.request_id
+        return response
@@ -0,0 +1,96 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+FTS_TABLE = 'common_searchentry_fts'
+SEARCH_FIELDS = ('code', 'title', 'abstract', 'description')
+
+
+def build_entries(apps, schema_editor):
+    SearchEntry = apps.get_model('common', 'SearchEntry')
+    Submission = apps.get_model('submission', 'Submission')
+    SpeakerProfile = apps.get_model('person', 'SpeakerProfile')
+    for submission in Submission.objects.all().prefetch_related('speakers'):
+        values = [getattr(submission, field) for field in SEARCH_FIELDS]
+        values += [user.name for user in submission.speakers.all()]
+        SearchEntry.objects.create(
+            event_id=submission.event_id,
+            submission=submission,
+            text=' '.join(str(value) for value in values if value),
+        )
+    for profile in SpeakerProfile.objects.all().select_related('user'):
+        SearchEntry.objects.create(
+            event_id=profile.event_id,
+            speaker=profile,
+            text=(profile.user.name or '') if profile.user else '',
+        )
+
+
+def create_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX common_searchentry_text_fts ON common_searchentry '
+            "USING gin (to_tsvector('simple'::regconfig, text))"
+        )
+    elif vendor == 'sqlite':
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute('PRAGMA compile_options')
+            if 'ENABLE_FTS5' not in {row[0] for row in cursor.fetchall()}:
+                return
+        schema_editor.execute(
+            f'CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5('
+            "text, content='common_searchentry', content_rowid='id')"
+        )
+        schema_editor.execute(
+            'CREATE TRIGGER common_searchentry_fts_insert AFTER INSERT ON '
+            f'common_searchentry BEGIN INSERT INTO {FTS_TABLE}(rowid, text) '
+            'VALUES (new.id, new.text); END'
+        )
+        schema_editor.execute(
+            'CREATE TRIGGER common_searchentry_fts_delete AFTER DELETE ON '
+            f'common_searchentry BEGIN INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, '
+            "text) VALUES ('delete', old.id, old.text); END"
+        )
+        schema_editor.execute(
+            'CREATE TRIGGER common_searchentry_fts_update AFTER UPDATE ON '
+            f'common_searchentry BEGIN INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, '
+            "text) VALUES ('delete', old.id, old.text); INSERT INTO "
+            f'{FTS_TABLE}(rowid, text) VALUES (new.id, new.text); END'
+        )
+
+
+def drop_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS common_searchentry_text_fts')
+    elif vendor == 'sqlite':
+        for action in ('insert', 'delete', 'update'):
+            schema_editor.execute(
+                f'DROP TRIGGER IF EXISTS common_searchentry_fts_{action}'
+            )
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event', '0017_auto_20180922_0511'),
+        ('person', '0020_auto_20180922_0511'),
+        ('submission', '0030_reviewaggregate'),
+        ('common', '0005_auto_20180202_1116'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('text', models.TextField(blank=True)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='event.Event')),
+                ('speaker', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='search_entry', to='person.SpeakerProfile')),
+                ('submission', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='search_entry', to='submission.Submission')),
+            ],
+        ),
+        migrations.RunPython(create_index, drop_index),
+        migrations.RunPython(build_entries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+from django.db import migrations, models
+
+# Django compares case-insensitively with UPPER(column::text) on PostgreSQL.
+# On MySQL, plain indexes suffice, and SQLite uses LIKE, which cannot use them.
+UPPER_INDEXES = (
+    ('event_event_slug_upper', 'event_event', 'UPPER(slug::text)'),
+    ('event_organiser_slug_upper', 'event_organiser', 'UPPER(slug::text)'),
+    ('person_user_code_upper', 'person_user', 'UPPER(code::text)'),
+    ('person_user_email_upper', 'person_user', 'UPPER(email::text)'),
+    ('schedule_schedule_version_upper', 'schedule_schedule', 'event_id, UPPER(version::text)'),
+    ('submission_submission_code_upper', 'submission_submission', 'UPPER(code::text)'),
+)
+
+
+def create_upper_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, expression in UPPER_INDEXES:
+        schema_editor.execute(f'CREATE INDEX {name} ON {table} ({expression})')
+
+
+def drop_upper_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _, _ in UPPER_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0006_searchentry'),
+        ('event', '0017_auto_20180922_0511'),
+        ('person', '0021_speakerprofile_is_published'),
+        ('schedule', '0012_talkslot_visible'),
+        ('submission', '0032_answer_review_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['event', 'timestamp'], name='activitylog_event_timestamp'),
+        ),
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['content_type', 'object_id'], name='activitylog_object'),
+        ),
+        migrations.RunPython(create_upper_indexes, drop_upper_indexes),
+    ]
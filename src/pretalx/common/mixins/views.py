@@ -1,16 +1,19 @@
+import hashlib
 import urllib
 from contextlib import suppress
 from importlib import import_module
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist
-from django.db.models import CharField, Q
+from django.db.models import CharField, F, Q
 from django.db.models.functions import Lower
 from django.http import Http404
 from django.utils.functional import cached_property
 from i18nfield.forms import I18nModelForm
 from rules.contrib.views import PermissionRequiredMixin
 
+from pretalx.common.cache import get_event_data_version
 from pretalx.common.forms import SearchForm
 
 SessionStore = import_module(settings.SESSION_ENGINE).SessionStore
@@ -95,6 +98,11 @@ class Filterable:
 
     filter_fields = []
     default_filters = []
+    # Searches the full-text index of 'submission' or 'speaker' objects, to
+    # which the queryset refers via `search_index_field`, in addition to the
+    # `default_filters`.
+    search_index = None
+    search_index_field = 'pk'
 
     def filter_queryset(self, qs):
         if self.filter_fields:
@@ -113,13 +121,32 @@ class Filterable:
             if value:
                 lookup_key = key.split('__')[0]
                 print(value)
-                if lookup_key in self.filter_fields:
+                # Lookups on related objects have to be listed in full
+                if key in self.filter_fields or lookup_key in self.filter_fields:
                     qs = qs.filter(**{key: value})
         return qs
 
     def _handle_search(self, qs):
+        from pretalx.common.search import search_filter, search_rank
+
         query = urllib.parse.unquote(self.request.GET['q'])
         _filters = [Q(**{field: query}) for field in self.default_filters]
+        if self.search_index:
+            _filters.append(
+                search_filter(
+                    query,
+                    self.request.event,
+                    kind=self.search_index,
+                    field=self.search_index_field,
+                )
+            )
+            rank = search_rank(
+                query, kind=self.search_index, field=self.search_index_field
+            )
+            if rank is not None:
+                qs = qs.annotate(search_rank=rank).order_by(
+                    F('search_rank').desc(nulls_last=True)
+                )
         if len(_filters) > 1:
             _filter = _filters[0]
             for additional_filter in _filters[1:]:
@@ -170,3 +197,60 @@ class PermissionRequired(PermissionRequiredMixin):
     def get_login_url(self):
         """We do this to avoid leaking data about existing pages."""
         raise Http404()
+
+
+class PageCacheMixin:
+    """
+    Caches fully rendered pages for anonymous visitors without a session, if
+    enabled via ``PAGE_CACHE_TIMEOUT``.
+
+    Pages are keyed by the event data version (so that they are discarded on
+    any change to the schedule, talks or speakers), the language and timezone
+    selected for the request, and the requested URL.
+    """
+
+    def get_page_cache_key(self):
+        request = self.request
+        schedule = request.event.current_schedule
+        identifier = ':'.join(
+            [
+                get_event_data_version(request.event),
+                str(schedule.pk if schedule else None),
+                request.LANGUAGE_CODE,
+                getattr(request, 'timezone', ''),
+                request.get_host(),
+                request.get_full_path(),
+            ]
+        )
+        digest = hashlib.sha1(identifier.encode()).hexdigest()
+        return f'pretalx_page_{request.event.pk}_{digest}'
+
+    def dispatch(self, request, *args, **kwargs):
+        timeout = settings.PAGE_CACHE_TIMEOUT
+        if (
+            not timeout
+            or request.method not in ('GET', 'HEAD')
+            or request.user.is_authenticated
+            or settings.SESSION_COOKIE_NAME in request.COOKIES
+        ):
+            return super().dispatch(request, *args, **kwargs)
+
+        key = self.get_page_cache_key()
+        response = cache.get(key)
+        if response is not None:
+            return response
+
+        def store(response):
+            if (
+                response.status_code == 200
+                and not response.cookies
+                and not request.META.get('CSRF_COOKIE_USED')
+            ):
+                cache.set(key, response, timeout)
+
+        response = super().dispatch(request, *args, **kwargs)
+        if hasattr(response, 'add_post_render_callback'):
+            response.add_post_render_callback(store)
+        else:
+            store(response)
+        return response
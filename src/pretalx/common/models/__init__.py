@@ -1,7 +1,9 @@
 from .log import ActivityLog
+from .search import SearchEntry
 from .settings import GlobalSettings
 
 __all__ = [
     'ActivityLog',
-    'GlobalSettings'
+    'GlobalSettings',
+    'SearchEntry',
 ]
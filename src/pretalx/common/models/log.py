@@ -112,6 +112,14 @@ class ActivityLog(models.Model):
 
     class Meta:
         ordering = ('-timestamp',)
+        indexes = [
+            models.Index(
+                fields=['event', 'timestamp'], name='activitylog_event_timestamp'
+            ),
+            models.Index(
+                fields=['content_type', 'object_id'], name='activitylog_object'
+            ),
+        ]
 
     def __str__(self):
         """Custom __str__ to help with debugging."""
@@ -0,0 +1,34 @@
+from django.db import models
+
+
+class SearchEntry(models.Model):
+    """
+    Holds the searchable text of a submission or of a speaker profile.
+
+    The text is indexed by the database's full-text search where possible, see
+    :mod:`pretalx.common.search`.
+    """
+
+    event = models.ForeignKey(
+        to='event.Event', related_name='+', on_delete=models.CASCADE
+    )
+    submission = models.OneToOneField(
+        to='submission.Submission',
+        related_name='search_entry',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+    )
+    speaker = models.OneToOneField(
+        to='person.SpeakerProfile',
+        related_name='search_entry',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+    )
+    text = models.TextField(blank=True)
+
+    def __str__(self):
+        return (
+            f'SearchEntry(submission={self.submission_id}, speaker={self.speaker_id})'
+        )
@@ -1,12 +1,131 @@
 import json
 import uuid
+from collections import Counter
 from datetime import datetime
+from decimal import Decimal
 
+from django.core.cache import cache
+from django.utils.functional import cached_property
 from django.utils.translation import ugettext_noop
 from hierarkey.models import GlobalSettingsBase, Hierarkey
+from hierarkey.proxy import HierarkeyProxy
 from i18nfield.strings import LazyI18nString
 
-hierarkey = Hierarkey(attribute_name='settings')
+from pretalx.common import metrics
+from pretalx.common.cache import bump_version, get_version
+
+SETTINGS_CACHE_TIMEOUT = 30 * 60
+MEMOIZED_TYPES = (str, int, float, bool, Decimal, LazyI18nString, type(None))
+settings_cache_stats = Counter()
+
+
+class SettingsProxy(HierarkeyProxy):
+    """
+    A hierarkey proxy that loads all settings of an object and of its parent
+    with a single cache round trip.
+
+    Cached settings are tagged with a version token, which is replaced on every
+    change, so that a concurrent cache refill can never store outdated
+    settings. Unserialized values are memoized for the lifetime of the proxy,
+    which is the lifetime of the object it is attached to.
+    """
+
+    @classmethod
+    def _from_proxy(cls, proxy):
+        new = cls.__new__(cls)
+        new.__dict__.update(proxy.__dict__)
+        new._values = {}
+        return new
+
+    @property
+    def _cache_key(self):
+        return f'settings_{self._cache_namespace}_{self._obj.pk}'
+
+    @property
+    def _version_key(self):
+        return f'{self._cache_key}_version'
+
+    @property
+    def _parent_proxy(self):
+        if self._parent:
+            return getattr(self._parent, self._h.attribute_name)
+
+    def _cache(self):
+        if self._cached_obj is None:
+            proxies = [self]
+            parent = self._parent_proxy
+            if isinstance(parent, SettingsProxy) and parent._cached_obj is None:
+                proxies.append(parent)
+            stored = cache.get_many(
+                [key for p in proxies for key in (p._version_key, p._cache_key)]
+            )
+            for proxy in proxies:
+                proxy._cached_obj = proxy._load(stored)
+        return self._cached_obj
+
+    def _load(self, stored):
+        version = get_version(self._version_key, stored)
+        cached = stored.get(self._cache_key)
+        if cached and cached[0] == version:
+            settings_cache_stats['hits'] += 1
+            metrics.cache_lookups.inc(cache='settings', result='hit')
+            return cached[1]
+        settings_cache_stats['misses'] += 1
+        metrics.cache_lookups.inc(cache='settings', result='miss')
+        values = {s.key: s.value for s in self._objects.all()}
+        cache.set(self._cache_key, (version, values), SETTINGS_CACHE_TIMEOUT)
+        return values
+
+    def _flush_external_cache(self):
+        self._values = {}
+        bump_version(self._version_key)
+
+    def get(self, key, default=None, as_type=None, binary_file=False):
+        if default is not None or binary_file:
+            return super().get(key, default=default, as_type=as_type, binary_file=binary_file)
+        if (key, as_type) in self._values:
+            settings_cache_stats['memo_hits'] += 1
+            return self._values[key, as_type]
+        value = super().get(key, as_type=as_type)
+        if isinstance(value, MEMOIZED_TYPES):
+            self._values[key, as_type] = value
+        return value
+
+
+class SettingsHierarkey(Hierarkey):
+    """
+    Attaches a :class:`SettingsProxy` instead of a plain hierarkey proxy, and
+    caches it on the object under the attribute name.
+    """
+
+    def _use_settings_proxy(self, wrapper):
+        def wrapped(cls):
+            cls = wrapper(cls)
+            attribute = getattr(cls, self.attribute_name)
+            # Older hierarkey versions use a cached_property, newer ones a property
+            create_proxy = getattr(attribute, 'func', None) or attribute.fget
+            if getattr(create_proxy, 'uses_settings_proxy', False):
+                return cls
+
+            def prop(instance):
+                return SettingsProxy._from_proxy(create_proxy(instance))
+
+            prop.uses_settings_proxy = True
+            setattr(
+                cls, self.attribute_name, cached_property(prop, self.attribute_name)
+            )
+            return cls
+
+        return wrapped
+
+    def add(self, *args, **kwargs):
+        return self._use_settings_proxy(super().add(*args, **kwargs))
+
+    def set_global(self, *args, **kwargs):
+        return self._use_settings_proxy(super().set_global(*args, **kwargs))
+
+
+hierarkey = SettingsHierarkey(attribute_name='settings')
 
 
 @hierarkey.set_global()
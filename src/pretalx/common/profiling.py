@@ -0,0 +1,97 @@
+"""
+Profiles single requests on demand, for administrators debugging slow pages on
+a live system. See :class:`pretalx.common.middleware.ProfilingMiddleware`.
+"""
+import cProfile
+import io
+import marshal
+import pstats
+import re
+import time
+from collections import Counter
+
+from django.db import connection
+
+
+def query_fingerprint(sql: str) -> str:
+    """
+    Replaces all literals in ``sql``, so that queries only differing in their
+    parameters – the typical N+1 pattern – share a fingerprint.
+    """
+    sql = re.sub(r"'(?:[^']|'')*'", '?', sql)
+    sql = re.sub(r'\b\d+(?:\.\d+)?\b', '?', sql)
+    return re.sub(r'\(\?(?:, \?)*\)', '(?)', sql)
+
+
+def duplicate_queries(queries):
+    """Returns ``(count, fingerprint)`` for all queries that ran more than once."""
+    counter = Counter(query_fingerprint(query['sql']) for query in queries)
+    return [(count, sql) for sql, count in counter.most_common() if count > 1]
+
+
+class QueryRecorder:
+    """Records all database queries with their duration, as an execute wrapper."""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append(
+                {'sql': sql, 'params': params, 'time': time.perf_counter() - start}
+            )
+
+
+class RequestProfile:
+    """
+    Runs ``get_response`` for ``request`` under :mod:`cProfile` and records
+    its database queries.
+    """
+
+    def __init__(self, get_response, request):
+        self.request = request
+        self.queries = QueryRecorder()
+        self.profiler = cProfile.Profile()
+        start = time.perf_counter()
+        with connection.execute_wrapper(self.queries):
+            self.profiler.enable()
+            try:
+                self.response = get_response(request)
+            finally:
+                self.profiler.disable()
+        self.duration = time.perf_counter() - start
+
+    def pstats_data(self) -> bytes:
+        """Returns the profile in the format of ``pstats`` and e.g. snakeviz."""
+        self.profiler.create_stats()
+        return marshal.dumps(self.profiler.stats)
+
+    def summary(self, functions=40, queries=10) -> str:
+        queries_list = self.queries.queries
+        query_time = sum(query['time'] for query in queries_list)
+        lines = [
+            f'{self.request.method} {self.request.get_full_path()}',
+            f'Response status: {self.response.status_code}',
+            f'Total time: {self.duration * 1000:.1f} ms',
+            f'Queries: {len(queries_list)} in {query_time * 1000:.1f} ms',
+            '',
+        ]
+        duplicates = duplicate_queries(queries_list)
+        if duplicates:
+            lines.append('Repeated queries:')
+            lines += [f'{count:>5} × {sql}' for count, sql in duplicates]
+            lines.append('')
+        lines.append('Slowest queries:')
+        lines += [
+            f'{query["time"] * 1000:>8.1f} ms  {query["sql"]}  {query["params"]!r}'
+            for query in sorted(queries_list, key=lambda q: -q['time'])[:queries]
+        ]
+        lines.append('')
+        stream = io.StringIO()
+        stats = pstats.Stats(self.profiler, stream=stream)
+        stats.sort_stats('cumulative').print_stats(functions)
+        lines.append(stream.getvalue())
+        return '\n'.join(lines)
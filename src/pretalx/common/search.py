@@ -0,0 +1,210 @@
+"""
+A full-text index of submissions and speakers.
+
+Every submission and speaker profile has a :class:`SearchEntry` holding its
+searchable text, which is kept up to date when the submission, its speakers or
+the speaker profile are saved. On PostgreSQL, the text is indexed with a GIN
+index on its ``tsvector``, on SQLite with an FTS5 table. Other databases, and
+SQLite builds without FTS5, fall back to a ``LIKE`` query on the entries, which
+still avoids joining submissions, speakers and users for every search.
+
+All words of a search query have to match, as words or word prefixes.
+"""
+import re
+
+from django.db import connection, models
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
+
+from pretalx.common.models import SearchEntry
+
+FTS_TABLE = 'common_searchentry_fts'
+SEARCH_FIELDS = ('code', 'title', 'abstract', 'description')
+_fts_databases = set()
+
+
+def get_search_terms(query: str) -> list:
+    return re.findall(r'\w+', query.lower())
+
+
+def build_submission_text(submission, speaker_names) -> str:
+    """Joins the searchable fields of ``submission`` and its speakers' names."""
+    fields = [getattr(submission, field) for field in SEARCH_FIELDS]
+    return ' '.join(str(value) for value in fields + list(speaker_names) if value)
+
+
+def get_submission_text(submission) -> str:
+    return build_submission_text(
+        submission, [user.name for user in submission.speakers.all()]
+    )
+
+
+def get_speaker_text(profile) -> str:
+    return (profile.user.name or '') if profile.user else ''
+
+
+def index_submission(submission):
+    SearchEntry.objects.update_or_create(
+        submission=submission,
+        defaults={
+            'event_id': submission.event_id,
+            'text': get_submission_text(submission),
+        },
+    )
+
+
+def index_speaker(profile):
+    SearchEntry.objects.update_or_create(
+        speaker=profile,
+        defaults={'event_id': profile.event_id, 'text': get_speaker_text(profile)},
+    )
+
+
+def get_search_backend():
+    if connection.vendor == 'postgresql':
+        return 'postgresql'
+    if connection.vendor == 'sqlite':
+        name = connection.settings_dict['NAME']
+        if name not in _fts_databases:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT 1 FROM sqlite_master WHERE type = %s AND name = %s',
+                    ['table', FTS_TABLE],
+                )
+                if not cursor.fetchone():
+                    return None
+            _fts_databases.add(name)
+        return 'sqlite'
+    return None
+
+
+def _get_match_query(terms, backend):
+    if backend == 'postgresql':
+        return ' & '.join(f'{term}:*' for term in terms)
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+class SearchRank(models.Func):
+    """Ranks a search entry against a full-text query, higher is better."""
+
+    output_field = models.FloatField()
+
+    def __init__(self, match_query):
+        super().__init__(models.F('text'), models.F('id'), models.Value(match_query))
+
+    def _compile_sources(self, compiler):
+        sql, params = [], []
+        for expression in self.source_expressions:
+            expression_sql, expression_params = compiler.compile(expression)
+            sql.append(expression_sql)
+            params.extend(expression_params)
+        return sql, params
+
+    def as_postgresql(self, compiler, connection):
+        (text, _, query), params = self._compile_sources(compiler)
+        sql = (
+            f"ts_rank(to_tsvector('simple'::regconfig, {text}), "
+            f"to_tsquery('simple'::regconfig, {query}))"
+        )
+        return sql, params
+
+    def as_sqlite(self, compiler, connection):
+        (_, entry_id, query), params = self._compile_sources(compiler)
+        sql = (
+            f'(SELECT -bm25({FTS_TABLE}) FROM {FTS_TABLE} '
+            f'WHERE {FTS_TABLE} MATCH {query} AND rowid = {entry_id})'
+        )
+        return sql, params
+
+    def as_sql(self, compiler, connection):
+        return '0', []
+
+
+def search_filter(query, event, kind='submission', field='pk'):
+    """
+    Returns a ``Q`` object matching the objects whose ``field`` points to a
+    ``kind`` (``submission`` or ``speaker``) matching the query.
+    """
+    terms = get_search_terms(query)
+    if not terms:
+        return models.Q()
+    backend = get_search_backend()
+    entries = SearchEntry.objects.filter(event=event)
+    # RawSQL cannot be used with __in, as it would be parenthesized twice and
+    # compared as a single value. Columns are not qualified, as the table gets
+    # an alias when the entries are used in a subquery.
+    if backend == 'postgresql':
+        entries = entries.extra(
+            where=[
+                "to_tsvector('simple'::regconfig, text) @@ "
+                "to_tsquery('simple'::regconfig, %s)"
+            ],
+            params=[_get_match_query(terms, backend)],
+        )
+    elif backend == 'sqlite':
+        entries = entries.extra(
+            where=[f'id IN (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s)'],
+            params=[_get_match_query(terms, backend)],
+        )
+    else:
+        for term in terms:
+            entries = entries.filter(text__icontains=term)
+    entries = entries.values(kind)
+    return models.Q(**{f'{field}__in': entries})
+
+
+def search_rank(query, kind='submission', field='pk'):
+    """
+    Returns an expression ranking the objects found by :func:`search_filter`,
+    or ``None`` if the database does not support ranking.
+    """
+    terms = get_search_terms(query)
+    backend = get_search_backend()
+    if not terms or not backend:
+        return None
+    entries = SearchEntry.objects.filter(**{kind: models.OuterRef(field)}).annotate(
+        rank=SearchRank(_get_match_query(terms, backend))
+    )
+    return models.Subquery(
+        entries.values('rank')[:1], output_field=models.FloatField()
+    )
+
+
+@receiver(post_save, sender='submission.Submission')
+def _index_submission_on_save(sender, instance, update_fields, raw, **kwargs):
+    if raw or (update_fields and not set(SEARCH_FIELDS) & set(update_fields)):
+        return
+    index_submission(instance)
+
+
+@receiver(m2m_changed, sender='submission.Submission_speakers')
+def _index_submission_on_speaker_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if not action.startswith('post_'):
+        return
+    if not reverse:
+        index_submission(instance)
+        return
+    from pretalx.submission.models import Submission
+
+    for submission in Submission.all_objects.filter(pk__in=pk_set or []):
+        index_submission(submission)
+
+
+@receiver(post_save, sender='person.SpeakerProfile')
+def _index_speaker_on_save(sender, instance, raw, **kwargs):
+    if not raw:
+        index_speaker(instance)
+
+
+@receiver(post_save, sender='person.User')
+def _index_user_on_save(sender, instance, created, update_fields, raw, **kwargs):
+    if raw or created or (update_fields and 'name' not in update_fields):
+        return
+    from pretalx.submission.models import Submission
+
+    for profile in instance.profiles.all():
+        index_speaker(profile)
+    for submission in Submission.all_objects.filter(speakers=instance):
+        index_submission(submission)
@@ -38,6 +38,10 @@ CONFIG = {
             'default': '',
             'env': os.getenv('PRETALX_COOKIE_DOMAIN'),
         },
+        'page_cache': {
+            'default': '0',
+            'env': os.getenv('PRETALX_PAGE_CACHE'),
+        },
     },
     'database': {
         'backend': {
@@ -114,6 +118,12 @@ CONFIG = {
             'env': os.getenv('PRETALX_CELERY_BACKEND'),
         },
     },
+    'metrics': {
+        'token': {
+            'default': '',
+            'env': os.getenv('PRETALX_METRICS_TOKEN'),
+        },
+    },
     'logging': {
         'email': {
             'default': '',
@@ -123,6 +133,14 @@ CONFIG = {
             'default': '',
             'env': os.getenv('PRETALX_LOGGING_EMAIL_LEVEL'),
         },
+        'slow_requests': {
+            'default': '0',
+            'env': os.getenv('PRETALX_LOGGING_SLOW_REQUESTS'),
+        },
+        'slow_queries': {
+            'default': '0',
+            'env': os.getenv('PRETALX_LOGGING_SLOW_QUERIES'),
+        },
     },
 }
 
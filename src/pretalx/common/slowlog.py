@@ -0,0 +1,160 @@
+"""
+Logs requests, background tasks and database queries that take longer than the
+configured thresholds to the ``pretalx.slow`` logger, as JSON lines that show
+where they ran: the request id, event, URL name and user role of a request, or
+the name and id of a background task.
+
+Requests and tasks are tracked on a per-thread stack, as tasks run within the
+request that started them if there is no Celery broker. Their queries are
+counted by the query timer of the metrics middleware, and tasks share their
+start time with the task metrics.
+"""
+import datetime as dt
+import json
+import logging
+import threading
+import time
+from contextlib import ExitStack
+
+from celery.signals import task_postrun, task_prerun
+from django.conf import settings
+
+from pretalx.common import metrics
+
+logger = logging.getLogger('pretalx.slow')
+_local = threading.local()
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats log records as single line JSON objects, including their context."""
+
+    def format(self, record):
+        data = {
+            'time': dt.datetime.fromtimestamp(record.created, dt.timezone.utc)
+            .isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        data.update(getattr(record, 'context', {}))
+        if record.exc_info:
+            data['exception'] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str)
+
+
+class Tracked:
+    """A request or task that is currently running, and its queries so far."""
+
+    def __init__(self, request=None, context=None, start=None):
+        # Imported here, as the metrics middleware imports this module
+        from pretalx.common.middleware.metrics import time_queries
+
+        self.request = request
+        self.context = context or {}
+        self.start = time.monotonic() if start is None else start
+        self._exit_stack = ExitStack()
+        self.queries = self._exit_stack.enter_context(time_queries())
+        self.query_count = self.queries.count
+        self.query_duration = self.queries.duration
+
+    def get_queries(self) -> dict:
+        return {
+            'queries': self.queries.count - self.query_count,
+            'query_duration': round(self.queries.duration - self.query_duration, 3),
+        }
+
+    def close(self):
+        self._exit_stack.close()
+
+    def get_context(self) -> dict:
+        if self.request is None:
+            return dict(self.context)
+        request = self.request
+        match = getattr(request, 'resolver_match', None)
+        event = getattr(request, 'event', None)
+        return {
+            'request_id': request.request_id,
+            'method': request.method,
+            'path': request.path,
+            'url_name': match.view_name if match else None,
+            'event': event.slug if event else None,
+            'role': _user_role(request),
+        }
+
+
+def _user_role(request):
+    # Only use what EventPermissionMiddleware found out, as looking up the
+    # user or their permissions here would run more queries
+    if not hasattr(request, 'is_orga'):
+        return None
+    if request.is_orga:
+        return 'orga'
+    if request.is_reviewer:
+        return 'reviewer'
+    return 'anonymous' if request.user.is_anonymous else 'user'
+
+
+def _stack() -> list:
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+
+def is_enabled() -> bool:
+    return bool(settings.SLOW_REQUEST_SECONDS or settings.SLOW_QUERY_SECONDS)
+
+
+def log(message: str, duration: float, **context):
+    stack = _stack()
+    context = {
+        **(stack[-1].get_context() if stack else {}),
+        'duration': round(duration, 3),
+        **context,
+    }
+    logger.warning(message, extra={'context': context})
+
+
+def log_query(sql: str, duration: float):
+    """Logs a query if it was slow, called by the metrics query timer."""
+    threshold = settings.SLOW_QUERY_SECONDS
+    if threshold and duration >= threshold:
+        # Parameters may contain personal data, so only the SQL is logged
+        log('Slow query', duration, sql=sql)
+
+
+def enter(request=None, context=None, start=None) -> Tracked:
+    """Starts tracking a request or task in this thread."""
+    tracked = Tracked(request=request, context=context, start=start)
+    _stack().append(tracked)
+    return tracked
+
+
+def leave(tracked: Tracked, message: str, **context):
+    """Stops tracking a request or task, and logs it if it was slow."""
+    duration = time.monotonic() - tracked.start
+    threshold = settings.SLOW_REQUEST_SECONDS
+    if threshold and duration >= threshold:
+        log(message, duration, **tracked.get_queries(), **context)
+    tracked.close()
+    _stack().remove(tracked)
+
+
+@task_prerun.connect
+def _start_task(task_id, task, **kwargs):
+    if not is_enabled():
+        return
+    context = {'task': task.name, 'task_id': task_id}
+    stack = _stack()
+    if stack:
+        # Tasks run directly without a Celery broker, within their request
+        context['request_id'] = stack[-1].get_context().get('request_id')
+    start = metrics._task_starts.setdefault(task_id, time.monotonic())
+    enter(context=context, start=start)
+
+
+@task_postrun.connect
+def _finish_task(task_id, state=None, **kwargs):
+    for tracked in reversed(_stack()):
+        if tracked.context.get('task_id') == task_id:
+            leave(tracked, 'Slow task', state=state)
+            return
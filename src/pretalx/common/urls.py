@@ -4,13 +4,13 @@ from django.conf import settings
 from django.urls import reverse
 from urlman import Urls
 
+from pretalx.common.cache import get_custom_domain
+
 
 def get_base_url(event=None, url=None):
     if url and url.startswith('/orga'):
         return settings.SITE_URL
-    if event and event.settings.custom_domain:
-        return event.settings.custom_domain
-    return settings.SITE_URL
+    return get_custom_domain(event) or settings.SITE_URL
 
 
 def build_absolute_uri(urlname, event=None, args=None, kwargs=None):
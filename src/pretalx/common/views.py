@@ -2,10 +2,13 @@ import os.path
 from contextlib import suppress
 
 from django.conf import settings
-from django.http import FileResponse, Http404
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils.crypto import constant_time_compare
 from django.views.generic.detail import SingleObjectTemplateResponseMixin
 from django.views.generic.edit import ModelFormMixin, ProcessFormView
 
+from pretalx.common import metrics
+
 
 class CreateOrUpdateView(
     SingleObjectTemplateResponseMixin, ModelFormMixin, ProcessFormView
@@ -36,3 +39,18 @@ def get_static(request, path, content_type):
     if not os.path.exists(path):
         raise Http404()
     return FileResponse(open(path, 'rb'), content_type=content_type)
+
+
+def serve_metrics(request):
+    """
+    Serves the metrics in the Prometheus text format. Requests need to send the
+    configured token as ``Authorization: Bearer <token>`` header.
+    """
+    if not settings.METRICS_ENABLED:
+        raise Http404()
+    expected = f'Bearer {settings.METRICS_TOKEN}'
+    if not constant_time_compare(request.META.get('HTTP_AUTHORIZATION', ''), expected):
+        response = HttpResponse('Unauthorized', status=401, content_type='text/plain')
+        response['WWW-Authenticate'] = 'Bearer'
+        return response
+    return HttpResponse(metrics.render(), content_type='text/plain; version=0.0.4')
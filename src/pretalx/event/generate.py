@@ -0,0 +1,404 @@
+"""
+Generates events filled with synthetic data.
+
+This is meant to load realistic amounts of data for profiling without using
+real event data. The same seed always generates the same data. All rows are
+created with bulk inserts, so signals and ``save`` methods are skipped – data
+usually derived in signal handlers, like review counts, review aggregates and
+search entries, is created directly instead.
+"""
+import datetime
+import random
+
+import pytz
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils.timezone import now
+
+WORDS = (
+    'open source data privacy network community security hardware design '
+    'future python web science music art energy climate city freedom learning '
+    'robot language history space game health food radio mesh kernel crypto '
+    'map sensor archive library garden bicycle'
+).split()
+FIRST_NAMES = (
+    'Ada Alex Charlie Dana Eli Frankie Grace Jamie Jo Kim Lou Mika Noa Quinn '
+    'Robin Sam Toni Yuki'
+).split()
+LAST_NAMES = (
+    'Haddad Hopper Kowalski Larsen Lovelace Meyer Nguyen Novak Okafor Rossi '
+    'Schmidt Silva Tanaka Turing'
+).split()
+STATE_WEIGHTS = {
+    'submitted': 30,
+    'accepted': 10,
+    'confirmed': 40,
+    'rejected': 15,
+    'canceled': 3,
+    'withdrawn': 2,
+}
+DAY_START = datetime.time(9, 0)
+DAY_END = datetime.time(19, 0)
+SLOT_LENGTH = datetime.timedelta(hours=1)
+
+
+def _text(rng, words):
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def _codes(rng, count, model):
+    """Returns ``count`` random codes that are not yet used by ``model``."""
+    codes = set()
+    while len(codes) < count:
+        batch = {
+            ''.join(rng.choice(model.CODE_CHARSET) for _ in range(6))
+            for _ in range(count - len(codes))
+        }
+        batch -= set(
+            model.objects.filter(code__in=batch).values_list('code', flat=True)
+        )
+        codes |= batch
+    return sorted(codes)
+
+
+def _bulk_create(model, objects, queryset):
+    """
+    Creates ``objects`` and returns them as fetched from ``queryset``, as
+    ``bulk_create`` does not set primary keys on all databases.
+    """
+    model.objects.bulk_create(objects)
+    return list(queryset.order_by('pk'))
+
+
+def _day_range(event):
+    tz = pytz.timezone(event.timezone)
+    day = event.date_from
+    while day <= event.date_to:
+        yield (
+            tz.localize(datetime.datetime.combine(day, DAY_START)),
+            tz.localize(datetime.datetime.combine(day, DAY_END)),
+        )
+        day += datetime.timedelta(days=1)
+
+
+def _slot_times(event, rooms):
+    """Yields ``(room, start)`` tuples filling all rooms on all event days."""
+    for start, end in _day_range(event):
+        while start < end:
+            for room in rooms:
+                yield room, start
+            start += SLOT_LENGTH
+
+
+def _create_users(rng, event, prefix, count, password):
+    from pretalx.person.models import User
+
+    codes = _codes(rng, count, User)
+    domain = f'{event.slug}.example.org'
+    return _bulk_create(
+        User,
+        [
+            User(
+                code=code,
+                name=f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+                email=f'{prefix}{index}@{domain}',
+                password=password,
+            )
+            for index, code in enumerate(codes)
+        ],
+        User.objects.filter(email__startswith=prefix, email__endswith=f'@{domain}'),
+    )
+
+
+def _create_submissions(rng, event, count, review_counts):
+    from pretalx.submission.models import Submission
+
+    states = list(STATE_WEIGHTS)
+    weights = list(STATE_WEIGHTS.values())
+    return _bulk_create(
+        Submission,
+        [
+            Submission(
+                event=event,
+                code=code,
+                title=_text(rng, rng.randint(3, 8)),
+                submission_type=event.cfp.default_type,
+                state=rng.choices(states, weights)[0],
+                abstract=_text(rng, 40),
+                description=_text(rng, 120),
+                duration=rng.choice((30, 45, 60)),
+                content_locale='en',
+                review_count=review_counts[index],
+            )
+            for index, code in enumerate(_codes(rng, count, Submission))
+        ],
+        Submission.all_objects.filter(event=event),
+    )
+
+
+def _create_reviews(rng, submissions, reviewers, review_pairs):
+    from pretalx.submission.models import Review, ReviewAggregate
+
+    reviews = [
+        Review(
+            submission=submissions[index],
+            user=reviewers[reviewer],
+            text=_text(rng, 20),
+            score=rng.randint(0, 3),
+        )
+        for index, reviewer in review_pairs
+    ]
+    Review.objects.bulk_create(reviews)
+    scores = {}
+    for review in reviews:
+        scores.setdefault(review.submission.pk, []).append((review.score, None))
+    ReviewAggregate.objects.bulk_create(
+        ReviewAggregate(submission_id=submission_id, **ReviewAggregate.compute(values))
+        for submission_id, values in scores.items()
+    )
+
+
+def _create_questions(rng, event, count, submissions, speakers):
+    from pretalx.submission.models import (
+        Answer, Question, QuestionTarget, QuestionVariant,
+    )
+
+    answers = {
+        QuestionVariant.STRING: lambda: _text(rng, 4),
+        QuestionVariant.NUMBER: lambda: str(rng.randint(0, 100)),
+        QuestionVariant.BOOLEAN: lambda: rng.choice(('True', 'False')),
+        QuestionVariant.TEXT: lambda: _text(rng, 30),
+    }
+    variants = list(answers)
+    questions = _bulk_create(
+        Question,
+        [
+            Question(
+                event=event,
+                question=_text(rng, 6)[:-1] + '?',
+                variant=variants[index % len(variants)],
+                target=QuestionTarget.SPEAKER
+                if index % 2
+                else QuestionTarget.SUBMISSION,
+                position=index,
+            )
+            for index in range(count)
+        ],
+        Question.all_objects.filter(event=event),
+    )
+    Answer.objects.bulk_create(
+        Answer(question=question, answer=answers[question.variant](), **target)
+        for question in questions
+        for target in (
+            [{'person': user} for user in speakers]
+            if question.target == QuestionTarget.SPEAKER
+            else [{'submission': submission} for submission in submissions]
+        )
+    )
+
+
+def _create_availabilities(rng, event, rooms, profiles, count):
+    from pretalx.schedule.models import Availability
+
+    days = list(_day_range(event))
+    availabilities = [
+        Availability(event=event, room=room, start=start, end=end)
+        for start, end in days
+        for room in rooms
+    ]
+    for profile in profiles:
+        for _ in range(count):
+            start, _ = rng.choice(days)
+            start += datetime.timedelta(hours=rng.randint(0, 6))
+            end = start + datetime.timedelta(hours=rng.randint(1, 4))
+            availabilities.append(
+                Availability(event=event, person=profile, start=start, end=end)
+            )
+    Availability.objects.bulk_create(availabilities)
+
+
+def _create_search_entries(event, submissions, profiles, submission_speakers):
+    from pretalx.common.models import SearchEntry
+    from pretalx.common.search import build_submission_text, get_speaker_text
+
+    entries = [
+        SearchEntry(
+            event=event,
+            submission=submission,
+            text=build_submission_text(
+                submission,
+                [user.name for user in submission_speakers[submission.pk]],
+            ),
+        )
+        for submission in submissions
+    ]
+    entries += [
+        SearchEntry(event=event, speaker=profile, text=get_speaker_text(profile))
+        for profile in profiles
+    ]
+    SearchEntry.objects.bulk_create(entries)
+
+
+def _create_mails(rng, event, speakers, count):
+    from pretalx.mail.models import QueuedMail
+
+    sent = now()
+    QueuedMail.objects.bulk_create(
+        QueuedMail(
+            event=event,
+            to=rng.choice(speakers).email if speakers else event.email,
+            subject=_text(rng, 5),
+            text=_text(rng, 80),
+            sent=sent - datetime.timedelta(minutes=index)
+            if rng.random() < 0.5
+            else None,
+        )
+        for index in range(count)
+    )
+
+
+def _create_schedules(rng, event, rooms, submissions, versions):
+    """
+    Releases ``versions`` schedules, each placing the accepted and confirmed
+    submissions in a new random order.
+    """
+    from pretalx.schedule.models import Schedule, TalkSlot
+
+    scheduled = [
+        submission
+        for submission in submissions
+        if submission.state in ('accepted', 'confirmed')
+    ]
+    for version in range(versions):
+        wip_schedule = Schedule.objects.get(event=event, version__isnull=True)
+        wip_schedule.talks.all().delete()
+        rng.shuffle(scheduled)
+        times = _slot_times(event, rooms)
+        slots = []
+        for submission in scheduled:
+            room, start = next(times, (None, None))
+            end = None
+            if start:
+                end = start + datetime.timedelta(minutes=submission.duration)
+            slots.append(
+                TalkSlot(
+                    submission=submission,
+                    schedule=wip_schedule,
+                    room=room,
+                    start=start,
+                    end=end,
+                    is_visible=False,
+                )
+            )
+        TalkSlot.objects.bulk_create(slots)
+        wip_schedule.freeze(name=f'{version + 1}.0', notify_speakers=False)
+
+
+@transaction.atomic
+def generate_event(
+    organiser,
+    slug,
+    *,
+    seed=0,
+    date_from=None,
+    days=3,
+    submissions=1000,
+    speakers=800,
+    reviewers=20,
+    reviews=5000,
+    questions=4,
+    rooms=8,
+    availabilities=2,
+    schedules=3,
+    mails=2000,
+):
+    """
+    Creates an event with the given numbers of submissions, speakers,
+    reviewers, reviews, questions (each answered by every submission or
+    speaker), rooms, availabilities per speaker, released schedule versions
+    and queued mails, about half of which are sent.
+    """
+    from pretalx.event.models import Event, Team
+    from pretalx.person.models import SpeakerProfile
+    from pretalx.schedule.models import Room
+    from pretalx.submission.models import Submission
+
+    rng = random.Random(seed)
+    date_from = date_from or datetime.date.today()
+    password = make_password(None)
+
+    event = Event.objects.create(
+        name=f'Generated event {slug}',
+        slug=slug,
+        organiser=organiser,
+        is_public=True,
+        email=f'orga@{slug}.example.org',
+        date_from=date_from,
+        date_to=date_from + datetime.timedelta(days=max(days, 1) - 1),
+    )
+    event.settings.export_html_on_schedule_release = False
+
+    room_list = _bulk_create(
+        Room,
+        [
+            Room(
+                event=event,
+                name=f'Room {index + 1}',
+                capacity=rng.randrange(20, 1000, 10),
+                position=index,
+            )
+            for index in range(rooms)
+        ],
+        Room.objects.filter(event=event),
+    )
+    speaker_list = _create_users(rng, event, 'speaker', speakers, password)
+    profile_list = _bulk_create(
+        SpeakerProfile,
+        [
+            SpeakerProfile(user=user, event=event, biography=_text(rng, 30))
+            for user in speaker_list
+        ],
+        SpeakerProfile.objects.filter(event=event).select_related('user'),
+    )
+    reviewer_list = _create_users(rng, event, 'reviewer', reviewers, password)
+    team = Team.objects.create(
+        organiser=organiser,
+        name=f'Reviewers {slug}',
+        can_change_submissions=True,
+        is_reviewer=True,
+    )
+    team.limit_events.add(event)
+    team.members.add(*reviewer_list)
+
+    # Reviews are picked first, so that review counts can be inserted right away
+    review_pairs = []
+    if reviewer_list:
+        total = submissions * len(reviewer_list)
+        review_pairs = sorted(
+            divmod(pair, len(reviewer_list))
+            for pair in rng.sample(range(total), min(reviews, total))
+        )
+    review_counts = [0] * submissions
+    for index, _ in review_pairs:
+        review_counts[index] += 1
+    submission_list = _create_submissions(rng, event, submissions, review_counts)
+
+    submission_speakers = {
+        submission.pk: rng.sample(
+            speaker_list, min(rng.choice((1, 1, 1, 2, 3)), len(speaker_list))
+        )
+        for submission in submission_list
+    }
+    Submission.speakers.through.objects.bulk_create(
+        Submission.speakers.through(submission_id=submission_id, user_id=user.pk)
+        for submission_id, users in submission_speakers.items()
+        for user in users
+    )
+
+    _create_reviews(rng, submission_list, reviewer_list, review_pairs)
+    _create_questions(rng, event, questions, submission_list, speaker_list)
+    _create_availabilities(rng, event, room_list, profile_list, availabilities)
+    _create_search_entries(event, submission_list, profile_list, submission_speakers)
+    _create_mails(rng, event, speaker_list, mails)
+    _create_schedules(rng, event, room_list, submission_list, schedules)
+    return event
@@ -6,7 +6,7 @@ from django.core.exceptions import ValidationError
 from django.core.mail import get_connection
 from django.core.mail.backends.base import BaseEmailBackend
 from django.core.validators import RegexValidator
-from django.db import models
+from django.db import models, transaction
 from django.utils.functional import cached_property
 from django.utils.timezone import make_aware
 from django.utils.translation import ugettext_lazy as _
@@ -212,6 +212,7 @@ class Event(LogMixin, models.Model):
         submissions = '{base}/submissions'
         submission_cards = '{base}/submissions/cards/'
         new_submission = '{submissions}/new'
+        submission_statistics = '{submissions}/statistics'
         speakers = '{base}/speakers'
         settings = edit_settings = '{base}/settings'
         mail_settings = edit_mail_settings = '{settings}/mail'
@@ -228,6 +229,7 @@ class Event(LogMixin, models.Model):
         reset_schedule = '{schedule}/reset'
         toggle_schedule = '{schedule}/toggle'
         reviews = '{base}/reviews'
+        review_export = '{reviews}/export'
         schedule_api = '{base}/schedule/api'
         rooms_api = '{schedule_api}/rooms'
         talks_api = '{schedule_api}/talks'
@@ -372,16 +374,18 @@ class Event(LogMixin, models.Model):
 
     @cached_property
     def wip_schedule(self):
-        schedule, _ = self.schedules.get_or_create(version__isnull=True)
+        from pretalx.common.cache import get_event_schedules
+
+        schedule = get_event_schedules(self)['wip']
+        if not schedule:
+            schedule, _ = self.schedules.get_or_create(version__isnull=True)
         return schedule
 
     @cached_property
     def current_schedule(self):
-        return (
-            self.schedules.order_by('-published')
-            .filter(published__isnull=False)
-            .first()
-        )
+        from pretalx.common.cache import get_event_schedules
+
+        return get_event_schedules(self)['current']
 
     @cached_property
     def duration(self):
@@ -441,19 +445,68 @@ class Event(LogMixin, models.Model):
 
     @cached_property
     def talks(self):
-        from pretalx.submission.models.submission import Submission
-
-        if self.current_schedule:
-            return self.submissions.filter(
-                slots__in=self.current_schedule.talks.filter(is_visible=True)
-            )
-        return Submission.objects.none()
+        return self.submissions.filter(is_published=True)
 
     @cached_property
     def speakers(self):
-        from pretalx.person.models import User
+        from pretalx.person.models import SpeakerProfile, User
 
-        return User.objects.filter(submissions__in=self.talks).order_by('id').distinct()
+        return User.objects.filter(
+            pk__in=SpeakerProfile.objects.filter(event=self, is_published=True).values(
+                'user'
+            )
+        ).order_by('id')
+
+    def update_published_talks(self):
+        """
+        Marks the submissions with a visible slot in the current schedule, and
+        the profiles of their speakers, as published – and all others as
+        unpublished. :attr:`talks` and :attr:`speakers` rely on these flags, so
+        this has to be called whenever the current schedule changes.
+        """
+        from pretalx.submission.models import Submission
+
+        schedule = (
+            self.schedules.filter(published__isnull=False)
+            .order_by('-published')
+            .first()
+        )
+        visible = []
+        if schedule:
+            visible = schedule.talks.filter(is_visible=True).values('submission')
+        with transaction.atomic():
+            submissions = Submission.all_objects.filter(event=self)
+            submissions.filter(is_published=True).exclude(pk__in=visible).update(
+                is_published=False
+            )
+            submissions.filter(is_published=False, pk__in=visible).update(
+                is_published=True
+            )
+            self.update_published_speakers()
+        for attribute in ('talks', 'speakers'):
+            self.__dict__.pop(attribute, None)
+
+    def update_published_speakers(self):
+        """
+        Marks the profiles of all speakers of published submissions as
+        published, creating missing profiles, and all others as unpublished.
+        """
+        from pretalx.person.models import SpeakerProfile, User
+        from pretalx.submission.models import Submission
+
+        speakers = User.objects.filter(
+            submissions__in=Submission.objects.filter(event=self, is_published=True)
+        )
+        for user in speakers.exclude(profiles__event=self).distinct():
+            user.event_profile(self)
+        profiles = SpeakerProfile.objects.filter(event=self)
+        profiles.filter(is_published=True).exclude(user__in=speakers).update(
+            is_published=False
+        )
+        profiles.filter(is_published=False, user__in=speakers).update(
+            is_published=True
+        )
+        self.__dict__.pop('speakers', None)
 
     @cached_property
     def submitters(self):
@@ -467,6 +520,7 @@ class Event(LogMixin, models.Model):
     def send_orga_mail(self, text, stats=False):
         from django.utils.translation import override
         from pretalx.common.mail import mail_send_task
+        from pretalx.event.stats import get_event_stats
         from pretalx.mail.models import QueuedMail
 
         context = {
@@ -475,19 +529,23 @@ class Event(LogMixin, models.Model):
             'event_schedule': self.orga_urls.schedule.full(),
             'event_submissions': self.orga_urls.submissions.full(),
             'event_team': self.orga_urls.team_settings.full(),
-            'submission_count': self.submissions.all().count(),
         }
         if stats:
+            event_stats = get_event_stats(self)
             context.update(
                 {
-                    'talk_count': self.current_schedule.talks.filter(
-                        is_visible=True
-                    ).count(),
-                    'review_count': self.reviews.count(),
-                    'schedule_count': self.schedules.count() - 1,
-                    'mail_count': self.queued_mails.filter(sent__isnull=False).count(),
+                    key: event_stats[key]
+                    for key in (
+                        'submission_count',
+                        'talk_count',
+                        'review_count',
+                        'schedule_count',
+                        'mail_count',
+                    )
                 }
             )
+        else:
+            context['submission_count'] = self.submissions.all().count()
         with override(self.locale):
             text = QueuedMail.make_text(str(text).format(**context), event=self)
         mail_send_task.apply_async(
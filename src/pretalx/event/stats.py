@@ -0,0 +1,129 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import models
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from pretalx.common.cache import (
+    SUBMISSION_TIMELINE_KEY, get_event_data_version, set_after_commit,
+)
+
+EVENT_STATS_KEY = 'pretalx_event_stats_{event_id}_{version}'
+# Sent mails do not change the event data version, so we keep this short
+EVENT_STATS_TIMEOUT = 60
+SUBMISSION_TIMELINE_TIMEOUT = 60 * 60 * 24
+
+
+def _count(queryset, event_field):
+    """Counts the rows of ``queryset`` that belong to the outer event."""
+    return Coalesce(
+        models.Subquery(
+            queryset.filter(**{event_field: models.OuterRef('pk')})
+            .order_by()
+            .values(event_field)
+            .annotate(count=models.Count('pk'))
+            .values('count'),
+            output_field=models.IntegerField(),
+        ),
+        0,
+    )
+
+
+def build_event_stats(event) -> dict:
+    """
+    Counts the submissions, talks, speakers, reviews, schedules and sent mails
+    of an event, using one query for the event and one for its current schedule.
+    """
+    from pretalx.event.models import Event
+    from pretalx.mail.models import QueuedMail
+    from pretalx.schedule.models import Schedule
+    from pretalx.submission.models import Review, Submission, SubmissionStates
+
+    stats = (
+        Event.objects.filter(pk=event.pk)
+        .annotate(
+            submission_count=_count(Submission.objects.all(), 'event'),
+            review_count=_count(Review.objects.all(), 'submission__event'),
+            schedule_count=_count(
+                Schedule.objects.filter(version__isnull=False), 'event'
+            ),
+            mail_count=_count(QueuedMail.objects.filter(sent__isnull=False), 'event'),
+        )
+        .values('submission_count', 'review_count', 'schedule_count', 'mail_count')
+        .first()
+    ) or {}
+    stats.update(talk_count=0, confirmed_count=0, speaker_count=0)
+    if event.current_schedule:
+        talks = event.current_schedule.talks.filter(is_visible=True).exclude(
+            submission__state=SubmissionStates.DELETED
+        )
+        stats.update(
+            talks.aggregate(
+                talk_count=models.Count('submission', distinct=True),
+                confirmed_count=models.Count(
+                    'submission',
+                    distinct=True,
+                    filter=models.Q(submission__state=SubmissionStates.CONFIRMED),
+                ),
+                speaker_count=models.Count('submission__speakers', distinct=True),
+            )
+        )
+    return stats
+
+
+def get_event_stats(event) -> dict:
+    """
+    Returns the statistics of an event as built by :func:`build_event_stats`.
+
+    They are cached until the event data changes, or for a minute at most.
+    """
+    key = EVENT_STATS_KEY.format(
+        event_id=event.pk, version=get_event_data_version(event)
+    )
+    stats = cache.get(key)
+    if stats is None:
+        stats = build_event_stats(event)
+        cache.set(key, stats, EVENT_STATS_TIMEOUT)
+    return stats
+
+
+def build_submission_timeline(event) -> list:
+    """
+    Returns the number of submissions created per day, as a list of
+    ``{'x': date, 'y': count}`` dictionaries without gaps between the first
+    and the last day. Days are counted in the event's timezone.
+    """
+    from pretalx.common.models import ActivityLog
+
+    with timezone.override(event.timezone):
+        data = dict(
+            ActivityLog.objects.filter(
+                event=event, action_type='pretalx.submission.create'
+            )
+            .annotate(date=TruncDate('timestamp'))
+            .order_by('date')
+            .values('date')
+            .annotate(count=models.Count('pk'))
+            .values_list('date', 'count')
+        )
+    if not data:
+        return []
+    first, last = min(data), max(data)
+    return [
+        {'x': day.isoformat(), 'y': data.get(day, 0)}
+        for day in (first + timedelta(days=n) for n in range((last - first).days + 1))
+    ]
+
+
+def get_submission_timeline(event) -> list:
+    """
+    Returns the timeline built by :func:`build_submission_timeline`, cached
+    until the next submission is created.
+    """
+    key = SUBMISSION_TIMELINE_KEY.format(event_id=event.pk)
+    timeline = cache.get(key)
+    if timeline is None:
+        timeline = build_submission_timeline(event)
+        set_after_commit(key, timeline, SUBMISSION_TIMELINE_TIMEOUT)
+    return timeline
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mail', '0003_auto_20171001_1358'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='queuedmail',
+            index=models.Index(fields=['event', 'sent'], name='queuedmail_event_sent'),
+        ),
+    ]
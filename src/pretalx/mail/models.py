@@ -108,6 +108,9 @@ class QueuedMail(LogMixin, models.Model):
     text = models.TextField(verbose_name=_('Text'))
     sent = models.DateTimeField(null=True, blank=True, verbose_name=_('Sent at'))
 
+    class Meta:
+        indexes = [models.Index(fields=['event', 'sent'], name='queuedmail_event_sent')]
+
     class urls(EventUrls):
         base = edit = '{self.event.orga_urls.mail}/{self.pk}'
         delete = '{base}/delete'
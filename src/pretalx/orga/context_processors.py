@@ -49,6 +49,8 @@ def orga_events(request):
             child_session = request.session.get(child_session_key)
             s = SessionStore()
             if not child_session or not s.exists(child_session):
+                if not request.session.session_key:
+                    request.session.create()
                 s[
                     f'pretalx_event_access_{request.event.pk}'
                 ] = request.session.session_key
@@ -3,6 +3,7 @@ from django.utils.translation import ugettext as _
 
 from pretalx.common.forms.utils import get_help_text
 from pretalx.common.mixins.forms import ReadOnlyFlag
+from pretalx.person.models import User
 from pretalx.submission.models import Submission, SubmissionType
 
 
@@ -12,6 +13,12 @@ class SubmissionForm(ReadOnlyFlag, forms.ModelForm):
         self.fields['submission_type'].queryset = SubmissionType.objects.filter(
             event=event
         )
+        self.fields['assigned_reviewers'].queryset = User.objects.filter(
+            teams__in=event.teams.filter(is_reviewer=True)
+        ).distinct()
+        self.fields['assigned_reviewers'].help_text = _(
+            'Assigned reviewers will be asked to review this submission first.'
+        )
 
         if not self.instance.pk:
             self.fields['speaker'] = forms.CharField(
@@ -55,4 +62,5 @@ class SubmissionForm(ReadOnlyFlag, forms.ModelForm):
             'duration',
             'image',
             'is_featured',
+            'assigned_reviewers',
         ]
@@ -86,6 +86,7 @@ rules.add_perm('orga.view_mail_templates', can_change_submissions)
 rules.add_perm('orga.edit_mail_templates', can_change_submissions)
 rules.add_perm('orga.view_review_dashboard', can_change_submissions | is_reviewer)
 rules.add_perm('orga.view_reviews', is_reviewer)
+rules.add_perm('orga.export_reviews', can_change_submissions)
 rules.add_perm('orga.perform_reviews', is_reviewer & review_deadline_unmet)
 rules.add_perm('orga.remove_review', is_administrator | (is_review_author & can_be_reviewed))
 rules.add_perm('orga.view_schedule', can_change_submissions)
@@ -1,4 +1,5 @@
 from django import template
+from django.core.exceptions import ObjectDoesNotExist
 from django.utils.safestring import mark_safe
 
 register = template.Library()
@@ -35,9 +36,15 @@ def _review_score_override(positive_overrides, negative_overrides):
 
 @register.simple_tag(takes_context=True)
 def review_score(context, submission):
-    score = submission.average_score
-    positive_overrides = submission.reviews.filter(override_vote=True).count()
-    negative_overrides = submission.reviews.filter(override_vote=False).count()
+    try:
+        aggregate = submission.review_aggregate
+        score = aggregate.mean_score
+        positive_overrides = aggregate.positive_overrides
+        negative_overrides = aggregate.negative_overrides
+    except ObjectDoesNotExist:
+        # The aggregate is created with the first review
+        score = None
+        positive_overrides = negative_overrides = 0
 
     if positive_overrides or negative_overrides:
         return mark_safe(_review_score_override(positive_overrides, negative_overrides))
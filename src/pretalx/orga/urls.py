@@ -72,6 +72,7 @@ urlpatterns = [
         url('^submissions$', submission.SubmissionList.as_view(), name='submissions.list'),
         url('^submissions/new$', submission.SubmissionContent.as_view(), name='submissions.create'),
         url('^submissions/cards/$', cards.SubmissionCards.as_view(), name='submissions.cards'),
+        url('^submissions/statistics$', submission.SubmissionStats.as_view(), name='submissions.statistics'),
         url('^submissions/(?P<code>[\w-]+)/', include([
             url('^$', submission.SubmissionContent.as_view(), name='submissions.content.view'),
             url('^submit$', submission.SubmissionStateChange.as_view(), name='submissions.submit'),
@@ -100,6 +101,7 @@ urlpatterns = [
         url('^info/(?P<pk>[0-9]+)/delete/$', speaker.InformationDelete.as_view(), name='speakers.information.delete'),
 
         url('^reviews$', review.ReviewDashboard.as_view(), name='reviews.dashboard'),
+        url('^reviews/export$', review.ReviewExport.as_view(), name='reviews.export'),
 
         url('^settings$', event.EventDetail.as_view(), name='settings.event.view'),
         url('^settings/mail$', event.EventMailSettings.as_view(), name='settings.mail.view'),
@@ -130,6 +132,7 @@ urlpatterns = [
         url('^schedule/rooms/(?P<pk>[0-9]+)/down$', schedule.room_move_down, name='schedule.rooms.down'),
         url('^schedule/api/rooms/$', schedule.RoomListApi.as_view(), name='schedule.api.rooms'),
         url('^schedule/api/talks/$', schedule.TalkList.as_view(), name='schedule.api.talks'),
+        url('^schedule/api/talks/batch/$', schedule.TalkBatchUpdate.as_view(), name='schedule.api.batch'),
         url('^schedule/api/talks/(?P<pk>[0-9]+)/$', schedule.TalkUpdate.as_view(), name='schedule.api.update'),
         url(
             '^schedule/api/availabilities/(?P<talkid>[0-9]+)/(?P<roomid>[0-9]+)/$',
@@ -7,6 +7,7 @@ from pretalx.common.mixins.views import PermissionRequired
 from pretalx.common.models.log import ActivityLog
 from pretalx.event.models import Organiser
 from pretalx.event.stages import get_stages
+from pretalx.event.stats import get_event_stats
 from pretalx.submission.models.submission import SubmissionStates
 
 
@@ -103,15 +104,16 @@ class EventDashboardView(PermissionRequired, TemplateView):
                     'url': event.urls.schedule,
                 }
             )
-        if event.submissions.count():
+        stats = get_event_stats(event)
+        if stats['submission_count']:
             context['tiles'].append(
                 {
-                    'large': event.submissions.count(),
+                    'large': stats['submission_count'],
                     'small': _('total submissions'),
                     'url': event.orga_urls.submissions,
                 }
             )
-            talk_count = event.talks.count()
+            talk_count = stats['talk_count']
             if talk_count:
                 context['tiles'].append(
                     {
@@ -121,9 +123,7 @@ class EventDashboardView(PermissionRequired, TemplateView):
                         + f'?state={SubmissionStates.ACCEPTED}&state={SubmissionStates.CONFIRMED}',
                     }
                 )
-                confirmed_count = event.talks.filter(
-                    state=SubmissionStates.CONFIRMED
-                ).count()
+                confirmed_count = stats['confirmed_count']
                 if confirmed_count != talk_count:
                     context['tiles'].append(
                         {
@@ -133,17 +133,17 @@ class EventDashboardView(PermissionRequired, TemplateView):
                             + f'?state={SubmissionStates.ACCEPTED}',
                         }
                     )
-        if event.speakers.count():
+        if stats['speaker_count']:
             context['tiles'].append(
                 {
-                    'large': event.speakers.count(),
+                    'large': stats['speaker_count'],
                     'small': _('speakers'),
                     'url': event.orga_urls.speakers + '?role=true',
                 }
             )
         context['tiles'].append(
             {
-                'large': event.queued_mails.filter(sent__isnull=False).count(),
+                'large': stats['mail_count'],
                 'small': _('sent emails'),
                 'url': event.orga_urls.compose_mails,
             }
@@ -1,30 +1,43 @@
+from collections import defaultdict
+
 from django.contrib import messages
 from django.db import models
+from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
-from django.views.generic import ListView, TemplateView
+from django.views.generic import ListView, TemplateView, View
 
-from pretalx.common.mixins.views import Filterable, PermissionRequired
+from pretalx.common.mixins.views import Filterable, PermissionRequired, Sortable
 from pretalx.common.phrases import phrases
 from pretalx.common.views import CreateOrUpdateView
 from pretalx.orga.forms import ReviewForm
-from pretalx.person.models import User
+from pretalx.person.models import SpeakerProfile, User
 from pretalx.submission.forms import QuestionsForm, SubmissionFilterForm
-from pretalx.submission.models import Review, SubmissionStates
+from pretalx.submission.models import Review, Submission, SubmissionStates
+from pretalx.submission.review_statistics import (
+    get_review_statistics, serialize_review_statistics,
+)
 
 
-class ReviewDashboard(PermissionRequired, Filterable, ListView):
+class ReviewDashboard(PermissionRequired, Sortable, Filterable, ListView):
     template_name = 'orga/review/dashboard.html'
     paginate_by = 25
     context_object_name = 'submissions'
     permission_required = 'orga.view_review_dashboard'
-    default_filters = (
-        'code__icontains',
-        'speakers__name__icontains',
-        'title__icontains',
+    search_index = 'submission'
+    filter_fields = (
+        'submission_type',
+        'state',
+        'review_count',
+        'review_aggregate__mean_score__gte',
+        'review_aggregate__mean_score__lte',
+        'review_aggregate__median_score__gte',
+        'review_aggregate__median_score__lte',
+        'review_aggregate__score_count__gte',
+        'review_aggregate__score_count__lte',
     )
-    filter_fields = ('submission_type', 'state')
+    sortable_fields = ('avg_score', 'review_count')
 
     def get_filter_form(self):
         return SubmissionFilterForm(
@@ -39,9 +52,6 @@ class ReviewDashboard(PermissionRequired, Filterable, ListView):
         )
 
     def get_queryset(self, *args, **kwargs):
-        overridden_reviews = Review.objects.filter(
-            override_vote__isnull=False, submission_id=models.OuterRef('pk')
-        )
         queryset = self.request.event.submissions.filter(
             state__in=[
                 SubmissionStates.SUBMITTED,
@@ -51,24 +61,32 @@ class ReviewDashboard(PermissionRequired, Filterable, ListView):
             ]
         )
         queryset = self.filter_queryset(queryset)
-        return (
-            queryset.order_by('review_id')
-            .annotate(has_override=models.Exists(overridden_reviews))
+        has_override = models.Q(review_aggregate__positive_overrides__gt=0) | models.Q(
+            review_aggregate__negative_overrides__gt=0
+        )
+        queryset = (
+            queryset.select_related('review_aggregate', 'submission_type')
             .annotate(
                 avg_score=models.Case(
                     models.When(
-                        has_override=True,
+                        has_override,
                         then=self.request.event.settings.review_max_score + 1,
                     ),
-                    default=models.Avg('reviews__score'),
+                    default=models.F('review_aggregate__mean_score'),
+                    output_field=models.FloatField(),
                 )
             )
             .order_by('-state', '-avg_score', 'code')
         )
+        return self.sort_queryset(queryset)
 
     def get_permission_object(self):
         return self.request.event
 
+    @cached_property
+    def next_submission(self):
+        return Review.find_next_submission(self.request.event, self.request.user)
+
     def get_context_data(self, *args, **kwargs):
         context = super().get_context_data(*args, **kwargs)
         missing_reviews = Review.find_missing_reviews(
@@ -78,7 +96,7 @@ class ReviewDashboard(PermissionRequired, Filterable, ListView):
             teams__in=self.request.event.teams.filter(is_reviewer=True)
         ).distinct()
         context['missing_reviews'] = missing_reviews
-        context['next_submission'] = missing_reviews.first()
+        context['next_submission'] = self.next_submission
         context['reviewers'] = reviewers.count()
         context['active_reviewers'] = (
             reviewers.filter(reviews__isnull=False)
@@ -104,7 +122,10 @@ class ReviewSubmission(PermissionRequired, CreateOrUpdateView):
     @cached_property
     def submission(self):
         return get_object_or_404(
-            self.request.event.submissions, code__iexact=self.kwargs['code']
+            self.request.event.submissions.select_related(
+                'submission_type'
+            ).prefetch_related('speakers'),
+            code__iexact=self.kwargs['code'],
         )
 
     @cached_property
@@ -112,6 +133,7 @@ class ReviewSubmission(PermissionRequired, CreateOrUpdateView):
         return (
             self.submission.reviews.exclude(user__in=self.submission.speakers.all())
             .filter(user=self.request.user)
+            .prefetch_related('answers')
             .first()
         )
 
@@ -139,35 +161,77 @@ class ReviewSubmission(PermissionRequired, CreateOrUpdateView):
             readonly=self.read_only,
         )
 
+    @cached_property
+    def skip_for_now(self):
+        return Review.find_next_submission(
+            self.request.event, self.request.user, ignore=[self.submission]
+        )
+
+    @cached_property
+    def next_submission(self):
+        # Only used after saving the review, which changes the next submission
+        return Review.find_next_submission(self.request.event, self.request.user)
+
     def get_context_data(self, *args, **kwargs):
         context = super().get_context_data(*args, **kwargs)
         context['submission'] = self.submission
         context['review'] = self.object
         context['read_only'] = self.read_only
         context['qform'] = self.qform
-        context['skip_for_now'] = Review.find_missing_reviews(
-            self.request.event, self.request.user, ignore=[self.submission]
-        ).first()
-        context['profiles'] = [
-            speaker.event_profile(self.request.event)
-            for speaker in self.submission.speakers.all()
-        ]
-        context['reviews'] = [
-            {
-                'score': review.display_score,
-                'text': review.text,
-                'user': review.user.get_display_name(),
-                'answers': [
-                    review.answers.filter(question=question).first()
-                    for question in self.qform.queryset
-                ],
-            }
-            for review in self.submission.reviews.exclude(
+        context['skip_for_now'] = self.skip_for_now
+        context['profiles'] = self.get_speaker_profiles()
+        questions = list(self.qform.queryset)
+        reviews = (
+            self.submission.reviews.exclude(
                 pk=(self.object.pk if self.object else None)
             )
-        ]
+            .select_related('user')
+            .prefetch_related('answers')
+        )
+        context['reviews'] = []
+        for review in reviews:
+            review.submission = self.submission
+            answers = {}
+            for answer in review.answers.all():
+                answers.setdefault(answer.question_id, answer)
+            context['reviews'].append(
+                {
+                    'score': review.display_score,
+                    'text': review.text,
+                    'user': review.user.get_display_name(),
+                    'answers': [answers.get(question.pk) for question in questions],
+                }
+            )
         return context
 
+    def get_speaker_profiles(self):
+        event = self.request.event
+        speakers = self.submission.speakers.all()
+        speaker_ids = [speaker.pk for speaker in speakers]
+        profiles = {
+            profile.user_id: profile
+            for profile in SpeakerProfile.objects.filter(
+                event=event, user__in=speaker_ids
+            ).select_related('user', 'event')
+        }
+        submissions = defaultdict(list)
+        for relation in (
+            Submission.speakers.through.objects.filter(
+                user__in=speaker_ids, submission__event=event
+            )
+            .exclude(submission__state=SubmissionStates.DELETED)
+            .select_related('submission')
+            .order_by('submission__pk')
+        ):
+            relation.submission.event = event
+            submissions[relation.user_id].append(relation.submission)
+        result = []
+        for speaker in speakers:
+            profile = profiles.get(speaker.pk) or speaker.event_profile(event)
+            profile.submissions = submissions[speaker.pk]
+            result.append(profile)
+        return result
+
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
         kwargs['event'] = self.request.event
@@ -203,9 +267,7 @@ class ReviewSubmission(PermissionRequired, CreateOrUpdateView):
 
     def get_success_url(self) -> str:
         if self.request.POST.get('show_next', '0').strip() == '1':
-            next_submission = Review.find_missing_reviews(
-                self.request.event, self.request.user
-            ).first()
+            next_submission = self.next_submission
             if next_submission:
                 messages.success(self.request, phrases.orga.another_review)
                 return next_submission.orga_urls.reviews
@@ -222,3 +284,33 @@ class ReviewSubmissionDelete(PermissionRequired, TemplateView):
 
     def get_permission_object(self):
         return self.request.event
+
+
+class ReviewExport(PermissionRequired, View):
+    permission_required = 'orga.export_reviews'
+
+    def get_permission_object(self):
+        return self.request.event
+
+    def get(self, request, *args, **kwargs):
+        kind = request.GET.get('type', 'submissions')
+        file_format = request.GET.get('format', 'csv')
+        if kind not in ('submissions', 'reviewers') or file_format not in (
+            'csv',
+            'json',
+        ):
+            raise Http404()
+        data = get_review_statistics(request.event)
+        if data is None:
+            messages.info(
+                request,
+                _('Review statistics are being computed, please try again soon.'),
+            )
+            return redirect(request.event.orga_urls.reviews)
+        content, content_type = serialize_review_statistics(
+            data, kind=kind, file_format=file_format
+        )
+        file_name = f'{request.event.slug}-reviews-{kind}.{file_format}'
+        response = HttpResponse(content, content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="{file_name}"'
+        return response
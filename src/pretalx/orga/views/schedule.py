@@ -1,12 +1,14 @@
 import json
 import os.path
 import xml.etree.ElementTree as ET
+from collections import defaultdict
 from datetime import timedelta
 
 import dateutil.parser
 from csp.decorators import csp_update
 from django.contrib import messages
-from django.db import transaction
+from django.db import models, transaction
+from django.db.models import Case, Value, When
 from django.db.models.deletion import ProtectedError
 from django.http import FileResponse, Http404, JsonResponse
 from django.shortcuts import redirect
@@ -20,13 +22,15 @@ from pretalx.agenda.management.commands.export_schedule_html import (
     Command as ExportScheduleHtml,
 )
 from pretalx.agenda.tasks import export_schedule_html
+from pretalx.common.cache import bump_event_data_version
 from pretalx.common.mixins.views import ActionFromUrl, PermissionRequired
 from pretalx.common.signals import register_data_exporters
 from pretalx.common.views import CreateOrUpdateView
 from pretalx.orga.forms.schedule import ScheduleImportForm, ScheduleReleaseForm
 from pretalx.orga.views.event import EventSettingsPermission
 from pretalx.schedule.forms import QuickScheduleForm, RoomForm
-from pretalx.schedule.models import Availability, Room
+from pretalx.schedule.models import Availability, Room, TalkSlot
+from pretalx.submission.models import Submission
 
 
 @method_decorator(csp_update(SCRIPT_SRC="'self' 'unsafe-eval'"), name='dispatch')
@@ -212,7 +216,8 @@ def serialize_slot(slot):
         'id': slot.pk,
         'title': str(slot.submission.title),
         'speakers': [
-            {'name': speaker.name} for speaker in slot.submission.speakers.all()
+            {'name': speaker.get_display_name()}
+            for speaker in slot.submission.speakers.all()
         ],
         'submission_type': str(slot.submission.submission_type.name),
         'state': slot.submission.state,
@@ -231,6 +236,136 @@ def serialize_slot(slot):
     }
 
 
+SLOT_FIELDS = (
+    'id',
+    'title',
+    'speakers',
+    'submission_type',
+    'state',
+    'description',
+    'abstract',
+    'notes',
+    'duration',
+    'content_locale',
+    'do_not_record',
+    'room',
+    'start',
+    'end',
+    'url',
+    'warnings',
+)
+LAZY_SLOT_FIELDS = ('description', 'abstract', 'notes')
+SUBMISSION_VALUE_FIELDS = (
+    'title',
+    'state',
+    'description',
+    'abstract',
+    'notes',
+    'content_locale',
+    'do_not_record',
+)
+
+
+def serialize_slots(schedule, fields):
+    """Serializes all slots of a schedule like ``serialize_slot``, but only with
+    the given fields, and in a fixed number of queries regardless of the
+    number of slots."""
+    event = schedule.event
+    fields = [field for field in SLOT_FIELDS if field in fields]
+    values = ['pk', 'start', 'end', 'room_id', 'submission_id']
+    values += [
+        'submission__' + field
+        for field in fields
+        if field in SUBMISSION_VALUE_FIELDS
+    ]
+    if {'submission_type', 'duration', 'warnings', 'url'} & set(fields):
+        values += [
+            'submission__code',
+            'submission__duration',
+            'submission__submission_type_id',
+        ]
+    slots = list(schedule.talks.all().values(*values))
+
+    submission_types = {}
+    if {'submission_type', 'duration', 'warnings'} & set(fields):
+        submission_types = {
+            submission_type.pk: submission_type
+            for submission_type in event.submission_types.all()
+        }
+    speakers = defaultdict(list)
+    if {'speakers', 'warnings'} & set(fields):
+        speaker_relations = (
+            Submission.speakers.through.objects.filter(
+                submission_id__in=[slot['submission_id'] for slot in slots]
+            )
+            .order_by('pk')
+            .values_list('submission_id', 'user_id', 'user__name')
+        )
+        for submission_id, user_id, name in speaker_relations:
+            # Display names, like User.get_display_name in serialize_slot
+            speakers[submission_id].append((user_id, name or str(_('Unnamed user'))))
+    room_availabilities = defaultdict(list)
+    speaker_availabilities = defaultdict(list)
+    if 'warnings' in fields:
+        for availability in Availability.objects.filter(
+            event=event, room__isnull=False
+        ):
+            room_availabilities[availability.room_id].append(availability)
+        for availability in Availability.objects.filter(
+            person__event=event
+        ).select_related('person'):
+            speaker_availabilities[availability.person.user_id].append(availability)
+
+    result = []
+    for slot in slots:
+        duration = None
+        if 'submission__code' in slot:
+            submission_type = submission_types.get(
+                slot['submission__submission_type_id']
+            )
+            duration = slot['submission__duration'] or (
+                submission_type.default_duration if submission_type else None
+            )
+        data = {}
+        for field in fields:
+            if field == 'id':
+                data['id'] = slot['pk']
+            elif field in SUBMISSION_VALUE_FIELDS:
+                data[field] = slot['submission__' + field]
+            elif field == 'speakers':
+                data['speakers'] = [
+                    {'name': name} for user_id, name in speakers[slot['submission_id']]
+                ]
+            elif field == 'submission_type':
+                data['submission_type'] = str(submission_type.name)
+            elif field == 'duration':
+                data['duration'] = duration
+            elif field == 'room':
+                data['room'] = slot['room_id']
+            elif field in ('start', 'end'):
+                data[field] = slot[field].isoformat() if slot[field] else None
+            elif field == 'url':
+                data['url'] = Submission(
+                    event=event, code=slot['submission__code']
+                ).orga_urls.base
+            elif field == 'warnings':
+                data['warnings'] = []
+                if slot['start']:
+                    end = slot['end'] or slot['start'] + timedelta(minutes=duration)
+                    data['warnings'] = TalkSlot.build_warnings(
+                        availability=Availability(start=slot['start'], end=end),
+                        room_availabilities=room_availabilities[slot['room_id']]
+                        if slot['room_id']
+                        else None,
+                        speakers=[
+                            (user_id, name, speaker_availabilities[user_id])
+                            for user_id, name in speakers[slot['submission_id']]
+                        ],
+                    )
+        result.append(data)
+    return result
+
+
 class TalkList(PermissionRequired, View):
     permission_required = 'orga.edit_schedule'
 
@@ -246,9 +381,12 @@ class TalkList(PermissionRequired, View):
 
         if not schedule:
             return JsonResponse({'results': []})
+        if request.GET.get('fields'):
+            fields = request.GET['fields'].split(',')
+        else:
+            fields = [field for field in SLOT_FIELDS if field not in LAZY_SLOT_FIELDS]
         return JsonResponse(
-            {'results': [serialize_slot(slot) for slot in schedule.talks.all()]},
-            encoder=I18nJSONEncoder,
+            {'results': serialize_slots(schedule, fields)}, encoder=I18nJSONEncoder
         )
 
 
@@ -260,6 +398,12 @@ class TalkUpdate(PermissionRequired, View):
             pk=self.kwargs.get('pk')
         ).first()
 
+    def get(self, request, event, pk):
+        talk = self.get_object()
+        if not talk:
+            return JsonResponse({'error': 'Talk not found'}, status=404)
+        return JsonResponse(serialize_slot(talk), encoder=I18nJSONEncoder)
+
     def patch(self, request, event, pk):
         talk = self.get_object()
         if not talk:
@@ -283,6 +427,94 @@ class TalkUpdate(PermissionRequired, View):
         return JsonResponse(serialize_slot(talk))
 
 
+class TalkBatchUpdate(PermissionRequired, View):
+    """
+    Moves many talks of the WIP schedule at once.
+
+    Expects a list of ``{"id": …, "room": …, "start": …}`` objects, applies all
+    moves in one transaction and one UPDATE query, and returns only the talks
+    that actually changed, including their (new) warnings.
+    """
+
+    permission_required = 'orga.schedule_talk'
+
+    def get_permission_object(self):
+        return self.request.event
+
+    def _parse_moves(self, request):
+        data = json.loads(request.body.decode())
+        if isinstance(data, dict):
+            data = data.get('talks')
+        if not isinstance(data, list):
+            raise ValueError('Expected a list of talks.')
+        moves = {}
+        for move in data:
+            start = dateutil.parser.parse(move['start']) if move.get('start') else None
+            room = int(move['room']) if move.get('room') else None
+            moves[int(move['id'])] = (start, room)
+        return moves
+
+    def patch(self, request, event):
+        try:
+            moves = self._parse_moves(request)
+        except (KeyError, TypeError, ValueError, OverflowError):
+            return JsonResponse({'error': 'Invalid data'}, status=400)
+
+        rooms = {
+            room.pk: room
+            for room in request.event.rooms.all().prefetch_related('availabilities')
+        }
+        if any(room and room not in rooms for _, room in moves.values()):
+            return JsonResponse({'error': 'Room not found'}, status=400)
+
+        talks = list(
+            request.event.wip_schedule.talks.filter(pk__in=moves.keys())
+            .select_related('submission', 'submission__submission_type')
+            .prefetch_related('submission__speakers')
+        )
+        if len(talks) != len(moves):
+            return JsonResponse({'error': 'Talk not found'}, status=400)
+
+        changed = []
+        for talk in talks:
+            start, room = moves[talk.pk]
+            end = (
+                start + timedelta(minutes=talk.submission.get_duration())
+                if start
+                else None
+            )
+            if (talk.start, talk.end, talk.room_id) != (start, end, room):
+                talk.start, talk.end, talk.room = start, end, rooms.get(room)
+                changed.append(talk)
+
+        if changed:
+
+            def per_talk(attribute, field):
+                return Case(
+                    *[
+                        When(
+                            pk=talk.pk,
+                            then=Value(getattr(talk, attribute), output_field=field),
+                        )
+                        for talk in changed
+                    ],
+                    output_field=field,
+                )
+
+            with transaction.atomic():
+                TalkSlot.objects.filter(pk__in=[talk.pk for talk in changed]).update(
+                    start=per_talk('start', models.DateTimeField()),
+                    end=per_talk('end', models.DateTimeField()),
+                    room_id=per_talk('room_id', models.IntegerField()),
+                )
+                bump_event_data_version(request.event.pk)
+
+        return JsonResponse(
+            {'results': [serialize_slot(talk) for talk in changed]},
+            encoder=I18nJSONEncoder,
+        )
+
+
 class QuickScheduleView(PermissionRequired, UpdateView):
     permission_required = 'orga.schedule_talk'
     form_class = QuickScheduleForm
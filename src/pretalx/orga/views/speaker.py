@@ -26,7 +26,8 @@ class SpeakerList(PermissionRequired, Sortable, Filterable, ListView):
     model = SpeakerProfile
     template_name = 'orga/speaker/list.html'
     context_object_name = 'speakers'
-    default_filters = ('user__email__icontains', 'user__name__icontains')
+    default_filters = ('user__email__icontains',)
+    search_index = 'speaker'
     sortable_fields = ('user__email', 'user__name')
     default_sort_field = 'user__name'
     paginate_by = 25
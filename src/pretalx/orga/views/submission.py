@@ -1,12 +1,9 @@
-import json
-from collections import Counter
 from datetime import timedelta
 
-from dateutil import rrule
 from django.contrib import messages
 from django.db import transaction
 from django.forms.models import BaseModelFormSet, inlineformset_factory
-from django.http import Http404, HttpResponse
+from django.http import Http404, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.utils.crypto import get_random_string
 from django.utils.functional import cached_property
@@ -18,9 +15,9 @@ from django.views.generic import ListView, TemplateView, View
 from pretalx.common.mixins.views import (
     ActionFromUrl, Filterable, PermissionRequired, Sortable,
 )
-from pretalx.common.models import ActivityLog
 from pretalx.common.urls import build_absolute_uri
 from pretalx.common.views import CreateOrUpdateView
+from pretalx.event.stats import get_submission_timeline
 from pretalx.mail.models import QueuedMail
 from pretalx.orga.forms import SubmissionForm
 from pretalx.person.models import SpeakerProfile, User
@@ -406,11 +403,7 @@ class SubmissionList(PermissionRequired, Sortable, Filterable, ListView):
     model = Submission
     context_object_name = 'submissions'
     template_name = 'orga/submission/list.html'
-    default_filters = (
-        'code__icontains',
-        'speakers__name__icontains',
-        'title__icontains',
-    )
+    search_index = 'submission'
     filter_fields = ('submission_type', 'state')
     filter_form_class = SubmissionFilterForm
     sortable_fields = ('code', 'title', 'state', 'is_featured')
@@ -430,32 +423,17 @@ class SubmissionList(PermissionRequired, Sortable, Filterable, ListView):
         qs = self.filter_queryset(qs)
         if 'state' not in self.request.GET:
             qs = qs.exclude(state='deleted')
-        qs = self.sort_queryset(qs)
-        return qs.distinct()
+        return self.sort_queryset(qs)
 
-    def get_context_data(self, *args, **kwargs):
-        context = super().get_context_data(*args, **kwargs)
-        data = Counter(
-            timestamp.date()
-            for timestamp in ActivityLog.objects.filter(
-                event=self.request.event, action_type='pretalx.submission.create'
-            ).values_list('timestamp', flat=True)
-        )
-        dates = data.keys()
-        if len(dates) > 1:
-            date_range = rrule.rrule(
-                rrule.DAILY,
-                count=(max(dates) - min(dates)).days + 1,
-                dtstart=min(dates),
-            )
-            if len(data) > 1:
-                context['timeline_data'] = json.dumps(
-                    [
-                        {"x": date.isoformat(), "y": data.get(date.date(), 0)}
-                        for date in date_range
-                    ]
-                )
-        return context
+
+class SubmissionStats(PermissionRequired, View):
+    permission_required = 'orga.view_submissions'
+
+    def get_permission_object(self):
+        return self.request.event
+
+    def get(self, request, *args, **kwargs):
+        return JsonResponse({'timeline': get_submission_timeline(request.event)})
 
 
 class FeedbackList(SubmissionViewMixin, ListView):
@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('person', '0020_auto_20180922_0511'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='speakerprofile',
+            name='is_published',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='speakerprofile',
+            index=models.Index(fields=['event', 'is_published'], name='speakerprofile_published'),
+        ),
+    ]
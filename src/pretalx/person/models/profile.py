@@ -27,6 +27,15 @@ class SpeakerProfile(LogMixin, models.Model):
     has_arrived = models.BooleanField(
         default=False, verbose_name=_('The speaker has arrived')
     )
+    # Speaker of a talk in the current schedule, see Event.update_published_talks
+    is_published = models.BooleanField(default=False, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['event', 'is_published'], name='speakerprofile_published'
+            )
+        ]
 
     class urls(EventUrls):
         public = '{self.event.urls.base}/speaker/{self.user.code}'
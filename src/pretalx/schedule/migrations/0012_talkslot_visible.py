@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0011_auto_20180205_1127'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='talkslot',
+            index=models.Index(fields=['schedule', 'is_visible', 'start'], name='talkslot_visible'),
+        ),
+    ]
@@ -73,6 +73,7 @@ class Schedule(LogMixin, models.Model):
             del wip_schedule.event.wip_schedule
         with suppress(AttributeError):
             del wip_schedule.event.current_schedule
+        self.event.update_published_talks()
 
         if self.event.settings.export_html_on_schedule_release:
             export_schedule_html.apply_async(kwargs={'event_id': self.event.id})
@@ -3,6 +3,8 @@ from urllib.parse import urlparse
 
 import pytz
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 
@@ -30,6 +32,11 @@ class TalkSlot(LogMixin, models.Model):
 
     class Meta:
         unique_together = (('submission', 'schedule'),)
+        indexes = [
+            models.Index(
+                fields=['schedule', 'is_visible', 'start'], name='talkslot_visible'
+            )
+        ]
 
     def __str__(self):
         """Help when debugging."""
@@ -78,12 +85,31 @@ class TalkSlot(LogMixin, models.Model):
     def warnings(self):
         if not self.start:
             return []
+        speakers = []
+        for speaker in self.submission.speakers.all():
+            profile = speaker.event_profile(event=self.submission.event)
+            speakers.append(
+                (speaker.pk, speaker.get_display_name(), profile.availabilities.all())
+            )
+        return self.build_warnings(
+            availability=self.as_availability,
+            room_availabilities=self.room.availabilities.all() if self.room else None,
+            speakers=speakers,
+        )
+
+    @staticmethod
+    def build_warnings(*, availability, room_availabilities, speakers):
+        """Checks a scheduled slot against pre-loaded availabilities.
+
+        ``room_availabilities`` is ``None`` for unassigned slots, and
+        ``speakers`` is a list of ``(id, display name, availabilities)`` tuples.
+        Speakers without any availabilities are considered to be always available.
+        """
         warnings = []
-        availability = self.as_availability
-        if self.room:
+        if room_availabilities is not None:
             if not any(
                 room_availability.contains(availability)
-                for room_availability in self.room.availabilities.all()
+                for room_availability in room_availabilities
             ):
                 warnings.append(
                     {
@@ -93,19 +119,16 @@ class TalkSlot(LogMixin, models.Model):
                         ),
                     }
                 )
-        for speaker in self.submission.speakers.all():
-            profile = speaker.event_profile(event=self.submission.event)
-            if profile.availabilities.exists() and not any(
+        for speaker_id, speaker_name, speaker_availabilities in speakers:
+            speaker_availabilities = list(speaker_availabilities)
+            if speaker_availabilities and not any(
                 speaker_availability.contains(availability)
-                for speaker_availability in profile.availabilities.all()
+                for speaker_availability in speaker_availabilities
             ):
                 warnings.append(
                     {
                         'type': 'speaker',
-                        'speaker': {
-                            'name': speaker.get_display_name(),
-                            'id': speaker.pk,
-                        },
+                        'speaker': {'name': speaker_name, 'id': speaker_id},
                         'message': _(
                             'A speaker is not available at the scheduled time.'
                         ),
@@ -142,3 +165,11 @@ class TalkSlot(LogMixin, models.Model):
         vevent.add('dtend').value = self.end.astimezone(tz)
         vevent.add('description').value = self.submission.abstract or ""
         vevent.add('url').value = self.submission.urls.public.full()
+
+
+@receiver(post_save, sender=TalkSlot)
+@receiver(post_delete, sender=TalkSlot)
+def _update_published_talks_on_change(sender, instance, raw=False, **kwargs):
+    # Released schedules only change in exceptional cases, e.g. on import
+    if not raw and instance.schedule.version:
+        instance.schedule.event.update_published_talks()
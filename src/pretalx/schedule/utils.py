@@ -26,6 +26,7 @@ def process_frab(root, event):
         raise Exception(f'Could not import "{event.name}" schedule version "{schedule_version}": failed creating schedule release.')
 
     schedule.talks.update(is_visible=True)
+    event.update_published_talks()
     start = schedule.talks.order_by('start').first().start
     end = schedule.talks.order_by('-end').first().end
     event.date_from = start.date()
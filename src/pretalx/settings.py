@@ -165,7 +165,8 @@ LOGGING = {
     'formatters': {
         'default': {
             'format': '%(levelname)s %(asctime)s %(name)s %(module)s %(message)s'
-        }
+        },
+        'json': {'()': 'pretalx.common.slowlog.JSONFormatter'},
     },
     'handlers': {
         'console': {
@@ -179,6 +180,12 @@ LOGGING = {
             'filename': os.path.join(LOG_DIR, 'pretalx.log'),
             'formatter': 'default',
         },
+        'slow': {
+            'level': 'WARNING',
+            'class': 'logging.FileHandler',
+            'filename': os.path.join(LOG_DIR, 'slow.log'),
+            'formatter': 'json',
+        },
     },
     'loggers': {
         '': {'handlers': ['file', 'console'], 'level': loglevel, 'propagate': True},
@@ -197,6 +204,7 @@ LOGGING = {
             'level': 'INFO',  # Do not output all the queries
             'propagate': True,
         },
+        'pretalx.slow': {'handlers': ['slow'], 'level': 'WARNING', 'propagate': False},
     },
 }
 
@@ -209,6 +217,12 @@ if ADMINS:
         'class': 'django.utils.log.AdminEmailHandler',
     }
 
+SLOW_REQUEST_SECONDS = config.getfloat('logging', 'slow_requests')
+SLOW_QUERY_SECONDS = config.getfloat('logging', 'slow_queries')
+
+METRICS_TOKEN = config.get('metrics', 'token')
+METRICS_ENABLED = bool(METRICS_TOKEN)
+
 
 ## EMAIL SETTINGS
 MAIL_FROM = SERVER_EMAIL = DEFAULT_FROM_EMAIL = config.get('mail', 'from')
@@ -227,6 +241,7 @@ else:
 CACHES = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
 REAL_CACHE_USED = False
 SESSION_ENGINE = None
+PAGE_CACHE_TIMEOUT = config.getint('site', 'page_cache')
 
 HAS_MEMCACHED = bool(os.getenv('PRETALX_MEMCACHE', ''))
 if HAS_MEMCACHED:
@@ -310,12 +325,15 @@ AUTH_PASSWORD_VALIDATORS = [
 
 ## MIDDLEWARE SETTINGS
 MIDDLEWARE = [
+    'pretalx.common.middleware.MetricsMiddleware',  # Measures everything below
+    'pretalx.common.middleware.SlowLogMiddleware',  # Logs slow requests and queries below
     'django.middleware.security.SecurityMiddleware',  # Security first
     'whitenoise.middleware.WhiteNoiseMiddleware',  # Next up: static files
     'django.middleware.common.CommonMiddleware',  # Set some sensible defaults, now, before responses are modified
     'pretalx.common.middleware.SessionMiddleware',  # Add session handling
     'django.contrib.auth.middleware.AuthenticationMiddleware',  # Uses sessions
     'pretalx.common.auth.AuthenticationTokenMiddleware',  # Make auth tokens work
+    'pretalx.common.middleware.ProfilingMiddleware',  # Needs the user, profiles everything below
     'pretalx.common.middleware.MultiDomainMiddleware',  # Check which host is used and if it is valid
     'pretalx.common.middleware.EventPermissionMiddleware',  # Sets locales, request.event, available events, etc.
     'pretalx.common.middleware.CsrfViewMiddleware',  # Protect against CSRF attacks before forms/data are processed
@@ -427,7 +445,7 @@ REST_FRAMEWORK = {
     ),
     # 'DEFAULT_PERMISSION_CLASSES': ('pretalx.api.permissions.ApiPermission',)
     'DEFAULT_FILTER_BACKENDS': (
-        'rest_framework.filters.SearchFilter',
+        'pretalx.api.filters.SearchIndexFilter',
         'django_filters.rest_framework.DjangoFilterBackend',
     ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.LimitOffsetPagination',
@@ -0,0 +1,30 @@
+/* The schedule grid is cached for all visitors, so everything that depends
+ * on the current time, user or search is applied here. */
+function updateActiveTalks (talks) {
+  const now = new Date()
+  talks.forEach(function (talk) {
+    const start = new Date(talk.dataset.start)
+    const end = new Date(talk.dataset.end)
+    talk.classList.toggle('active', start <= now && now <= end)
+  })
+}
+
+document.addEventListener('DOMContentLoaded', function () {
+  const schedule = document.querySelector('#fahrplan')
+  if (!schedule) return
+  const talks = Array.from(schedule.querySelectorAll('.talk[data-start]'))
+  const user = schedule.dataset.user
+  const search = (schedule.dataset.search || '').toLowerCase()
+
+  talks.forEach(function (talk) {
+    if (user && talk.dataset.speakers.split(' ').indexOf(user) >= 0) {
+      talk.classList.add('talk-personal')
+    }
+    if (search) {
+      const hit = talk.title.toLowerCase().indexOf(search) >= 0
+      talk.classList.add(hit ? 'search-hit' : 'search-fail')
+    }
+  })
+  updateActiveTalks(talks)
+  setInterval(function () { updateActiveTalks(talks) }, 60 * 1000)
+})
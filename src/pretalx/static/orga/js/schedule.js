@@ -1,6 +1,6 @@
 var api = {
   cache: {},
-  http (verb, url, body) {
+  http (verb, url, body, keepalive=false) {
     var fullHeaders = {}
     fullHeaders['Content-Type'] = 'application/json'
     fullHeaders['X-CSRFToken'] = getCookie('pretalx_csrftoken')
@@ -9,7 +9,8 @@ var api = {
       method: verb || 'GET',
       headers: fullHeaders,
       credentials: 'include',
-      body: body && JSON.stringify(body)
+      body: body && JSON.stringify(body),
+      keepalive: keepalive,
     }
     return window.fetch(url, options).then((response) => {
       if (response.status === 204) {
@@ -44,15 +45,71 @@ var api = {
 
     return api.cache[url];
   },
-  saveTalk(talk) {
-    var url = [window.location.protocol, '//', window.location.host, window.location.pathname, `api/talks/${talk.id}/`, window.location.search].join('')
-    return api.http('PATCH', url, {
-      room: talk.room,
-      start: talk.start,
+  saveTalks(talks, keepalive=false) {
+    var url = [window.location.protocol, '//', window.location.host, window.location.pathname, 'api/talks/batch/', window.location.search].join('')
+    return api.http('PATCH', url, talks.map((talk) => {
+      return {id: talk.id, room: talk.room, start: talk.start}
+    }), keepalive)
+  }
+}
+
+// Moves are collected for a moment and saved together, so that rearranging
+// many talks does not send one request per talk.
+var saveQueue = {
+  talks: {},
+  timeout: null,
+
+  add (talk) {
+    this.talks[talk.id] = talk
+    window.clearTimeout(this.timeout)
+    this.timeout = window.setTimeout(() => this.flush(), 500)
+  },
+  flush (keepalive=false) {
+    var talks = Object.values(this.talks)
+    this.talks = {}
+    window.clearTimeout(this.timeout)
+    this.timeout = null
+    if (!talks.length) {
+      return Promise.resolve()
+    }
+    return api.saveTalks(talks, keepalive).then((response) => {
+      app.saveError = null
+      response.results.forEach((result) => {
+        app.talks.forEach((talk, index) => {
+          if (talk.id == result.id) {
+            Object.assign(app.talks[index], result)
+          }
+        })
+      })
+    }).catch((error) => {
+      if (error && error.response) {
+        // The server rejected the moves, so sending them again would not help
+        app.saveError = 'Your last changes could not be saved. Please reload the page to see the current schedule.'
+        return
+      }
+      // Failed requests are sent again with the next move, unless the talk
+      // has been moved again in the meantime
+      talks.forEach((talk) => {
+        if (!this.talks[talk.id]) {
+          this.talks[talk.id] = talk
+        }
+      })
+      app.saveError = 'Your last changes could not be saved yet. They will be saved with your next change.'
     })
   }
 }
 
+window.addEventListener('beforeunload', (event) => {
+  if (app.saveError) {
+    // Ask before leaving, as the last changes may not have been saved
+    event.preventDefault()
+    event.returnValue = ''
+  }
+  // Regular requests may be cancelled when the page is left, keepalive
+  // requests are sent anyway
+  saveQueue.flush(true)
+})
+
 var dragController = {
   draggedTalk: null,
   event: null,
@@ -254,6 +311,7 @@ var app = new Vue({
   el: '#fahrplan',
   template: `
     <div @mousemove="onMouseMove" @mouseup="onMouseUp">
+      <div class="alert alert-danger" id="save-error" v-if="saveError">{{ saveError }}</div>
       <div id="fahrplan">
         <talk ref="draggedTalk" v-if="dragController.draggedTalk && dragController.event" :talk="dragController.draggedTalk" :key="dragController.draggedTalk.id" :is-dragged="true"></talk>
         <div id="timeline">
@@ -290,6 +348,7 @@ var app = new Vue({
       end: null,
       timezone: null,
       search: '',
+      saveError: null,
       dragController: dragController,
     }
   },
@@ -361,13 +420,13 @@ var app = new Vue({
     onMouseUp (event) {
       if (dragController.draggedTalk) {
         if (dragController.event) {
-          api.saveTalk(dragController.draggedTalk).then((response) => {
-            this.talks.forEach((talk, index) => {
-              if (talk.id == response.id) {
-                Object.assign(this.talks[index], response)
-              }
-            })
+          var moved = dragController.draggedTalk
+          this.talks.forEach((talk, index) => {
+            if (talk.id == moved.id) {
+              Object.assign(this.talks[index], {room: moved.room, start: moved.start})
+            }
           })
+          saveQueue.add({id: moved.id, room: moved.room, start: moved.start})
         } else {
           window.open(dragController.draggedTalk.url)
           dragController.stopDragging()
@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.db import migrations, models
+
+
+def count_reviews(apps, schema_editor):
+    Review = apps.get_model('submission', 'Review')
+    Submission = apps.get_model('submission', 'Submission')
+    counts = (
+        Review.objects.order_by()
+        .values('submission')
+        .annotate(count=models.Count('pk'))
+        .values_list('submission', 'count')
+    )
+    for submission_id, count in counts:
+        Submission.objects.filter(pk=submission_id).update(review_count=count)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('submission', '0028_auto_20180922_0511'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='submission',
+            name='assigned_reviewers',
+            field=models.ManyToManyField(blank=True, related_name='assigned_reviews', to=settings.AUTH_USER_MODEL, verbose_name='Assigned reviewers'),
+        ),
+        migrations.AddField(
+            model_name='submission',
+            name='review_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['event', 'state', 'review_count'], name='submission_review_queue'),
+        ),
+        migrations.RunPython(count_reviews, migrations.RunPython.noop),
+    ]
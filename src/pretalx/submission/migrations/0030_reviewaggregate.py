@@ -0,0 +1,51 @@
+import statistics
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def build_aggregates(apps, schema_editor):
+    Review = apps.get_model('submission', 'Review')
+    ReviewAggregate = apps.get_model('submission', 'ReviewAggregate')
+    reviews = {}
+    for submission_id, score, override in Review.objects.values_list(
+        'submission_id', 'score', 'override_vote'
+    ):
+        reviews.setdefault(submission_id, []).append((score, override))
+    for submission_id, values in reviews.items():
+        scores = [score for score, _ in values if score is not None]
+        overrides = [override for _, override in values]
+        ReviewAggregate.objects.create(
+            submission_id=submission_id,
+            score_count=len(scores),
+            mean_score=statistics.mean(scores) if scores else None,
+            median_score=statistics.median(scores) if scores else None,
+            score_deviation=statistics.pstdev(scores) if scores else None,
+            positive_overrides=overrides.count(True),
+            negative_overrides=overrides.count(False),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('submission', '0029_review_queue'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReviewAggregate',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score_count', models.PositiveIntegerField(default=0)),
+                ('mean_score', models.FloatField(blank=True, null=True)),
+                ('median_score', models.FloatField(blank=True, null=True)),
+                ('score_deviation', models.FloatField(blank=True, null=True)),
+                ('positive_overrides', models.PositiveIntegerField(default=0)),
+                ('negative_overrides', models.PositiveIntegerField(default=0)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('submission', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='review_aggregate', to='submission.Submission')),
+            ],
+        ),
+        migrations.RunPython(build_aggregates, migrations.RunPython.noop),
+    ]
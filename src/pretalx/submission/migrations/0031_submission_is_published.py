@@ -0,0 +1,45 @@
+from django.db import migrations, models
+
+
+def mark_published(apps, schema_editor):
+    Event = apps.get_model('event', 'Event')
+    SpeakerProfile = apps.get_model('person', 'SpeakerProfile')
+    Submission = apps.get_model('submission', 'Submission')
+    for event in Event.objects.all():
+        schedule = (
+            event.schedules.filter(published__isnull=False)
+            .order_by('-published')
+            .first()
+        )
+        if not schedule:
+            continue
+        submissions = Submission.objects.filter(
+            event=event,
+            pk__in=schedule.talks.filter(is_visible=True).values('submission'),
+        )
+        submissions.update(is_published=True)
+        SpeakerProfile.objects.filter(
+            event=event, user__submissions__in=submissions
+        ).update(is_published=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('person', '0021_speakerprofile_is_published'),
+        ('schedule', '0011_auto_20180205_1127'),
+        ('submission', '0030_reviewaggregate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='submission',
+            name='is_published',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['event', 'is_published'], name='submission_published'),
+        ),
+        migrations.RunPython(mark_published, migrations.RunPython.noop),
+    ]
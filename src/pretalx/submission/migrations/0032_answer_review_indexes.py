@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('submission', '0031_submission_is_published'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['question', 'submission'], name='answer_question_submission'),
+        ),
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['question', 'person'], name='answer_question_person'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['submission', 'user'], name='review_submission_user'),
+        ),
+    ]
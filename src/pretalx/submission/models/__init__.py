@@ -2,7 +2,7 @@ from .cfp import CfP
 from .feedback import Feedback
 from .question import Answer, AnswerOption, Question, QuestionTarget, QuestionVariant
 from .resource import Resource
-from .review import Review
+from .review import Review, ReviewAggregate
 from .submission import Submission, SubmissionError, SubmissionStates
 from .track import Track
 from .type import SubmissionType
@@ -17,6 +17,7 @@ __all__ = [
     'QuestionVariant',
     'Resource',
     'Review',
+    'ReviewAggregate',
     'Submission',
     'SubmissionError',
     'SubmissionStates',
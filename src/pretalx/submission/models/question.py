@@ -215,6 +215,14 @@ class Answer(LogMixin, models.Model):
         to='submission.AnswerOption', related_name='answers'
     )
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['question', 'submission'], name='answer_question_submission'
+            ),
+            models.Index(fields=['question', 'person'], name='answer_question_person'),
+        ]
+
     @cached_property
     def event(self):
         return self.question.event
@@ -1,9 +1,18 @@
+import statistics
+
 from django.db import models
+from django.db.models.functions import Cast
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 
 from pretalx.common.urls import EventUrls
 
+# Prime numbers, so that the review order visits every submission
+REVIEW_ORDER_FACTOR = 7919
+REVIEW_ORDER_MODULUS = 1000003
+
 
 class Review(models.Model):
     submission = models.ForeignKey(
@@ -18,22 +27,59 @@ class Review(models.Model):
     created = models.DateTimeField(auto_now_add=True)
     updated = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['submission', 'user'], name='review_submission_user')
+        ]
+
     def __str__(self):
         return f'Review(event={self.submission.event.slug}, submission={self.submission.title}, user={self.user.get_display_name}, score={self.score})'
 
     @classmethod
     def find_missing_reviews(cls, event, user, ignore=None):
+        """
+        Returns all submissions the user still has to review, starting with
+        the submissions with the fewest reviews.
+        """
         from pretalx.submission.models import SubmissionStates
 
         queryset = (
             event.submissions.filter(state=SubmissionStates.SUBMITTED)
             .exclude(reviews__user=user)
             .exclude(speakers__in=[user])
-            .annotate(review_count=models.Count('reviews'))
         )
         if ignore:
             queryset = queryset.exclude(pk__in=[submission.pk for submission in ignore])
-        return queryset.order_by('review_count', '?')
+        return queryset.order_by('review_count', 'pk')
+
+    @classmethod
+    def find_next_submission(cls, event, user, ignore=None):
+        """
+        Returns the submission the user should review next, or ``None``.
+
+        Submissions explicitly assigned to the user come first. Otherwise, we
+        pick one of the submissions with the fewest reviews – in an order that
+        is stable for each reviewer, but differs between reviewers, so that
+        reviewers working at the same time do not all get the same submission.
+        """
+        missing_reviews = cls.find_missing_reviews(event, user, ignore=ignore)
+        # Scrambles the submissions, starting at a different place per reviewer
+        review_order = (
+            Cast('pk', models.BigIntegerField()) * REVIEW_ORDER_FACTOR
+            + user.pk * REVIEW_ORDER_FACTOR ** 2 % REVIEW_ORDER_MODULUS
+        ) % REVIEW_ORDER_MODULUS
+        for queryset in (
+            missing_reviews.filter(assigned_reviewers=user),
+            missing_reviews,
+        ):
+            submission = (
+                queryset.annotate(review_order=review_order)
+                .order_by('review_count', 'review_order')
+                .first()
+            )
+            if submission:
+                return submission
+        return None
 
     @cached_property
     def event(self):
@@ -54,3 +100,81 @@ class Review(models.Model):
     class urls(EventUrls):
         base = '{self.submission.orga_urls.reviews}'
         delete = '{base}/{self.pk}/delete'
+
+
+class ReviewAggregate(models.Model):
+    """
+    Holds the review statistics of a submission, so that they can be used for
+    sorting and filtering without aggregating over all reviews. It is updated
+    whenever a review of the submission is saved or deleted.
+    """
+
+    submission = models.OneToOneField(
+        to='submission.Submission',
+        related_name='review_aggregate',
+        on_delete=models.CASCADE,
+    )
+    score_count = models.PositiveIntegerField(default=0)
+    mean_score = models.FloatField(null=True, blank=True)
+    median_score = models.FloatField(null=True, blank=True)
+    score_deviation = models.FloatField(null=True, blank=True)
+    positive_overrides = models.PositiveIntegerField(default=0)
+    negative_overrides = models.PositiveIntegerField(default=0)
+    updated = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f'ReviewAggregate(submission={self.submission_id})'
+
+    @property
+    def has_override(self):
+        return bool(self.positive_overrides or self.negative_overrides)
+
+    @staticmethod
+    def compute(reviews):
+        """Takes an iterable of (score, override_vote) tuples."""
+        reviews = list(reviews)
+        scores = [score for score, _ in reviews if score is not None]
+        overrides = [override for _, override in reviews]
+        return {
+            'score_count': len(scores),
+            'mean_score': statistics.mean(scores) if scores else None,
+            'median_score': statistics.median(scores) if scores else None,
+            'score_deviation': statistics.pstdev(scores) if scores else None,
+            'positive_overrides': overrides.count(True),
+            'negative_overrides': overrides.count(False),
+        }
+
+    @classmethod
+    def refresh(cls, submission_id, create=True):
+        values = cls.compute(
+            Review.objects.filter(submission_id=submission_id).values_list(
+                'score', 'override_vote'
+            )
+        )
+        if create:
+            cls.objects.update_or_create(submission_id=submission_id, defaults=values)
+        else:
+            cls.objects.filter(submission_id=submission_id).update(**values)
+
+
+@receiver(post_save, sender=Review)
+def _update_counts_on_review_save(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        from pretalx.submission.models import Submission
+
+        Submission.all_objects.filter(pk=instance.submission_id).update(
+            review_count=models.F('review_count') + 1
+        )
+    if not raw:
+        ReviewAggregate.refresh(instance.submission_id)
+
+
+@receiver(post_delete, sender=Review)
+def _update_counts_on_review_delete(sender, instance, **kwargs):
+    from pretalx.submission.models import Submission
+
+    Submission.all_objects.filter(
+        pk=instance.submission_id, review_count__gt=0
+    ).update(review_count=models.F('review_count') - 1)
+    # The aggregate may already be gone if the submission is being deleted
+    ReviewAggregate.refresh(instance.submission_id, create=False)
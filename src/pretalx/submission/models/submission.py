@@ -3,7 +3,10 @@ import string
 import uuid
 
 from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
 from django.utils.crypto import get_random_string
 from django.utils.functional import cached_property
 from django.utils.timezone import now
@@ -169,12 +172,32 @@ class Submission(LogMixin, models.Model):
     review_code = models.CharField(
         max_length=32, unique=True, null=True, blank=True, default=generate_invite_code
     )
+    review_count = models.PositiveIntegerField(default=0, editable=False)
+    # Part of the current schedule, see Event.update_published_talks
+    is_published = models.BooleanField(default=False, editable=False)
+    assigned_reviewers = models.ManyToManyField(
+        to='person.User',
+        related_name='assigned_reviews',
+        blank=True,
+        verbose_name=_('Assigned reviewers'),
+    )
     CODE_CHARSET = list('ABCDEFGHJKLMNPQRSTUVWXYZ3789')
 
     objects = SubmissionManager()
     deleted_objects = DeletedSubmissionManager()
     all_objects = AllSubmissionManager()
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['event', 'state', 'review_count'],
+                name='submission_review_queue',
+            ),
+            models.Index(
+                fields=['event', 'is_published'], name='submission_published'
+            ),
+        ]
+
     class urls(EventUrls):
         user_base = '{self.event.urls.user_submissions}/{self.code}'
         withdraw = '{user_base}/withdraw'
@@ -216,6 +239,13 @@ class Submission(LogMixin, models.Model):
                 self.code = code
                 return
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remembered to notice state changes on save
+        instance._loaded_state = instance.__dict__.get('state')
+        return instance
+
     def save(self, *args, **kwargs):
         if not self.code:
             self.assign_code()
@@ -433,7 +463,10 @@ class Submission(LogMixin, models.Model):
 
     @property
     def average_score(self):
-        return self.reviews.all().aggregate(avg=models.Avg('score'))['avg']
+        try:
+            return self.review_aggregate.mean_score
+        except ObjectDoesNotExist:  # The aggregate is created with the first review
+            return None
 
     @property
     def active_resources(self):
@@ -469,3 +502,39 @@ class Submission(LogMixin, models.Model):
             person__in=self.speaker_profiles
         )
         return Availability.intersection(all_availabilities)
+
+
+def _is_published(submission):
+    # The flag is set with UPDATE queries, so the instance may be outdated
+    return Submission.all_objects.filter(pk=submission.pk, is_published=True).exists()
+
+
+@receiver(post_save, sender=Submission)
+def _update_published_speakers_on_save(
+    sender, instance, created, update_fields, raw=False, **kwargs
+):
+    # Deleting or restoring a published talk changes the published speakers.
+    # Changes of the speakers are handled on m2m_changed.
+    if raw or (update_fields and 'state' not in update_fields):
+        return
+    state_changed = getattr(instance, '_loaded_state', None) != instance.state
+    instance._loaded_state = instance.state
+    if state_changed and not created and _is_published(instance):
+        instance.event.update_published_speakers()
+
+
+@receiver(m2m_changed, sender=Submission.speakers.through)
+def _update_published_speakers_on_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if not action.startswith('post_'):
+        return
+    if not reverse:
+        if _is_published(instance):
+            instance.event.update_published_speakers()
+        return
+    submissions = Submission.all_objects.filter(
+        pk__in=pk_set or [], is_published=True
+    ).select_related('event')
+    for event in {submission.event for submission in submissions}:
+        event.update_published_speakers()
@@ -0,0 +1,229 @@
+import csv
+import io
+import json
+import statistics
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+
+from pretalx.common.cache import get_event_data_version
+
+REVIEW_STATISTICS_KEY = 'pretalx_review_statistics_{event_id}_{version}'
+REVIEW_STATISTICS_TIMEOUT = 60 * 60 * 24
+REVIEW_STATISTICS_TASK_TIMEOUT = 60 * 10
+# Above this number of reviews, statistics are built in a background task
+REVIEW_STATISTICS_SYNC_LIMIT = 2000
+
+SUBMISSION_FIELDS = (
+    'code',
+    'title',
+    'state',
+    'rank',
+    'review_count',
+    'score_count',
+    'mean_score',
+    'median_score',
+    'score_deviation',
+    'min_score',
+    'max_score',
+    'mean_z_score',
+    'positive_overrides',
+    'negative_overrides',
+    'coverage',
+    'distribution',
+)
+REVIEWER_FIELDS = (
+    'name',
+    'email',
+    'review_count',
+    'score_count',
+    'mean_score',
+    'median_score',
+    'score_deviation',
+    'min_score',
+    'max_score',
+    'coverage',
+    'distribution',
+)
+
+
+def _describe(scores):
+    return {
+        'score_count': len(scores),
+        'mean_score': statistics.mean(scores) if scores else None,
+        'median_score': statistics.median(scores) if scores else None,
+        'score_deviation': statistics.pstdev(scores) if scores else None,
+        'min_score': min(scores) if scores else None,
+        'max_score': max(scores) if scores else None,
+        'distribution': dict(sorted(Counter(scores).items())),
+    }
+
+
+def _ratio(count, total):
+    return round(count / total, 3) if total else None
+
+
+def build_review_statistics(event) -> dict:
+    """
+    Builds per-submission and per-reviewer review statistics for an event.
+
+    All reviews are loaded in a single query. To make scores comparable across
+    reviewers, every score is also normalized to a z-score using the mean and
+    standard deviation of its reviewer, and submissions are ranked by their
+    mean z-score.
+    """
+    from pretalx.person.models import User
+    from pretalx.submission.models import Review, Submission, SubmissionStates
+
+    submissions = list(
+        Submission.objects.filter(event=event)
+        .order_by('pk')
+        .values('pk', 'code', 'title', 'state')
+    )
+    reviews = list(
+        Review.objects.filter(submission__event=event)
+        .exclude(submission__state=SubmissionStates.DELETED)
+        .order_by('pk')
+        .values_list('submission_id', 'user_id', 'score', 'override_vote')
+    )
+    team_reviewers = set(
+        User.objects.filter(
+            teams__in=event.teams.filter(is_reviewer=True)
+        ).values_list('pk', flat=True)
+    )
+
+    reviewer_scores = defaultdict(list)
+    reviewer_reviews = Counter()
+    for _, user_id, score, _ in reviews:
+        reviewer_reviews[user_id] += 1
+        if score is not None:
+            reviewer_scores[user_id].append(score)
+    reviewer_stats = {
+        user_id: _describe(reviewer_scores[user_id]) for user_id in reviewer_reviews
+    }
+
+    submission_reviews = defaultdict(list)
+    for submission_id, user_id, score, override in reviews:
+        z_score = None
+        if score is not None:
+            stats = reviewer_stats[user_id]
+            deviation = stats['score_deviation']
+            z_score = (score - stats['mean_score']) / deviation if deviation else 0.0
+        submission_reviews[submission_id].append((score, z_score, override))
+
+    reviewer_count = len(team_reviewers | set(reviewer_reviews))
+    submission_rows = []
+    for submission in submissions:
+        entries = submission_reviews.get(submission['pk'], [])
+        scores = [score for score, _, _ in entries if score is not None]
+        z_scores = [z_score for _, z_score, _ in entries if z_score is not None]
+        overrides = [override for _, _, override in entries]
+        row = {
+            'code': submission['code'],
+            'title': submission['title'],
+            'state': submission['state'],
+            'review_count': len(entries),
+            'mean_z_score': statistics.mean(z_scores) if z_scores else None,
+            'positive_overrides': overrides.count(True),
+            'negative_overrides': overrides.count(False),
+            'coverage': _ratio(len(entries), reviewer_count),
+        }
+        row.update(_describe(scores))
+        submission_rows.append(row)
+    submission_rows.sort(
+        key=lambda row: (row['mean_z_score'] is None, -(row['mean_z_score'] or 0))
+    )
+    for rank, row in enumerate(submission_rows, start=1):
+        row['rank'] = rank if row['mean_z_score'] is not None else None
+
+    users = (
+        User.objects.filter(pk__in=reviewer_reviews)
+        .order_by('name', 'email')
+        .values_list('pk', 'name', 'email')
+    )
+    reviewer_rows = []
+    for user_id, name, email in users:
+        row = {
+            'name': name,
+            'email': email,
+            'review_count': reviewer_reviews[user_id],
+            'coverage': _ratio(reviewer_reviews[user_id], len(submissions)),
+        }
+        row.update(reviewer_stats[user_id])
+        reviewer_rows.append(row)
+
+    return {
+        'submissions': submission_rows,
+        'reviewers': reviewer_rows,
+        'summary': {
+            'submission_count': len(submissions),
+            'reviewed_submission_count': len(submission_reviews),
+            'review_count': len(reviews),
+            'reviewer_count': reviewer_count,
+            'active_reviewer_count': len(reviewer_reviews),
+        },
+    }
+
+
+def _get_key(event):
+    return REVIEW_STATISTICS_KEY.format(
+        event_id=event.pk, version=get_event_data_version(event)
+    )
+
+
+def cache_review_statistics(event) -> dict:
+    key = _get_key(event)  # Before building, so that changes in between count
+    data = build_review_statistics(event)
+    cache.set(key, data, REVIEW_STATISTICS_TIMEOUT)
+    return data
+
+
+def get_review_statistics(event):
+    """
+    Returns the review statistics of an event, see
+    :func:`build_review_statistics`.
+
+    Results are cached until the next change to the event's data. For events
+    with many reviews, the statistics are built in a background task if
+    possible – in that case, ``None`` is returned until they are ready.
+    """
+    from pretalx.submission.models import Review
+    from pretalx.submission.tasks import task_build_review_statistics
+
+    key = _get_key(event)
+    data = cache.get(key)
+    if data is not None:
+        return data
+    if (
+        settings.HAS_CELERY
+        and settings.REAL_CACHE_USED
+        and Review.objects.filter(submission__event=event).count()
+        > REVIEW_STATISTICS_SYNC_LIMIT
+    ):
+        if cache.add(f'{key}_pending', True, REVIEW_STATISTICS_TASK_TIMEOUT):
+            task_build_review_statistics.apply_async(kwargs={'event_id': event.pk})
+        return None
+    return cache_review_statistics(event)
+
+
+def serialize_review_statistics(data, kind='submissions', file_format='csv'):
+    """
+    Returns the submission or reviewer rows of the review statistics as
+    ``(content, content_type)`` in CSV or JSON format.
+    """
+    rows = data[kind]
+    if file_format == 'json':
+        content = json.dumps({'summary': data['summary'], kind: rows}, indent=2)
+        return content, 'application/json'
+    output = io.StringIO()
+    fields = SUBMISSION_FIELDS if kind == 'submissions' else REVIEWER_FIELDS
+    writer = csv.DictWriter(output, fieldnames=fields, extrasaction='ignore')
+    writer.writeheader()
+    for row in rows:
+        row = dict(row)
+        row['distribution'] = ' '.join(
+            f'{score}:{count}' for score, count in row['distribution'].items()
+        )
+        writer.writerow(row)
+    return output.getvalue(), 'text/csv'
@@ -0,0 +1,19 @@
+import logging
+
+from pretalx.celery_app import app
+from pretalx.event.models import Event
+
+LOGGER = logging.getLogger(__name__)
+
+
+@app.task()
+def task_build_review_statistics(*, event_id: int):
+    from pretalx.submission.review_statistics import cache_review_statistics
+
+    event = Event.objects.filter(pk=event_id).first()
+    if not event:
+        LOGGER.error(
+            f'In task_build_review_statistics: Could not find Event ID {event_id}'
+        )
+        return
+    cache_review_statistics(event)
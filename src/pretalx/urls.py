@@ -6,6 +6,8 @@ from django.conf import settings
 from django.conf.urls import include, url
 from django.conf.urls.static import static
 
+from pretalx.common.views import serve_metrics
+
 plugin_patterns = []
 for app in apps.get_app_configs():
     if hasattr(app, 'PretalxPluginMeta'):
@@ -19,6 +21,7 @@ for app in apps.get_app_configs():
             )
 
 urlpatterns = [
+    url(r'^metrics$', serve_metrics, name='metrics'),
     url(r'^orga/', include('pretalx.orga.urls', namespace='orga')),
     url(r'^api/', include('pretalx.api.urls', namespace='api')),
     url(r'', include('pretalx.agenda.urls', namespace='agenda')),
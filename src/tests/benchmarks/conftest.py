@@ -0,0 +1,66 @@
+import pytest
+
+from pretalx.event.generate import generate_event
+from pretalx.event.models import Event, Organiser, Team
+from pretalx.person.models import User
+
+BENCHMARK_SLUG = 'benchmark'
+BENCHMARK_COUNTS = {
+    'submissions': 2000,
+    'speakers': 1600,
+    'reviewers': 30,
+    'reviews': 10000,
+    'questions': 4,
+    'rooms': 10,
+    'availabilities': 2,
+    'schedules': 3,
+    'mails': 2000,
+    'days': 4,
+}
+
+
+@pytest.fixture(scope='session')
+def benchmark_data(django_db_setup, django_db_blocker):
+    """
+    Generates a large event once per test database. It is kept when the test
+    database is reused, so that only the first run has to generate it.
+    """
+    with django_db_blocker.unblock():
+        event = Event.objects.filter(slug=BENCHMARK_SLUG).first()
+        if not event:
+            organiser = Organiser.objects.create(name='Benchmarks', slug='benchmarks')
+            event = generate_event(
+                organiser, BENCHMARK_SLUG, seed=0, **BENCHMARK_COUNTS
+            )
+            team = Team.objects.create(
+                organiser=organiser,
+                name='Benchmark organisers',
+                all_events=True,
+                can_change_event_settings=True,
+                can_change_organiser_settings=True,
+                can_change_submissions=True,
+                can_change_teams=True,
+                can_create_events=True,
+                is_reviewer=True,
+            )
+            team.members.add(
+                User.objects.create_user(
+                    password='benchmark', email='orga@benchmark.example.org'
+                )
+            )
+        return {
+            'event': event.pk,
+            'user': User.objects.get(email='orga@benchmark.example.org').pk,
+        }
+
+
+@pytest.fixture
+def big_event(benchmark_data):
+    # Fetched for every test, so that no cached properties leak between tests
+    return Event.objects.get(pk=benchmark_data['event'])
+
+
+@pytest.fixture
+def big_orga_client(benchmark_data, client):
+    client.force_login(User.objects.get(pk=benchmark_data['user']))
+    return client
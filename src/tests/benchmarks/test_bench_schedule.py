@@ -0,0 +1,91 @@
+import xml.etree.ElementTree as ET
+
+import pytest
+from tests.benchmarks.utils import rolled_back
+
+from pretalx.event.models import Event
+from pretalx.schedule.exporters import (
+    FrabJsonExporter, FrabXCalExporter, FrabXmlExporter, ICalExporter, ScheduleData,
+)
+from pretalx.schedule.models import Availability, Schedule
+from pretalx.schedule.utils import process_frab
+
+
+@pytest.mark.django_db
+def test_bench_schedule_data(benchmark, big_event):
+    schedule = big_event.current_schedule
+    data = benchmark(lambda: ScheduleData(big_event, schedule).data)
+    assert data
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'exporter', (FrabXmlExporter, FrabXCalExporter, FrabJsonExporter, ICalExporter)
+)
+def test_bench_exporter_render(benchmark, big_event, exporter):
+    schedule = big_event.current_schedule
+    _, _, content = benchmark(lambda: exporter(big_event, schedule).render())
+    assert content
+
+
+@pytest.mark.django_db
+def test_bench_schedule_freeze(benchmark, big_event):
+    @rolled_back
+    def freeze():
+        schedule = Schedule.objects.get(event=big_event, version__isnull=True)
+        return schedule.freeze('benchmark', notify_speakers=False)
+
+    benchmark.pedantic(freeze, rounds=5)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('attribute', ('changes', 'notifications'))
+def test_bench_schedule_changes(benchmark, big_event, attribute):
+    pk = big_event.current_schedule.pk
+    result = benchmark(lambda: getattr(Schedule.objects.get(pk=pk), attribute))
+    assert result
+
+
+@pytest.mark.django_db
+def test_bench_talk_slot_warnings(benchmark, big_event):
+    room = big_event.rooms.first()
+    slots = big_event.wip_schedule.talks.filter(room=room).select_related(
+        'submission__event', 'room'
+    )
+    warnings = benchmark(lambda: [slot.warnings for slot in slots.all()])
+    assert warnings
+
+
+@pytest.mark.django_db
+def test_bench_availability_intersection(benchmark, big_event):
+    room_availabilities = list(
+        Availability.objects.filter(event=big_event, room__isnull=False)
+    )
+    speaker_availabilities = list(
+        Availability.objects.filter(event=big_event, person__isnull=False)
+    )
+    result = benchmark(
+        Availability.intersection, room_availabilities, speaker_availabilities
+    )
+    assert result
+
+
+@pytest.mark.django_db
+def test_bench_process_frab(benchmark, big_event):
+    _, _, content = FrabXmlExporter(big_event, big_event.current_schedule).render()
+    root = ET.fromstring(content)
+
+    @rolled_back
+    def import_schedule():
+        event = Event.objects.create(
+            name='Imported event',
+            slug='imported',
+            organiser=big_event.organiser,
+            email='orga@imported.example.org',
+            date_from=big_event.date_from,
+            date_to=big_event.date_to,
+        )
+        event.settings.export_html_on_schedule_release = False
+        return process_frab(root, event)
+
+    benchmark.pedantic(import_schedule, rounds=3)
@@ -0,0 +1,26 @@
+import pytest
+from tests.benchmarks.utils import rolled_back
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('endpoint', ('submissions', 'talks', 'speakers', 'schedules'))
+def test_bench_api_list(benchmark, big_event, big_orga_client, endpoint):
+    url = getattr(big_event.api_urls, endpoint)
+    response = benchmark(big_orga_client.get, url, follow=True)
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_bench_review_dashboard(benchmark, big_event, big_orga_client):
+    response = benchmark(big_orga_client.get, big_event.orga_urls.reviews)
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_bench_outbox_send(benchmark, big_event, big_orga_client):
+    assert big_event.queued_mails.filter(sent__isnull=True).exists()
+    send = rolled_back(big_orga_client.post)
+    response = benchmark.pedantic(
+        send, args=(big_event.orga_urls.send_outbox,), rounds=3
+    )
+    assert response.status_code == 302
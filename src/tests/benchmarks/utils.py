@@ -0,0 +1,16 @@
+from django.db import transaction
+
+
+def rolled_back(function):
+    """
+    Wraps ``function`` so that its database changes are rolled back, to
+    benchmark functions that change data in every round.
+    """
+
+    def wrapper(*args, **kwargs):
+        with transaction.atomic():
+            result = function(*args, **kwargs)
+            transaction.set_rollback(True)
+        return result
+
+    return wrapper
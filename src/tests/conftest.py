@@ -2,9 +2,11 @@ import datetime
 
 import pytest
 import pytz
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.utils.timezone import now
 
+from pretalx.common import cache as pretalx_cache
 from pretalx.event.models import Event, Organiser, Team, TeamInvite
 from pretalx.mail.models import MailTemplate
 from pretalx.person.models import SpeakerInformation, SpeakerProfile, User
@@ -15,6 +17,27 @@ from pretalx.submission.models import (
 )
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        '--benchmarks', action='store_true', help='Run the benchmarks, too.'
+    )
+
+
+def pytest_ignore_collect(path, config):
+    # Benchmarks take a while and work on generated data, so we skip them by default
+    if path.basename == 'benchmarks' and not config.getoption('benchmarks', False):
+        return True
+
+
+@pytest.fixture(autouse=True)
+def custom_domains(monkeypatch):
+    # Every process keeps the custom domains for a few seconds. They are
+    # forgotten for every test and kept from expiring during it, so that query
+    # counts depend neither on test order nor on run time.
+    monkeypatch.setattr(pretalx_cache, 'CUSTOM_DOMAINS_LOCAL_TIMEOUT', 60 * 60)
+    pretalx_cache._forget_custom_domains()
+
+
 @pytest.fixture
 def template_patch(monkeypatch):
     # Patch out template rendering for performance improvements
@@ -24,6 +47,20 @@ def template_patch(monkeypatch):
     )
 
 
+@pytest.fixture
+def locmem_cache(settings):
+    # The test settings use a dummy cache, use this fixture to test caching
+    settings.CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'pretalx-tests',
+        }
+    }
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
 @pytest.fixture
 def organiser():
     o = Organiser.objects.create(name='Super Organiser', slug='superorganiser')
@@ -3,6 +3,9 @@ from urllib.parse import quote
 import pytest
 from django.urls import reverse
 
+from pretalx.person.models import SpeakerProfile
+from pretalx.submission.models import Submission
+
 
 @pytest.mark.django_db
 def test_can_see_schedule(client, user, event, slot):
@@ -55,3 +58,48 @@ def test_versioned_schedule_page(client, event, speaker, slot, schedule):
         f'/{event.slug}/schedule?version={version}', follow=True
     )
     assert redirected_response._request.path == response._request.path
+
+
+@pytest.mark.django_db
+def test_schedule_grid_is_cached(locmem_cache, client, orga_client, event, slot):
+    submission = slot.submission
+    response = client.get(event.urls.schedule, follow=True)
+    content = response.content.decode()
+    assert submission.title in content
+    assert 'data-start="' in content
+
+    Submission.objects.filter(pk=submission.pk).update(title='Not cached')
+    response = orga_client.get(event.urls.schedule, follow=True)
+    assert 'Not cached' not in response.content.decode()
+
+    submission.title = 'Updated'
+    submission.save()
+    response = client.get(event.urls.schedule, follow=True)
+    assert 'Updated' in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_speaker_page_is_cached(locmem_cache, settings, client, event, speaker, slot):
+    settings.PAGE_CACHE_TIMEOUT = 60
+    profile = speaker.profiles.get(event=event)
+    url = reverse('agenda:speaker', kwargs={'code': speaker.code, 'event': event.slug})
+    assert profile.biography in client.get(url).content.decode()
+
+    SpeakerProfile.objects.filter(pk=profile.pk).update(biography='Not cached')
+    assert 'Not cached' not in client.get(url).content.decode()
+
+    profile.biography = 'Updated'
+    profile.save()
+    assert 'Updated' in client.get(url).content.decode()
+
+
+@pytest.mark.django_db
+def test_page_cache_ignores_logged_in_users(
+    locmem_cache, settings, orga_client, event, speaker, slot
+):
+    settings.PAGE_CACHE_TIMEOUT = 60
+    profile = speaker.profiles.get(event=event)
+    url = reverse('agenda:speaker', kwargs={'code': speaker.code, 'event': event.slug})
+    assert profile.biography in orga_client.get(url).content.decode()
+    SpeakerProfile.objects.filter(pk=profile.pk).update(biography='Not cached')
+    assert 'Not cached' in orga_client.get(url).content.decode()
@@ -12,6 +12,17 @@ def test_can_see_talk_list(client, event, slot):
     assert slot.submission.title in response.content.decode()
 
 
+@pytest.mark.django_db
+def test_can_search_talk_list(client, event, slot):
+    response = client.get(event.urls.talks + '?q=lametta', follow=True)
+    assert response.status_code == 200
+    assert slot.submission.title in response.content.decode()
+
+    response = client.get(event.urls.talks + '?q=lamettaxxy', follow=True)
+    assert response.status_code == 200
+    assert slot.submission.title not in response.content.decode()
+
+
 @pytest.mark.django_db
 def test_can_see_talk(client, event, slot):
     response = client.get(slot.submission.urls.public, follow=True)
@@ -72,6 +72,81 @@ def test_orga_can_see_all_submissions(
     assert any(submission['answers'] != [] for submission in content['results'])
 
 
+@pytest.mark.django_db
+def test_orga_can_search_submissions(orga_client, submission, other_submission):
+    # Not following the redirect to the URL with a slash, which would break the query
+    response = orga_client.get(submission.event.api_urls.submissions + '/?q=dürer')
+    content = json.loads(response.content.decode())
+
+    assert response.status_code == 200
+    assert content['count'] == 1
+    assert content['results'][0]['title'] == other_submission.title
+
+
+@pytest.mark.django_db
+def test_orga_can_see_review_scores(orga_client, submission, review):
+    response = orga_client.get(submission.event.api_urls.submissions, follow=True)
+    content = json.loads(response.content.decode())
+    assert content['results'][0]['review_scores']['mean_score'] == review.score
+    assert content['results'][0]['review_scores']['score_count'] == 1
+
+
+@pytest.mark.django_db
+def test_orga_submission_list_query_count_is_constant(
+    orga_client, submission, answer, review
+):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from pretalx.person.models import SpeakerProfile, User
+    from pretalx.submission.models import Answer, Review, Submission
+
+    url = submission.event.api_urls.submissions + '/'
+    orga_client.get(url)
+    with CaptureQueriesContext(connection) as one_submission:
+        response = orga_client.get(url)
+    assert json.loads(response.content.decode())['count'] == 1
+
+    for index in range(3):
+        other = Submission.objects.create(
+            title=f'Talk {index}',
+            event=submission.event,
+            submission_type=submission.submission_type,
+        )
+        speaker = User.objects.create_user(email=f'speaker{index}@example.org')
+        SpeakerProfile.objects.create(user=speaker, event=submission.event)
+        other.speakers.add(speaker)
+        Answer.objects.create(answer='3', submission=other, question=answer.question)
+        Review.objects.create(submission=other, user=review.user, score=index)
+    with CaptureQueriesContext(connection) as four_submissions:
+        response = orga_client.get(url)
+    content = json.loads(response.content.decode())
+    assert content['count'] == 4
+    assert all(result['review_scores'] for result in content['results'])
+    assert len(four_submissions) == len(one_submission)
+
+
+@pytest.mark.django_db
+def test_orga_submission_list_loads_slots_at_once(orga_client, slot, request):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    url = slot.submission.event.api_urls.submissions + '/'
+    orga_client.get(url)
+    with CaptureQueriesContext(connection) as one_slot:
+        response = orga_client.get(url)
+    content = json.loads(response.content.decode())
+    assert content['results'][0]['slot']['room'] == slot.room.name
+
+    request.getfixturevalue('other_slot')
+    with CaptureQueriesContext(connection) as two_slots:
+        response = orga_client.get(url)
+    content = json.loads(response.content.decode())
+    assert content['count'] == 2
+    assert all(result['slot'] for result in content['results'])
+    assert len(two_slots) == len(one_slot)
+
+
 @pytest.mark.django_db
 def test_orga_can_see_all_submissions_even_nonpublic(
     orga_client, slot, accepted_submission, rejected_submission, submission
@@ -296,3 +371,60 @@ def test_orga_can_see_all_speakers_even_nonpublic(
 
     assert response.status_code == 200
     assert content['count'] == 2
+
+
+@pytest.mark.django_db
+def test_talks_support_conditional_requests(locmem_cache, client, slot):
+    url = slot.submission.event.api_urls.talks + '/'
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response['ETag']
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == 304
+    assert not response.content
+
+
+@pytest.mark.django_db
+def test_talks_etag_changes_with_data(locmem_cache, client, slot):
+    url = slot.submission.event.api_urls.talks + '/'
+    response = client.get(url)
+    etag = response['ETag']
+
+    slot.submission.title = 'A completely different title'
+    slot.submission.save()
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    content = json.loads(response.content.decode())
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+    assert content['results'][0]['title'] == 'A completely different title'
+
+
+@pytest.mark.django_db
+def test_talks_etag_changes_with_settings(locmem_cache, client, slot):
+    url = slot.submission.event.api_urls.talks + '/'
+    response = client.get(url)
+    etag = response['ETag']
+
+    slot.submission.event.settings.set('show_schedule', False)
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    content = json.loads(response.content.decode())
+    assert response.status_code == 200
+    assert content['count'] == 0
+
+
+@pytest.mark.django_db
+def test_api_responses_are_cached_per_permission_tier(
+    locmem_cache, client, orga_user, slot, submission
+):
+    url = submission.event.api_urls.submissions + '/'
+    public_response = client.get(url)
+    assert json.loads(public_response.content.decode())['count'] == 1
+
+    client.force_login(orga_user)
+    orga_response = client.get(url, HTTP_IF_NONE_MATCH=public_response['ETag'])
+    assert orga_response.status_code == 200
+    assert orga_response['ETag'] != public_response['ETag']
+    assert json.loads(orga_response.content.decode())['count'] == 2
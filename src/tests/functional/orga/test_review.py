@@ -1,4 +1,6 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 
 @pytest.mark.django_db
@@ -224,6 +226,46 @@ def test_reviewer_can_see_dashboard(review_client, submission, review):
     assert response.status_code == 200
 
 
+@pytest.mark.django_db
+def test_reviewer_can_sort_dashboard_by_score(
+    review_client, orga_user, submission, other_submission, review
+):
+    from pretalx.submission.models import Review
+    Review.objects.create(score=0, user=orga_user, submission=other_submission)
+    url = submission.event.orga_urls.reviews
+    response = review_client.get(url + '?sort=avg_score')
+    assert list(response.context['submissions']) == [other_submission, submission]
+    response = review_client.get(url + '?sort=-avg_score')
+    assert list(response.context['submissions']) == [submission, other_submission]
+    response = review_client.get(url + '?review_aggregate__mean_score__gte=1')
+    assert list(response.context['submissions']) == [submission]
+    response = review_client.get(
+        url + '?review_aggregate__submission__speakers__email__startswith=x'
+    )
+    assert set(response.context['submissions']) == {submission, other_submission}
+
+
+@pytest.mark.django_db
+def test_orga_can_export_review_statistics(orga_client, submission, review):
+    response = orga_client.get(
+        submission.event.orga_urls.review_export + '?type=submissions&format=csv'
+    )
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'text/csv'
+    assert submission.code in response.content.decode()
+    response = orga_client.get(
+        submission.event.orga_urls.review_export + '?type=reviewers&format=json'
+    )
+    assert response.status_code == 200
+    assert len(response.json()['reviewers']) == 1
+
+
+@pytest.mark.django_db
+def test_reviewer_cannot_export_review_statistics(review_client, submission, review):
+    response = review_client.get(submission.event.orga_urls.review_export)
+    assert response.status_code == 404
+
+
 @pytest.mark.django_db
 def test_orga_cannot_add_review(orga_client, submission):
     response = orga_client.post(
@@ -235,3 +277,35 @@ def test_orga_cannot_add_review(orga_client, submission):
     )
     assert response.status_code == 404
     assert submission.reviews.count() == 0
+
+
+@pytest.mark.django_db
+def test_review_page_query_count(
+    review_client, submission, other_speaker, review_question
+):
+    from pretalx.person.models import User
+    from pretalx.submission.models import Answer, Review
+
+    def add_review(index):
+        user = User.objects.create_user(
+            email=f'reviewer{index}@example.org', password='reviewpassw0rd'
+        )
+        review = Review.objects.create(score=1, user=user, submission=submission)
+        Answer.objects.create(question=review_question, review=review, answer='Red')
+
+    add_review(0)
+    review_client.get(submission.orga_urls.reviews)
+    with CaptureQueriesContext(connection) as single:
+        response = review_client.get(submission.orga_urls.reviews)
+    assert response.status_code == 200
+    assert len(response.context['reviews']) == 1
+
+    add_review(1)
+    add_review(2)
+    submission.speakers.add(other_speaker)
+    with CaptureQueriesContext(connection) as multiple:
+        response = review_client.get(submission.orga_urls.reviews)
+    assert response.status_code == 200
+    assert len(response.context['reviews']) == 3
+    assert len(response.context['profiles']) == 2
+    assert len(single) == len(multiple)
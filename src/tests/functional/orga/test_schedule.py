@@ -3,10 +3,12 @@ from datetime import datetime
 
 import pytest
 import pytz
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.timezone import now
 
-from pretalx.schedule.models import Availability, Schedule, TalkSlot
+from pretalx.schedule.models import Availability, Room, Schedule, TalkSlot
 
 
 @pytest.mark.django_db
@@ -54,6 +56,77 @@ def test_talk_list_with_filter(orga_client, event, schedule):
     assert content['results'][0]['title']
 
 
+@pytest.mark.django_db
+@pytest.mark.usefixtures('slot')
+def test_talk_list_fields(orga_client, event):
+    response = orga_client.get(
+        reverse(f'orga:schedule.api.talks', kwargs={'event': event.slug}),
+        data={'fields': 'id,title,warnings,unknown'},
+        follow=True,
+    )
+    content = json.loads(response.content.decode())
+    assert response.status_code == 200
+    assert set(content['results'][0].keys()) == {'id', 'title', 'warnings'}
+
+
+@pytest.mark.django_db
+def test_talk_list_matches_talk_detail(orga_client, event, slot):
+    slot = event.wip_schedule.talks.first()
+    response = orga_client.get(
+        reverse(f'orga:schedule.api.talks', kwargs={'event': event.slug}),
+        follow=True,
+    )
+    talk = json.loads(response.content.decode())['results'][0]
+    assert 'abstract' not in talk
+    response = orga_client.get(
+        reverse(
+            f'orga:schedule.api.update', kwargs={'event': event.slug, 'pk': slot.pk}
+        ),
+        follow=True,
+    )
+    detail = json.loads(response.content.decode())
+    assert detail['abstract'] == slot.submission.abstract
+    assert {key: detail[key] for key in talk} == talk
+
+
+@pytest.mark.django_db
+def test_talk_list_and_detail_name_unnamed_speakers_alike(orga_client, event, slot):
+    slot = event.wip_schedule.talks.first()
+    speaker = slot.submission.speakers.first()
+    speaker.name = ''
+    speaker.save()
+    response = orga_client.get(
+        reverse(f'orga:schedule.api.talks', kwargs={'event': event.slug}),
+        follow=True,
+    )
+    talk = json.loads(response.content.decode())['results'][0]
+    response = orga_client.get(
+        reverse(
+            f'orga:schedule.api.update', kwargs={'event': event.slug, 'pk': slot.pk}
+        ),
+        follow=True,
+    )
+    detail = json.loads(response.content.decode())
+    assert talk['speakers'] == detail['speakers'] == [{'name': 'Unnamed user'}]
+
+
+@pytest.mark.django_db
+def test_talk_list_query_count_is_constant(event, slot, other_confirmed_submission):
+    from pretalx.orga.views.schedule import SLOT_FIELDS, serialize_slots
+
+    schedule = event.wip_schedule
+    other_slot = schedule.talks.get(submission=other_confirmed_submission)
+    other_slot.delete()
+    with CaptureQueriesContext(connection) as single:
+        assert len(serialize_slots(schedule, SLOT_FIELDS)) == 1
+    other_slot.pk = None
+    other_slot.start, other_slot.end, other_slot.room = slot.start, slot.end, slot.room
+    other_slot.save()
+    with CaptureQueriesContext(connection) as multiple:
+        assert len(serialize_slots(schedule, SLOT_FIELDS)) == 2
+    assert len(single) == len(multiple)
+
+
 @pytest.mark.django_db
 def test_talk_schedule_api_update(orga_client, event, schedule, slot, room):
     slot = event.wip_schedule.talks.first()
@@ -94,6 +167,44 @@ def test_talk_schedule_api_update_reset(orga_client, event, schedule, slot, room
     assert not slot.room
 
 
+@pytest.mark.django_db
+def test_talk_schedule_api_batch_update(orga_client, event, slot, other_room):
+    slot = event.wip_schedule.talks.first()
+    start = now()
+    url = reverse(f'orga:schedule.api.batch', kwargs={'event': event.slug})
+    data = json.dumps(
+        [{'id': slot.pk, 'room': other_room.pk, 'start': start.isoformat()}]
+    )
+    response = orga_client.patch(url, data=data, follow=True)
+    content = json.loads(response.content.decode())
+    slot.refresh_from_db()
+    assert response.status_code == 200
+    assert [talk['id'] for talk in content['results']] == [slot.pk]
+    assert content['results'][0]['room'] == other_room.pk
+    assert slot.start == start
+    assert slot.room == other_room
+
+    response = orga_client.patch(url, data=data, follow=True)
+    assert json.loads(response.content.decode())['results'] == []
+
+
+@pytest.mark.django_db
+def test_talk_schedule_api_batch_update_rejects_foreign_rooms(
+    orga_client, event, other_event, slot
+):
+    slot = event.wip_schedule.talks.first()
+    old_room = slot.room
+    room = Room.objects.create(event=other_event, name='Elsewhere')
+    response = orga_client.patch(
+        reverse(f'orga:schedule.api.batch', kwargs={'event': event.slug}),
+        data=json.dumps([{'id': slot.pk, 'room': room.pk, 'start': now().isoformat()}]),
+        follow=True,
+    )
+    slot.refresh_from_db()
+    assert response.status_code == 400
+    assert slot.room == old_room
+
+
 @pytest.mark.usefixtures('accepted_submission')
 @pytest.mark.django_db
 def test_api_availabilities(orga_client, event, room, speaker, confirmed_submission):
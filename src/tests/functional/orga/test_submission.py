@@ -10,6 +10,14 @@ def test_orga_can_see_submissions(orga_client, event, submission):
     assert submission.title in response.content.decode()
 
 
+@pytest.mark.django_db
+def test_orga_can_see_submission_statistics(orga_client, event, submission):
+    submission.log_action('pretalx.submission.create')
+    response = orga_client.get(event.orga_urls.submission_statistics, follow=True)
+    assert response.status_code == 200
+    assert response.json()['timeline'][0]['y'] == 1
+
+
 @pytest.mark.django_db
 def test_orga_can_search_submissions(orga_client, event, submission):
     response = orga_client.get(
@@ -19,6 +27,16 @@ def test_orga_can_search_submissions(orga_client, event, submission):
     assert submission.title in response.content.decode()
 
 
+@pytest.mark.django_db
+def test_orga_can_search_submissions_by_speaker(
+    orga_client, event, submission, other_submission
+):
+    response = orga_client.get(event.orga_urls.submissions + '?q=jane', follow=True)
+    assert response.status_code == 200
+    assert submission.title in response.content.decode()
+    assert other_submission.title not in response.content.decode()
+
+
 @pytest.mark.django_db
 def test_orga_can_miss_search_submissions(orga_client, event, submission):
     response = orga_client.get(
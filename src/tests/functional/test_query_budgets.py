@@ -0,0 +1,355 @@
+import datetime
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.timezone import now
+from tests.utils import assert_max_queries, fail_with_queries
+
+from pretalx.common import cache, search
+from pretalx.event.generate import generate_event
+from pretalx.event.models import Organiser, Team, TeamInvite
+from pretalx.mail.models import MailTemplate
+from pretalx.person.models import SpeakerInformation, User
+
+BUDGETS = json.loads((Path(__file__).parent / 'query_budgets.json').read_text())
+# The views are requested on two events that only differ in the number of
+# submissions, speakers, reviews and mails, to find queries run once per object
+SMALL_EVENT_COUNTS = {
+    'submissions': 20,
+    'speakers': 15,
+    'reviewers': 4,
+    'reviews': 40,
+    'questions': 4,
+    'rooms': 3,
+    'availabilities': 2,
+    'schedules': 2,
+    'mails': 10,
+    'days': 2,
+}
+EVENT_COUNTS = {
+    **SMALL_EVENT_COUNTS,
+    'submissions': 40,
+    'speakers': 30,
+    'reviews': 80,
+    'mails': 20,
+}
+# Differences in the sample objects of the two events, e.g. the number of
+# speakers of the submission on a detail page, may cost a few queries
+SCALING_TOLERANCE = 3
+# Pages known to run queries once per object. Please fix them instead of adding
+# new pages here – and remove a page once it doesn't grow with the event anymore.
+KNOWN_SCALING_VIEWS = {
+    'orga:submissions.list',
+    'orga:submissions.list?q=open',
+    'orga:submissions.speakers.view',
+    'orga:speakers.list',
+    'orga:speakers.list?q=a',
+    'orga:reviews.dashboard',
+    'orga:schedule.release',
+    'orga:schedule.reset?version=1.0',
+    'api:schedule-detail',
+    'api:speakerprofile-list',
+    'api:speakerprofile-detail',
+    'agenda:schedule.changelog',
+    'agenda:feed',
+    'agenda:export.schedule.xml',
+    'agenda:export.schedule.xcal',
+    'agenda:export.schedule.json',
+    'agenda:export.schedule.ics',
+    'agenda:speakers',
+    'agenda:talks',
+    'agenda:talk',
+    'cfp:event.user.submissions',
+}
+
+
+EVENT = {'event': 'event.slug'}
+SUBMISSION = {**EVENT, 'code': 'submission.code'}
+TALK = {**EVENT, 'slug': 'submission.code'}
+SPEAKER = {**EVENT, 'code': 'speaker.code'}
+
+# Every page that can be requested with GET, as (key, user, URL kwargs).
+# The key is the URL name, or a path with the URL kwargs as format fields if the
+# URL name is ambiguous, optionally followed by a query string. URL kwargs are
+# given as attribute paths on the data of an event. The budgets in
+# query_budgets.json are the query counts on the larger event; the query count
+# must not grow with the size of the event, except for KNOWN_SCALING_VIEWS.
+VIEWS = (
+    ('orga:dashboard', 'orga', {}),
+    ('orga:user.view', 'orga', {}),
+    ('orga:invitation.view', None, {'code': 'invite.token'}),
+    ('orga:organiser.view', 'orga', {'organiser': 'event.organiser.slug'}),
+    ('orga:organiser.teams', 'orga', {'organiser': 'event.organiser.slug'}),
+    (
+        'orga:organiser.teams.view',
+        'orga',
+        {'organiser': 'event.organiser.slug', 'pk': 'team.pk'},
+    ),
+    ('orga:event.dashboard', 'orga', EVENT),
+    ('orga:event.live', 'orga', EVENT),
+    ('orga:event.user_list?search=a', 'orga', EVENT),
+    ('orga:url_list', 'orga', EVENT),
+    ('orga:cfp.questions.view', 'orga', EVENT),
+    ('orga:cfp.questions.create', 'orga', EVENT),
+    ('orga:cfp.questions.remind', 'orga', EVENT),
+    ('orga:cfp.question.view', 'orga', {**EVENT, 'pk': 'question.pk'}),
+    ('orga:cfp.question.edit', 'orga', {**EVENT, 'pk': 'question.pk'}),
+    ('orga:cfp.question.delete', 'orga', {**EVENT, 'pk': 'question.pk'}),
+    ('orga:cfp.text.view', 'orga', EVENT),
+    ('orga:cfp.types.view', 'orga', EVENT),
+    ('orga:cfp.types.create', 'orga', EVENT),
+    ('orga:cfp.type.delete', 'orga', {**EVENT, 'pk': 'submission_type.pk'}),
+    ('orga:mails.outbox.mail.view', 'orga', {**EVENT, 'pk': 'mail.pk'}),
+    ('orga:mails.outbox.mail.delete', 'orga', {**EVENT, 'pk': 'mail.pk'}),
+    ('orga:mails.templates.list', 'orga', EVENT),
+    ('orga:mails.templates.create', 'orga', EVENT),
+    ('orga:mails.templates.view', 'orga', {**EVENT, 'pk': 'template.pk'}),
+    ('orga:mails.templates.delete', 'orga', {**EVENT, 'pk': 'template.pk'}),
+    ('orga:mails.compose', 'orga', EVENT),
+    ('orga:mails.sent', 'orga', EVENT),
+    ('orga:mails.outbox.list', 'orga', EVENT),
+    ('orga:mails.outbox.send', 'orga', EVENT),
+    ('orga:mails.outbox.purge', 'orga', EVENT),
+    ('orga:submissions.list', 'orga', EVENT),
+    ('orga:submissions.list?q=open', 'orga', EVENT),
+    ('orga:submissions.create', 'orga', EVENT),
+    ('orga:submissions.statistics', 'orga', EVENT),
+    ('orga:submissions.content.view', 'orga', SUBMISSION),
+    ('orga:submissions.accept', 'orga', SUBMISSION),
+    ('orga:submissions.reject', 'orga', SUBMISSION),
+    ('orga:submissions.withdraw', 'orga', SUBMISSION),
+    ('orga:submissions.cancel', 'orga', SUBMISSION),
+    ('orga:submissions.delete', 'orga', SUBMISSION),
+    ('orga:submissions.speakers.view', 'orga', SUBMISSION),
+    ('orga:submissions.reviews', 'orga', SUBMISSION),
+    ('orga:submissions.feedback.list', 'orga', SUBMISSION),
+    ('orga:speakers.list', 'orga', EVENT),
+    ('orga:speakers.list?q=a', 'orga', EVENT),
+    ('orga:speakers.view', 'orga', {**EVENT, 'pk': 'speaker.pk'}),
+    ('orga:speakers.information.list', 'orga', EVENT),
+    ('orga:speakers.information.create', 'orga', EVENT),
+    ('orga:speakers.information.view', 'orga', {**EVENT, 'pk': 'information.pk'}),
+    ('orga:speakers.information.delete', 'orga', {**EVENT, 'pk': 'information.pk'}),
+    ('orga:reviews.dashboard', 'orga', EVENT),
+    ('orga:settings.event.view', 'orga', EVENT),
+    ('orga:settings.mail.view', 'orga', EVENT),
+    ('orga:settings.team.view', 'orga', EVENT),
+    ('orga:settings.team.add', 'orga', EVENT),
+    ('orga:settings.team.detail', 'orga', {**EVENT, 'pk': 'team.pk'}),
+    ('orga:settings.plugins.select', 'administrator', EVENT),
+    ('orga:schedule.main', 'orga', EVENT),
+    ('orga:schedule.import', 'orga', EVENT),
+    ('orga:schedule.export', 'orga', EVENT),
+    ('orga:schedule.release', 'orga', EVENT),
+    ('orga:schedule.quick', 'orga', SUBMISSION),
+    ('orga:schedule.reset?version=1.0', 'orga', EVENT),
+    ('orga:schedule.rooms.list', 'orga', EVENT),
+    ('orga:schedule.rooms.create', 'orga', EVENT),
+    ('orga:schedule.rooms.view', 'orga', {**EVENT, 'pk': 'room.pk'}),
+    ('orga:schedule.rooms.delete', 'orga', {**EVENT, 'pk': 'room.pk'}),
+    ('orga:schedule.api.rooms', 'orga', EVENT),
+    ('orga:schedule.api.talks', 'orga', EVENT),
+    (
+        'orga:schedule.api.availabilities',
+        'orga',
+        {**EVENT, 'talkid': 'slot.pk', 'roomid': 'room.pk'},
+    ),
+    ('api:event-list', 'orga', {}),
+    # The submission and talk routes share their URL names
+    ('/api/events/{event}/submissions/', 'orga', EVENT),
+    ('/api/events/{event}/submissions/{code}/', 'orga', SUBMISSION),
+    ('/api/events/{event}/talks/', None, EVENT),
+    ('/api/events/{event}/talks/{code}/', None, SUBMISSION),
+    ('api:schedule-list', 'orga', EVENT),
+    (
+        'api:schedule-detail',
+        'orga',
+        {**EVENT, 'version__iexact': 'latest'},
+    ),
+    ('api:speakerprofile-list', 'orga', EVENT),
+    (
+        'api:speakerprofile-detail',
+        'orga',
+        {**EVENT, 'user__code__iexact': 'speaker.code'},
+    ),
+    ('agenda:schedule', None, EVENT),
+    ('agenda:schedule.changelog', None, EVENT),
+    ('agenda:feed', None, EVENT),
+    ('agenda:export.schedule.xml', None, EVENT),
+    ('agenda:export.schedule.xcal', None, EVENT),
+    ('agenda:export.schedule.json', None, EVENT),
+    ('agenda:export.schedule.ics', None, EVENT),
+    ('agenda:versioned-schedule', None, {**EVENT, 'version': 'schedule.version'}),
+    ('agenda:sneak', None, EVENT),
+    ('agenda:speakers', None, EVENT),
+    ('agenda:talks', None, EVENT),
+    ('agenda:talk', None, TALK),
+    ('agenda:feedback', None, TALK),
+    ('agenda:ical', None, TALK),
+    ('agenda:review', None, {**EVENT, 'slug': 'submission.review_code'}),
+    ('agenda:speaker', None, SPEAKER),
+    ('agenda:speaker.talks.ical', None, SPEAKER),
+    ('cfp:event.landing', None, EVENT),
+    ('cfp:event.login', None, EVENT),
+    ('cfp:event.reset', None, EVENT),
+    ('cfp:event.recover', None, {**EVENT, 'token': 'speaker.pw_reset_token'}),
+    ('cfp:event.start', None, EVENT),
+    ('cfp:event.submit', None, EVENT),
+    (
+        'cfp:invitation.view',
+        'speaker',
+        {**SUBMISSION, 'invitation': 'submission.invitation_token'},
+    ),
+    ('cfp:event.user.view', 'speaker', EVENT),
+    ('cfp:event.user.submissions', 'speaker', EVENT),
+    ('cfp:event.user.submission.edit', 'speaker', SUBMISSION),
+    ('cfp:event.user.submission.withdraw', 'speaker', SUBMISSION),
+    ('cfp:event.user.submission.confirm', 'speaker', SUBMISSION),
+    ('cfp:event.user.submission.invite', 'speaker', SUBMISSION),
+)
+
+
+def resolve_path(data, path):
+    """Returns the attribute at ``path``. Values without a dot are returned as is."""
+    if '.' not in path:
+        return path
+    for attribute in path.split('.'):
+        data = getattr(data, attribute)
+    return data
+
+
+def create_event_data(organiser, slug, counts):
+    # The event is over, so that feedback can be given
+    event = generate_event(
+        organiser, slug, date_from=now().date() - datetime.timedelta(days=7), **counts
+    )
+    event.settings.show_sneak_peek = True
+    event.settings.show_schedule = True
+    submission = event.talks.filter(speakers__isnull=False).first()
+    speaker = submission.speakers.first()
+    speaker.pw_reset_token = f'{slug}token'
+    speaker.save()
+    return SimpleNamespace(
+        event=event,
+        submission=submission,
+        speaker=speaker,
+        schedule=event.current_schedule,
+        slot=submission.slots.get(schedule=event.wip_schedule),
+        question=event.questions.first(),
+        submission_type=event.cfp.default_type,
+        mail=event.queued_mails.filter(sent__isnull=True).first(),
+        template=MailTemplate.objects.create(
+            event=event, subject='Reminder', text='Hello {name}!'
+        ),
+        information=SpeakerInformation.objects.create(
+            event=event, title='Travel', text='Take the train.'
+        ),
+        room=event.rooms.first(),
+    )
+
+
+@pytest.fixture(scope='module')
+def budget_data(django_db_setup, django_db_blocker):
+    # Generating the events takes a while, so they are created once for the whole
+    # module, in a transaction that is rolled back afterwards. Every test runs in
+    # a savepoint within it.
+    with django_db_blocker.unblock(), transaction.atomic():
+        yield create_budget_data()
+        transaction.set_rollback(True)
+
+
+def create_budget_data():
+    organiser = Organiser.objects.create(name='Budget organiser', slug='budget')
+    team = Team.objects.create(
+        organiser=organiser,
+        name='Budget organisers',
+        all_events=True,
+        can_change_event_settings=True,
+        can_change_organiser_settings=True,
+        can_change_submissions=True,
+        can_change_teams=True,
+        can_create_events=True,
+        is_reviewer=True,
+    )
+    orga = User.objects.create_user(
+        password='orgapassw0rd', email='orga@budget.example.org'
+    )
+    team.members.add(orga)
+    users = {
+        'orga': orga,
+        'administrator': User.objects.create_superuser(
+            password='adminpassw0rd', email='admin@budget.example.org'
+        ),
+        'team': team,
+        'invite': TeamInvite.objects.create(team=team, email='new@budget.example.org'),
+    }
+    small = create_event_data(organiser, 'small', SMALL_EVENT_COUNTS)
+    large = create_event_data(organiser, 'budget', EVENT_COUNTS)
+    return (
+        SimpleNamespace(**users, **vars(small)),
+        SimpleNamespace(**users, **vars(large)),
+    )
+
+
+def get_url(data, key, kwargs):
+    name, _, query = key.partition('?')
+    kwargs = {kwarg: resolve_path(data, path) for kwarg, path in kwargs.items()}
+    if name.startswith('/'):
+        url = name.format(**kwargs)
+    else:
+        url = reverse(name, kwargs=kwargs)
+    return f'{url}?{query}' if query else url
+
+
+def forget_process_caches(monkeypatch):
+    # Process-wide caches are emptied, so that every view loads them exactly once,
+    # regardless of test order. The conftest keeps them from expiring.
+    cache._forget_custom_domains()
+    monkeypatch.setattr(search, '_fts_databases', set())
+    ContentType.objects.clear_cache()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'key,user,kwargs', VIEWS, ids=[key for key, _, _ in VIEWS]
+)
+def test_view_query_budget(client, budget_data, key, user, kwargs, monkeypatch):
+    small, large = budget_data
+    if user:
+        client.force_login(getattr(small, user))
+    url = get_url(small, key, kwargs)
+    forget_process_caches(monkeypatch)
+    with CaptureQueriesContext(connection) as small_queries:
+        response = client.get(url)
+    assert response.status_code < 400, f'{url} returned {response.status_code}'
+
+    if user:
+        client.force_login(getattr(large, user))
+    url = get_url(large, key, kwargs)
+    forget_process_caches(monkeypatch)
+    with assert_max_queries(BUDGETS.get(key), name=f'{key} ({url})') as queries:
+        response = client.get(url)
+    assert response.status_code < 400, f'{url} returned {response.status_code}'
+
+    growth = len(queries) - len(small_queries)
+    if key in KNOWN_SCALING_VIEWS:
+        assert growth > SCALING_TOLERANCE, (
+            f'{key} does not grow with the event anymore, please remove it '
+            'from KNOWN_SCALING_VIEWS.'
+        )
+    elif growth > SCALING_TOLERANCE:
+        fail_with_queries(
+            f'{key} ran {len(small_queries)} queries on the small event and '
+            f'{len(queries)} on the large event.',
+            queries,
+        )
+
+
+def test_query_budgets_are_used():
+    assert sorted(BUDGETS) == sorted(key for key, _, _ in VIEWS)
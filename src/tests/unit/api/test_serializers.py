@@ -85,6 +85,7 @@ def test_submission_serializer(submission):
         'slot',
         'image',
         'answers',
+        'review_scores',
     }
     assert isinstance(data['speakers'], list)
     assert data['speakers'][0] == {
@@ -117,6 +118,7 @@ def test_submission_slot_serializer(slot):
         'slot',
         'image',
         'answers',
+        'review_scores',
     }
     assert set(data['slot'].keys()) == {'start', 'end', 'room'}
     assert data['slot']['room'] == slot.room.name
@@ -5,3 +5,37 @@ from django.core.management import call_command
 @pytest.mark.django_db
 def test_common_runperiodic():
     call_command('runperiodic')
+
+
+@pytest.mark.django_db
+def test_common_generate_data():
+    from pretalx.event.models import Event
+
+    call_command(
+        'generate_data',
+        slug='gen',
+        events=2,
+        submissions=20,
+        speakers=10,
+        reviewers=3,
+        reviews=30,
+        questions=2,
+        rooms=2,
+        schedules=2,
+        mails=10,
+    )
+    event = Event.objects.get(slug='gen')
+    assert Event.objects.filter(slug='gen-2').exists()
+    assert event.submissions.count() == 20
+    assert event.submitters.count() <= 10
+    assert event.rooms.count() == 2
+    assert event.queued_mails.count() == 10
+    assert event.schedules.filter(version__isnull=False).count() == 2
+    assert event.talks.exists()
+    assert event.speakers.exists()
+    reviews = sum(event.submissions.values_list('review_count', flat=True))
+    assert reviews == 30
+    submission = event.submissions.filter(review_count__gt=0).first()
+    assert submission.review_aggregate.score_count == submission.review_count
+    assert submission.answers.count() == 1
+    assert submission.search_entry.text.startswith(submission.code)
@@ -0,0 +1,89 @@
+import pytest
+
+from pretalx.common import metrics
+from pretalx.common.tasks import regenerate_css
+
+
+@pytest.fixture
+def metrics_token(settings):
+    settings.METRICS_TOKEN = 'metricstoken'
+    settings.METRICS_ENABLED = True
+    metrics._values.clear()
+    yield f'Bearer {settings.METRICS_TOKEN}'
+    metrics._values.clear()
+
+
+def get_metrics(client, token):
+    response = client.get('/metrics', HTTP_AUTHORIZATION=token)
+    assert response.status_code == 200
+    return response.content.decode()
+
+
+@pytest.mark.django_db
+def test_metrics_render_histogram(metrics_token):
+    histogram = metrics.Histogram('test_seconds', 'Test.', ('view',), buckets=(1, 5))
+    try:
+        histogram.observe(2, view='a"b')
+        histogram.observe(0.5, view='a"b')
+        metrics.flush()
+        content = metrics.render()
+    finally:
+        metrics.REGISTRY.remove(histogram)
+    assert '# TYPE test_seconds histogram' in content
+    assert 'test_seconds_bucket{view="a\\"b",le="1"} 1\n' in content
+    assert 'test_seconds_bucket{view="a\\"b",le="5"} 2\n' in content
+    assert 'test_seconds_bucket{view="a\\"b",le="+Inf"} 2\n' in content
+    assert 'test_seconds_sum{view="a\\"b"} 2.5\n' in content
+    assert 'test_seconds_count{view="a\\"b"} 2\n' in content
+
+
+def test_metrics_require_all_labels(metrics_token):
+    with pytest.raises(ValueError):
+        metrics.request_count.inc(view='orga:dashboard')
+
+
+def test_metrics_are_not_collected_when_disabled(settings):
+    settings.METRICS_ENABLED = False
+    metrics.task_failures.inc(task='test')
+    assert not metrics._pending()
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_is_disabled_without_token(client):
+    assert client.get('/metrics').status_code == 404
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('token', (None, 'Bearer wrong', 'metricstoken'))
+def test_metrics_endpoint_needs_token(client, metrics_token, token):
+    kwargs = {'HTTP_AUTHORIZATION': token} if token else {}
+    response = client.get('/metrics', **kwargs)
+    assert response.status_code == 401
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_reports_requests(client, metrics_token, event, mail):
+    assert client.get(event.urls.base + '/').status_code == 200
+    content = get_metrics(client, metrics_token)
+    assert (
+        'pretalx_requests_total{view="cfp:event.landing",method="GET",status="200"} 1'
+        in content
+    )
+    assert (
+        'pretalx_request_duration_seconds_count'
+        '{view="cfp:event.landing",method="GET"} 1'
+    ) in content
+    assert 'pretalx_request_queries_count{view="cfp:event.landing"} 1' in content
+    assert 'pretalx_cache_lookups_total{cache="event",result="miss"}' in content
+    assert f'pretalx_outbox_mails{{event="{event.slug}"}} 1' in content
+    assert 'pretalx_active_sessions ' in content
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_reports_tasks(client, metrics_token, event):
+    regenerate_css.apply(args=(event.pk,))
+    regenerate_css.apply(args=('not an id',))
+    content = get_metrics(client, metrics_token)
+    task = 'pretalx.common.tasks.regenerate_css'
+    assert f'pretalx_task_duration_seconds_count{{task="{task}"}} 2' in content
+    assert f'pretalx_task_failures_total{{task="{task}"}} 1' in content
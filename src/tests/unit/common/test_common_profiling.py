@@ -0,0 +1,52 @@
+import marshal
+
+import pytest
+
+from pretalx.common.profiling import duplicate_queries, query_fingerprint
+
+
+@pytest.fixture
+def administrator(orga_user):
+    orga_user.is_administrator = True
+    orga_user.save()
+    return orga_user
+
+
+def test_query_fingerprint_ignores_parameters():
+    assert query_fingerprint(
+        "SELECT * FROM t WHERE id = 12 AND name = 'it''s' AND pk IN (1, 2, 3)"
+    ) == 'SELECT * FROM t WHERE id = ? AND name = ? AND pk IN (?)'
+    queries = [{'sql': f'SELECT * FROM t WHERE id = {pk}'} for pk in range(3)]
+    assert duplicate_queries(queries) == [(3, 'SELECT * FROM t WHERE id = ?')]
+
+
+@pytest.mark.django_db
+def test_profile_summary_for_administrators(client, administrator, event):
+    client.force_login(administrator)
+    response = client.get(event.orga_urls.base + '/', {'_profile': '1'})
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'text/plain; charset=utf-8'
+    content = response.content.decode()
+    assert 'Response status: 200' in content
+    assert 'Queries: ' in content
+    assert 'cumulative' in content
+
+
+@pytest.mark.django_db
+def test_profile_download_with_header(client, administrator, event):
+    client.force_login(administrator)
+    response = client.get(event.urls.base + '/', HTTP_X_PRETALX_PROFILE='pstats')
+    assert response.status_code == 200
+    assert 'attachment' in response['Content-Disposition']
+    assert isinstance(marshal.loads(response.content), dict)
+
+
+@pytest.mark.django_db
+def test_profile_not_for_other_users(client, orga_user, event):
+    response = client.get(event.urls.base + '/', {'_profile': '1'})
+    assert response.status_code == 200
+    assert response['Content-Type'].startswith('text/html')
+    client.force_login(orga_user)
+    response = client.get(event.orga_urls.base + '/', {'_profile': '1'})
+    assert response.status_code == 200
+    assert response['Content-Type'].startswith('text/html')
@@ -0,0 +1,169 @@
+import re
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import RequestFactory
+from django.utils.timezone import now
+
+from pretalx.common.models import ActivityLog
+from pretalx.event.models import Event
+from pretalx.mail.models import QueuedMail
+from pretalx.orga.views.mails import OutboxList
+from pretalx.orga.views.review import ReviewDashboard
+from pretalx.schedule.models import TalkSlot
+from pretalx.submission.models import Review, Submission, SubmissionStates
+
+SEED_SIZE = 500
+
+pytestmark = pytest.mark.skipif(
+    connection.vendor not in ('postgresql', 'sqlite'),
+    reason='Query plans are only checked on PostgreSQL and SQLite.',
+)
+
+
+def get_full_scans(queryset, tables):
+    """
+    Returns the tables of ``tables`` that the query of ``queryset`` reads in
+    full. On PostgreSQL, sequential scans are disabled before running EXPLAIN,
+    so that any ``Seq Scan`` means that no index can be used at all.
+    """
+    sql, params = queryset.query.sql_with_params()
+    aliases = {
+        alias: table for table, alias in re.findall(r'"(\w+)" ([A-Z]\d+)\b', sql)
+    }
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute(f'EXPLAIN {sql}', params)
+            pattern = r'Seq Scan on (\w+)'
+        else:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            pattern = r'^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$'
+        plan = [str(row[-1]).strip() for row in cursor.fetchall()]
+    scans = set()
+    for line in plan:
+        match = re.search(pattern, line)
+        if match:
+            scans.add(aliases.get(match.group(1), match.group(1)))
+    return scans & set(tables), plan
+
+
+def assert_no_full_scans(queryset, *tables):
+    scans, plan = get_full_scans(queryset, tables)
+    assert not scans, '\n'.join(plan)
+
+
+@pytest.fixture
+def seeded_event(event, other_event, orga_user, submission_type, schedule, room):
+    """Seeds an event and a second event with many rows in the hot tables."""
+    events = [event, other_event]
+    Submission.all_objects.bulk_create(
+        Submission(
+            event=current,
+            code=f'{current.pk}{index:05d}',
+            title=f'Talk {index}',
+            submission_type=submission_type,
+            state=SubmissionStates.SUBMITTED,
+        )
+        for current in events
+        for index in range(SEED_SIZE)
+    )
+    # bulk_create does not set primary keys on all databases
+    submissions = list(
+        Submission.all_objects.filter(title__startswith='Talk ').order_by('pk')
+    )
+    own_submissions = [sub for sub in submissions if sub.event_id == event.pk]
+    TalkSlot.objects.bulk_create(
+        TalkSlot(
+            submission=submission,
+            schedule=schedule,
+            room=room,
+            start=now(),
+            end=now(),
+            is_visible=bool(index % 2),
+        )
+        for index, submission in enumerate(own_submissions)
+    )
+    Review.objects.bulk_create(
+        Review(submission=submission, user=orga_user, score=1)
+        for submission in submissions[::3]
+    )
+    QueuedMail.objects.bulk_create(
+        QueuedMail(
+            event=current,
+            to='speaker@example.org',
+            subject='Hi',
+            text='Hi',
+            sent=now() if index % 2 else None,
+        )
+        for current in events
+        for index in range(SEED_SIZE)
+    )
+    content_type = ContentType.objects.get_for_model(Submission)
+    ActivityLog.objects.bulk_create(
+        ActivityLog(
+            event_id=submission.event_id,
+            content_type=content_type,
+            object_id=submission.pk,
+            action_type='pretalx.submission.create',
+        )
+        for submission in submissions
+    )
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+    return event
+
+
+def _get_view(view_class, event, user):
+    request = RequestFactory().get('/')
+    request.event = event
+    request.user = user
+    view = view_class()
+    view.request = request
+    view.args = ()
+    view.kwargs = {}
+    return view
+
+
+@pytest.mark.django_db
+def test_schedule_data_uses_indexes(seeded_event, schedule):
+    talks = schedule.talks.filter(is_visible=True).order_by('start')
+    assert_no_full_scans(talks, 'schedule_talkslot')
+
+
+@pytest.mark.django_db
+def test_review_dashboard_uses_indexes(seeded_event, orga_user):
+    queryset = _get_view(ReviewDashboard, seeded_event, orga_user).get_queryset()
+    assert_no_full_scans(
+        queryset, 'submission_submission', 'submission_reviewaggregate'
+    )
+
+
+@pytest.mark.django_db
+def test_outbox_uses_indexes(seeded_event, orga_user):
+    queryset = _get_view(OutboxList, seeded_event, orga_user).get_queryset()
+    assert_no_full_scans(queryset, 'mail_queuedmail')
+
+
+@pytest.mark.django_db
+def test_submission_log_uses_indexes(seeded_event):
+    submission = seeded_event.submissions.first()
+    assert_no_full_scans(submission.logged_actions(), 'common_activitylog')
+
+
+@pytest.mark.django_db
+def test_event_log_uses_indexes(seeded_event):
+    logs = ActivityLog.objects.filter(event=seeded_event).order_by('-timestamp')
+    assert_no_full_scans(logs, 'common_activitylog')
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(
+    connection.vendor != 'postgresql',
+    reason='SQLite compares case-insensitively with LIKE, which ignores indexes.',
+)
+def test_event_middleware_uses_indexes(seeded_event):
+    events = Event.objects.filter(slug__iexact=seeded_event.slug.upper())
+    assert_no_full_scans(events, 'event_event')
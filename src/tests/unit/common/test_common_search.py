@@ -0,0 +1,89 @@
+import pytest
+
+from pretalx.common.models import SearchEntry
+from pretalx.common.search import search_filter, search_rank
+from pretalx.person.models import SpeakerProfile
+from pretalx.submission.models import Submission
+
+
+def _search(event, query, kind='submission'):
+    model = Submission if kind == 'submission' else SpeakerProfile
+    return set(model.objects.filter(search_filter(query, event, kind=kind)))
+
+
+@pytest.mark.django_db
+def test_search_entry_contains_submission_and_speakers(submission, speaker):
+    text = SearchEntry.objects.get(submission=submission).text
+    assert submission.code in text
+    assert submission.title in text
+    assert submission.abstract in text
+    assert speaker.name in text
+    assert submission.notes not in text
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'query,found',
+    (
+        ('Lametta', True),
+        ('lamet', True),
+        ('wandel lametta', True),
+        ('jane', True),
+        ('Quellen', True),
+        ('metta', False),
+        ('lametta bügeleisen', False),
+    ),
+)
+def test_search_filter(event, submission, other_submission, query, found):
+    assert _search(event, query) == ({submission} if found else set())
+
+
+@pytest.mark.django_db
+def test_search_filter_by_code(event, submission, other_submission):
+    assert _search(event, submission.code) == {submission}
+
+
+@pytest.mark.django_db
+def test_search_filter_ignores_other_events(other_event, submission):
+    assert _search(other_event, 'lametta') == set()
+
+
+@pytest.mark.django_db
+def test_search_filter_without_words(event, submission, other_submission):
+    assert _search(event, '?!') == {submission, other_submission}
+
+
+@pytest.mark.django_db
+def test_search_index_follows_changes(event, submission, other_speaker):
+    submission.title = 'Tinsel through the ages'
+    submission.save()
+    assert _search(event, 'tinsel') == {submission}
+    assert _search(event, 'lametta') == set()
+
+    submission.speakers.add(other_speaker)
+    assert _search(event, 'krümelmonster') == {submission}
+    other_speaker.name = 'Cookie Monster'
+    other_speaker.save()
+    assert _search(event, 'cookie') == {submission}
+    assert _search(event, 'cookie', kind='speaker') == {
+        SpeakerProfile.objects.get(user=other_speaker, event=event)
+    }
+
+    submission.speakers.remove(other_speaker)
+    assert _search(event, 'cookie') == set()
+
+
+@pytest.mark.django_db
+def test_search_rank(event, submission, other_submission):
+    other_submission.title = 'Lametta'
+    other_submission.save()
+    rank = search_rank('lametta')
+    if rank is None:
+        pytest.skip('The database does not support full-text search ranking.')
+    ranked = (
+        Submission.objects.filter(search_filter('lametta', event))
+        .annotate(search_rank=rank)
+        .order_by('-search_rank')
+    )
+    assert len(ranked) == 2
+    assert all(entry.search_rank is not None for entry in ranked)
@@ -0,0 +1,40 @@
+import pytest
+
+from pretalx.common.models.settings import settings_cache_stats
+from pretalx.event.models import Event
+
+
+@pytest.mark.django_db
+def test_settings_are_cached_per_instance(event, django_assert_num_queries):
+    event = Event.objects.get(pk=event.pk)
+    assert event.settings is event.settings
+    assert event.settings.show_schedule is True
+    with django_assert_num_queries(0):
+        assert event.settings.show_schedule is True
+        assert event.settings.review_max_score == 1
+
+
+@pytest.mark.django_db
+def test_settings_cache_is_shared_between_instances(
+    locmem_cache, event, django_assert_num_queries
+):
+    event.settings.set('cfp_abstract_min_length', 10)
+    Event.objects.get(pk=event.pk).settings.review_max_score
+    hits = settings_cache_stats['hits']
+    event = Event.objects.get(pk=event.pk)
+    with django_assert_num_queries(0):
+        assert event.settings.cfp_abstract_min_length == 10
+        assert event.settings.review_max_score == 1
+    assert settings_cache_stats['hits'] == hits + 2
+
+
+@pytest.mark.django_db
+def test_settings_cache_is_invalidated_on_change(locmem_cache, event):
+    other = Event.objects.get(pk=event.pk)
+    assert other.settings.cfp_abstract_min_length is None
+    event.settings.set('cfp_abstract_min_length', 10)
+    assert event.settings.cfp_abstract_min_length == 10
+    assert Event.objects.get(pk=event.pk).settings.cfp_abstract_min_length == 10
+    event.settings.delete('cfp_abstract_min_length')
+    assert event.settings.cfp_abstract_min_length is None
+    assert Event.objects.get(pk=event.pk).settings.cfp_abstract_min_length is None
@@ -0,0 +1,114 @@
+import json
+import logging
+
+import pytest
+from django.db import connection
+
+from pretalx.common import slowlog
+from pretalx.common.middleware.metrics import time_queries
+from pretalx.common.slowlog import JSONFormatter
+from pretalx.common.tasks import regenerate_css
+from pretalx.event.models import Event
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def slow_log(settings):
+    settings.SLOW_REQUEST_SECONDS = settings.SLOW_QUERY_SECONDS = 0.000001
+    handler = ListHandler()
+    logger = logging.getLogger('pretalx.slow')
+    logger.addHandler(handler)
+    yield handler.records
+    logger.removeHandler(handler)
+
+
+def entries(records, message):
+    return [record.context for record in records if record.getMessage() == message]
+
+
+@pytest.mark.django_db
+def test_slow_request_is_logged_with_context(client, event, slow_log):
+    response = client.get(event.urls.base + '/', HTTP_X_REQUEST_ID='abc')
+    assert response.status_code == 200
+    assert response['X-Request-ID'] == 'abc'
+    request, = entries(slow_log, 'Slow request')
+    assert request['request_id'] == 'abc'
+    assert request['url_name'] == 'cfp:event.landing'
+    assert request['event'] == event.slug
+    assert request['role'] == 'anonymous'
+    assert request['status'] == 200
+    assert request['queries'] > 0
+    queries = entries(slow_log, 'Slow query')
+    assert len(queries) == request['queries']
+    assert all(query['request_id'] == 'abc' for query in queries)
+    assert 'sql' in queries[-1]
+
+
+@pytest.mark.django_db
+def test_slow_query_is_logged_with_role(orga_client, event, slow_log):
+    response = orga_client.get(event.orga_urls.base + '/')
+    assert response.status_code == 200
+    roles = {query['role'] for query in entries(slow_log, 'Slow query')}
+    assert 'orga' in roles
+    assert entries(slow_log, 'Slow request')[0]['role'] == 'orga'
+
+
+@pytest.mark.django_db
+def test_slow_task_is_logged(event, slow_log):
+    result = regenerate_css.apply(args=(event.pk,))
+    task, = entries(slow_log, 'Slow task')
+    assert task['task'] == 'pretalx.common.tasks.regenerate_css'
+    assert task['task_id'] == result.id
+    assert task['state'] == 'SUCCESS'
+    queries = entries(slow_log, 'Slow query')
+    assert queries
+    assert all(query['task_id'] == result.id for query in queries)
+
+
+@pytest.mark.django_db
+def test_slow_log_shares_the_query_timer(event, slow_log):
+    with time_queries() as timer:
+        Event.objects.count()
+        tracked = slowlog.enter(context={'task': 'test'})
+        assert tracked.queries is timer
+        assert connection.execute_wrappers == [timer]
+        Event.objects.count()
+        assert tracked.get_queries()['queries'] == 1
+        slowlog.leave(tracked, 'Slow task')
+        assert connection.execute_wrappers == [timer]
+    assert connection.execute_wrappers == []
+    task, = entries(slow_log, 'Slow task')
+    assert task['queries'] == 1
+
+
+@pytest.mark.django_db
+def test_nothing_is_logged_when_disabled(client, event, slow_log, settings):
+    settings.SLOW_REQUEST_SECONDS = settings.SLOW_QUERY_SECONDS = 0
+    response = client.get(event.urls.base + '/')
+    assert response.status_code == 200
+    assert 'X-Request-ID' not in response
+    assert not slow_log
+
+
+def test_json_formatter():
+    record = logging.makeLogRecord(
+        {
+            'name': 'pretalx.slow',
+            'levelname': 'WARNING',
+            'msg': 'Slow query',
+            'context': {'duration': 1.5, 'sql': 'SELECT 1'},
+        }
+    )
+    data = json.loads(JSONFormatter().format(record))
+    assert data['message'] == 'Slow query'
+    assert data['level'] == 'WARNING'
+    assert data['duration'] == 1.5
+    assert data['sql'] == 'SELECT 1'
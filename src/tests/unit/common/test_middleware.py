@@ -41,6 +41,14 @@ def test_event_on_custom_domain(event_on_foobar, client):
     assert r.status_code == 200
 
 
+@pytest.mark.django_db
+def test_events_sharing_a_custom_domain(event_on_foobar, other_event, client):
+    other_event.settings.set('custom_domain', 'https://foobar')
+    for event in (event_on_foobar, other_event):
+        r = client.get(f'/{event.slug}/', HTTP_HOST='foobar')
+        assert r.status_code == 200
+
+
 @pytest.mark.django_db
 def test_event_on_custom_port(event_on_custom_port, client):
     r = client.get(f'/{event_on_custom_port.slug}/', HTTP_HOST='foobar:8000')
@@ -84,19 +92,30 @@ def test_unknown_event_on_custom_domain(event_on_foobar, client):
 
 
 @pytest.mark.django_db
-def test_cookie_domain_on_custom_domain(event_on_foobar, client):
+def test_cookie_domain_on_custom_domain(event_on_foobar, client, speaker):
     r = client.get(f'/{event_on_foobar.slug}/login/', HTTP_HOST='foobar')
     assert r.status_code == 200
     assert r.client.cookies['pretalx_csrftoken']['domain'] == ''
+    # Sessions are only created on login
+    client.post(
+        f'/{event_on_foobar.slug}/login/',
+        data={'login_email': speaker.email, 'login_password': 'speakerpwd1!'},
+        HTTP_HOST='foobar',
+    )
     assert r.client.cookies['pretalx_session']['domain'] == ''
 
 
 @pytest.mark.django_db
-def test_cookie_domain_on_main_domain(event, client):
+def test_cookie_domain_on_main_domain(event, client, speaker):
     with override_settings(SESSION_COOKIE_DOMAIN='example.com'):
         r = client.get(f'/{event.slug}/login/', HTTP_HOST='example.com')
         assert r.status_code == 200
         assert r.client.cookies['pretalx_csrftoken']['domain'] == 'example.com'
+        client.post(
+            f'/{event.slug}/login/',
+            data={'login_email': speaker.email, 'login_password': 'speakerpwd1!'},
+            HTTP_HOST='example.com',
+        )
         assert r.client.cookies['pretalx_session']['domain'] == 'example.com'
 
 
@@ -108,3 +127,68 @@ def test_with_forwarded_host(event_on_foobar, client):
 
 
 settings.USE_X_FORWARDED_HOST = False
+
+
+@pytest.mark.django_db
+def test_event_lookup_is_cached(locmem_cache, event, django_assert_num_queries):
+    from pretalx.common.cache import get_event_by_slug
+
+    first = get_event_by_slug(event.slug.upper())
+    with django_assert_num_queries(0):
+        second = get_event_by_slug(event.slug)
+    assert first == second == event
+    assert first is not second
+    assert second.name == event.name
+
+    event.is_public = not event.is_public
+    event.save()
+    assert get_event_by_slug(event.slug).is_public == event.is_public
+
+
+@pytest.mark.django_db
+def test_event_lookup_unknown_slug(locmem_cache):
+    from django.http import Http404
+    from pretalx.common.cache import get_event_by_slug
+
+    with pytest.raises(Http404):
+        get_event_by_slug('does-not-exist')
+
+
+@pytest.mark.django_db
+def test_custom_domain_routing_table(locmem_cache, event):
+    from pretalx.common.cache import get_custom_domain, get_event_ids_for_host
+    from pretalx.common.urls import get_base_url
+
+    assert get_custom_domain(event) == ''
+    assert get_base_url(event) == settings.SITE_URL
+    event.settings.set('custom_domain', 'https://foobar:8000')
+    assert get_custom_domain(event) == 'https://foobar:8000'
+    assert get_base_url(event) == 'https://foobar:8000'
+    assert get_base_url(event, '/orga/') == settings.SITE_URL
+    assert get_event_ids_for_host('foobar', '8000') == {event.pk}
+    assert get_event_ids_for_host('foobar', '') == set()
+    event.settings.delete('custom_domain')
+    assert get_custom_domain(event) == ''
+
+
+@pytest.mark.django_db
+def test_anonymous_request_creates_no_session(event, client):
+    from django.contrib.sessions.models import Session
+
+    response = client.get(event.urls.base, follow=True)
+    assert response.status_code == 200
+    assert settings.SESSION_COOKIE_NAME not in response.cookies
+    assert not Session.objects.exists()
+
+
+@pytest.mark.django_db
+def test_session_is_created_on_login(event, client, orga_user):
+    from django.contrib.sessions.models import Session
+
+    response = client.post(
+        '/orga/login/',
+        data={'email': orga_user.email, 'password': 'orgapassw0rd'},
+        follow=True,
+    )
+    assert response.status_code == 200
+    assert Session.objects.exists()
@@ -128,3 +128,63 @@ def test_event_model_talks(slot, other_slot, accepted_submission, submission, re
     other_slot.submission.speakers.add(slot.submission.speakers.first())
     assert len(event.talks.all()) == len(set(event.talks.all()))
     assert len(event.speakers.all()) == len(set(event.speakers.all()))
+
+
+@pytest.mark.django_db
+def test_event_model_published_talks(slot, submission, other_speaker):
+    event = Event.objects.get(pk=slot.submission.event.pk)
+    speaker = slot.submission.speakers.first()
+    assert set(event.talks) == {slot.submission}
+    assert set(event.speakers) == {speaker}
+    assert speaker.event_profile(event).is_published
+
+    slot.submission.speakers.add(other_speaker)
+    event = Event.objects.get(pk=event.pk)
+    assert set(event.speakers) == {speaker, other_speaker}
+
+    slot.is_visible = False
+    slot.save()
+    event = Event.objects.get(pk=event.pk)
+    assert not event.talks.exists()
+    assert not event.speakers.exists()
+    assert not speaker.event_profile(event).is_published
+
+
+@pytest.mark.django_db(transaction=True)
+def test_event_schedules_are_cached(locmem_cache, event, django_assert_num_queries):
+    event.settings.export_html_on_schedule_release = False
+    wip_schedule = Event.objects.get(pk=event.pk).wip_schedule
+    assert Event.objects.get(pk=event.pk).current_schedule is None  # fills the cache
+    event = Event.objects.get(pk=event.pk)
+    with django_assert_num_queries(0):
+        assert event.wip_schedule == wip_schedule
+        assert event.current_schedule is None
+
+    wip_schedule.freeze('v1', notify_speakers=False)
+    event = Event.objects.get(pk=event.pk)
+    assert event.current_schedule == wip_schedule
+    assert event.current_schedule.version == 'v1'
+    assert event.wip_schedule != wip_schedule
+    assert event.wip_schedule.version is None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_event_schedules_filled_before_release_are_not_used(locmem_cache, event):
+    from django.core.cache import cache
+    from pretalx.common.cache import (
+        EVENT_SCHEDULES_KEY, EVENT_SCHEDULES_VERSION_KEY,
+        get_event_schedules, get_version,
+    )
+
+    event.settings.export_html_on_schedule_release = False
+    wip_schedule = Event.objects.get(pk=event.pk).wip_schedule
+    assert get_event_schedules(event)['current'] is None
+    version = get_version(EVENT_SCHEDULES_VERSION_KEY.format(event_id=event.pk))
+    stale_key = EVENT_SCHEDULES_KEY.format(event_id=event.pk, version=version)
+    stale_value = cache.get(stale_key)
+    assert stale_value
+
+    wip_schedule.freeze('v1', notify_speakers=False)
+    # A request that read the schedules before the release stores them late
+    cache.set(stale_key, stale_value)
+    assert get_event_schedules(event)['current'].version == 'v1'
@@ -0,0 +1,102 @@
+import datetime as dt
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from pretalx.common.models import ActivityLog
+from pretalx.event.stats import (
+    build_event_stats, build_submission_timeline,
+    get_event_stats, get_submission_timeline,
+)
+
+
+@pytest.mark.django_db
+def test_event_stats(event, slot, other_submission, review, sent_mail):
+    event.current_schedule  # Cached separately
+    with CaptureQueriesContext(connection) as queries:
+        stats = build_event_stats(event)
+    assert len(queries) == 2
+    assert stats == {
+        'submission_count': 3,
+        'talk_count': 1,
+        'confirmed_count': 1,
+        'speaker_count': 1,
+        'review_count': 1,
+        'schedule_count': event.schedules.filter(version__isnull=False).count(),
+        'mail_count': 1,
+    }
+
+
+@pytest.mark.django_db
+def test_event_stats_without_schedule(event, submission):
+    stats = get_event_stats(event)
+    assert stats['submission_count'] == 1
+    assert stats['talk_count'] == 0
+    assert stats['schedule_count'] == 0
+
+
+@pytest.mark.django_db
+def test_event_stats_are_invalidated(locmem_cache, event, submission, other_submission):
+    assert get_event_stats(event)['submission_count'] == 2
+    other_submission.remove(force=True)
+    assert get_event_stats(event)['submission_count'] == 1
+
+
+def _log_submission(event, timestamp):
+    log = ActivityLog.objects.create(
+        event=event, content_object=event, action_type='pretalx.submission.create'
+    )
+    ActivityLog.objects.filter(pk=log.pk).update(timestamp=timestamp)
+
+
+@pytest.mark.django_db
+def test_submission_timeline(event):
+    event.timezone = 'UTC'
+    start = dt.datetime(2018, 1, 1, 12, tzinfo=dt.timezone.utc)
+    for days in (0, 0, 3):
+        _log_submission(event, start + dt.timedelta(days=days))
+    assert build_submission_timeline(event) == [
+        {'x': '2018-01-01', 'y': 2},
+        {'x': '2018-01-02', 'y': 0},
+        {'x': '2018-01-03', 'y': 0},
+        {'x': '2018-01-04', 'y': 1},
+    ]
+
+
+@pytest.mark.django_db
+def test_submission_timeline_uses_event_timezone(event):
+    event.timezone = 'Europe/Berlin'
+    _log_submission(event, dt.datetime(2018, 1, 1, 23, 30, tzinfo=dt.timezone.utc))
+    assert build_submission_timeline(event) == [{'x': '2018-01-02', 'y': 1}]
+
+
+@pytest.mark.django_db
+def test_submission_timeline_empty(event):
+    assert build_submission_timeline(event) == []
+
+
+@pytest.mark.django_db
+def test_submission_timeline_is_invalidated(locmem_cache, event, submission):
+    count = sum(day['y'] for day in get_submission_timeline(event))
+    submission.log_action('pretalx.submission.create')
+    assert sum(day['y'] for day in get_submission_timeline(event)) == count + 1
+
+
+@pytest.mark.django_db
+def test_orga_mail_without_stats_counts_submissions_only(
+    event, submission, monkeypatch
+):
+    from pretalx.common.mail import mail_send_task
+    from pretalx.event import stats
+
+    def fail(event):
+        raise AssertionError('Event statistics should not be computed')
+
+    sent = []
+    monkeypatch.setattr(stats, 'build_event_stats', fail)
+    monkeypatch.setattr(
+        mail_send_task, 'apply_async', lambda kwargs: sent.append(kwargs)
+    )
+    event.send_orga_mail('{submission_count} submissions')
+    assert '1 submissions' in sent[0]['body']
@@ -68,6 +68,18 @@ def test_template_tag_review_score(review):
     )
 
 
+@pytest.mark.django_db
+def test_template_tag_review_score_without_reviews(
+    submission, event_with_score_context, django_assert_num_queries
+):
+    submission = type(submission).objects.select_related('review_aggregate').get(
+        pk=submission.pk
+    )
+    with django_assert_num_queries(0):
+        assert review_score(event_with_score_context, submission) == 'ø'
+        assert submission.average_score is None
+
+
 @pytest.mark.parametrize(
     'url,target,result',
     (
@@ -2,6 +2,7 @@ import pytest
 from django.core import mail as djmail
 from django.utils.timezone import now
 
+from pretalx.event.models import Event
 from pretalx.mail.models import QueuedMail
 from pretalx.schedule.models import Schedule, TalkSlot
 from pretalx.submission.models import Submission
@@ -37,6 +38,23 @@ def test_freeze(slot):
     assert not new.version
 
 
+@pytest.mark.django_db
+def test_freeze_publishes_talks(event, confirmed_submission):
+    event.settings.export_html_on_schedule_release = False
+    assert not event.talks.exists()
+    slot = event.wip_schedule.talks.get(submission=confirmed_submission)
+    slot.start = now()
+    slot.save()
+    event.release_schedule('v1')
+    assert set(event.talks) == {confirmed_submission}
+    assert set(event.speakers) == set(confirmed_submission.speakers.all())
+
+    confirmed_submission.remove(force=True)
+    event = Event.objects.get(pk=event.pk)
+    assert not event.talks.exists()
+    assert not event.speakers.exists()
+
+
 @pytest.mark.parametrize('version', ['wip', 'latest', None])
 @pytest.mark.django_db
 def test_freeze_fail(slot, schedule, version):
@@ -1,6 +1,6 @@
 import pytest
 
-from pretalx.submission.models import Review
+from pretalx.submission.models import Review, ReviewAggregate
 
 
 @pytest.mark.django_db
@@ -15,8 +15,8 @@ from pretalx.submission.models import Review
 ))
 def test_average_review_score(submission, scores, expected):
     speaker = submission.speakers.first()
-    reviews = [Review(submission=submission, score=score, user=speaker) for score in scores]
-    Review.objects.bulk_create(reviews)
+    for score in scores:  # Saved one by one to maintain the review aggregate
+        Review.objects.create(submission=submission, score=score, user=speaker)
     assert submission.average_score == expected
     submission.reviews.all().delete()
 
@@ -33,3 +33,83 @@ def test_review_score_display(submission, score, override, expected, speaker):
     r = Review.objects.create(submission=submission, user=speaker, score=score, override_vote=override)
     assert submission.title in str(r)
     assert r.display_score == expected
+
+
+@pytest.mark.django_db
+def test_review_count_is_maintained(submission, review_user):
+    review = Review.objects.create(submission=submission, user=review_user, score=1)
+    submission.refresh_from_db()
+    assert submission.review_count == 1
+    review.delete()
+    submission.refresh_from_db()
+    assert submission.review_count == 0
+
+
+@pytest.mark.django_db
+def test_find_next_submission_prefers_fewest_reviews(
+    event, submission, other_submission, review_user, orga_user
+):
+    Review.objects.create(submission=submission, user=orga_user, score=1)
+    assert Review.find_next_submission(event, review_user) == other_submission
+    assert Review.find_next_submission(event, review_user) == other_submission
+    assert (
+        Review.find_next_submission(event, review_user, ignore=[other_submission])
+        == submission
+    )
+    Review.objects.create(submission=other_submission, user=review_user, score=1)
+    Review.objects.create(submission=submission, user=review_user, score=1)
+    assert Review.find_next_submission(event, review_user) is None
+
+
+@pytest.mark.django_db
+def test_find_next_submission_prefers_assignments(
+    event, submission, other_submission, review_user, orga_user
+):
+    Review.objects.create(submission=submission, user=orga_user, score=1)
+    submission.assigned_reviewers.add(review_user)
+    assert Review.find_next_submission(event, review_user) == submission
+    assert Review.find_next_submission(event, orga_user) == other_submission
+    Review.objects.create(submission=submission, user=review_user, score=1)
+    assert Review.find_next_submission(event, review_user) == other_submission
+
+
+@pytest.mark.django_db
+def test_review_aggregate_is_maintained(submission, review_user, orga_user):
+    Review.objects.create(submission=submission, user=review_user, score=1)
+    review = Review.objects.create(submission=submission, user=orga_user, score=3)
+    aggregate = ReviewAggregate.objects.get(submission=submission)
+    assert aggregate.score_count == 2
+    assert aggregate.mean_score == 2
+    assert aggregate.median_score == 2
+    assert aggregate.score_deviation == 1
+    assert not aggregate.has_override
+
+    review.score = None
+    review.override_vote = False
+    review.save()
+    aggregate.refresh_from_db()
+    assert aggregate.score_count == 1
+    assert aggregate.mean_score == 1
+    assert aggregate.negative_overrides == 1
+
+    review.delete()
+    aggregate.refresh_from_db()
+    assert aggregate.negative_overrides == 0
+
+
+@pytest.mark.django_db
+def test_review_aggregate_does_not_block_deletion(submission, review):
+    submission.delete()
+    assert not ReviewAggregate.objects.exists()
+
+
+@pytest.mark.django_db
+def test_find_next_submission_does_not_load_all_candidates(
+    event, submission, other_submission, review_user, django_assert_num_queries
+):
+    # One query for the assigned submissions, one for all others
+    with django_assert_num_queries(2):
+        assert Review.find_next_submission(event, review_user) in (
+            submission,
+            other_submission,
+        )
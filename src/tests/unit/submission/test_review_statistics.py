@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from pretalx.submission.models import Review
+from pretalx.submission.review_statistics import (
+    build_review_statistics, serialize_review_statistics,
+)
+
+
+@pytest.fixture
+def review_statistics(event, submission, other_submission, review_user, orga_user):
+    Review.objects.create(submission=submission, user=review_user, score=1)
+    Review.objects.create(submission=other_submission, user=review_user, score=3)
+    Review.objects.create(submission=submission, user=orga_user, score=2)
+    return build_review_statistics(event)
+
+
+@pytest.mark.django_db
+def test_review_statistics_submissions(review_statistics, submission, other_submission):
+    rows = {row['code']: row for row in review_statistics['submissions']}
+    assert rows[submission.code]['review_count'] == 2
+    assert rows[submission.code]['mean_score'] == 1.5
+    assert rows[submission.code]['mean_z_score'] == -0.5
+    assert rows[submission.code]['distribution'] == {1: 1, 2: 1}
+    assert rows[other_submission.code]['mean_z_score'] == 1
+    assert rows[other_submission.code]['rank'] == 1
+    assert rows[submission.code]['rank'] == 2
+    assert rows[submission.code]['coverage'] > rows[other_submission.code]['coverage']
+    assert review_statistics['summary']['review_count'] == 3
+
+
+@pytest.mark.django_db
+def test_review_statistics_unreviewed_submission(
+    event, submission, other_submission, review_user
+):
+    Review.objects.create(submission=submission, user=review_user, score=1)
+    statistics = build_review_statistics(event)
+    rows = {row['code']: row for row in statistics['submissions']}
+    assert rows[other_submission.code]['review_count'] == 0
+    assert rows[other_submission.code]['rank'] is None
+    assert statistics['summary']['submission_count'] == 2
+    assert statistics['summary']['reviewed_submission_count'] == 1
+
+
+@pytest.mark.django_db
+def test_review_statistics_reviewers(review_statistics, review_user):
+    rows = {row['email']: row for row in review_statistics['reviewers']}
+    assert len(rows) == 2
+    assert rows[review_user.email]['review_count'] == 2
+    assert rows[review_user.email]['mean_score'] == 2
+    assert rows[review_user.email]['score_deviation'] == 1
+    assert rows[review_user.email]['coverage'] == 1
+
+
+@pytest.mark.django_db
+def test_review_statistics_serialization(review_statistics, submission):
+    content, content_type = serialize_review_statistics(review_statistics)
+    assert content_type == 'text/csv'
+    assert content.startswith('code,title,state,rank,')
+    assert submission.code in content
+    assert '1:1 2:1' in content
+
+    content, content_type = serialize_review_statistics(
+        review_statistics, kind='reviewers', file_format='json'
+    )
+    assert content_type == 'application/json'
+    assert len(json.loads(content)['reviewers']) == 2
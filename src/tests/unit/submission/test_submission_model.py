@@ -1,6 +1,8 @@
 import pytest
 
-from pretalx.submission.models import Answer, SubmissionError, SubmissionStates
+from pretalx.submission.models import (
+    Answer, Submission, SubmissionError, SubmissionStates,
+)
 from pretalx.submission.models.submission import submission_image_path
 
 
@@ -246,3 +248,27 @@ def test_nonstandard_duration(submission):
 @pytest.mark.django_db
 def test_submission_image_path(submission):
     assert submission_image_path(submission, 'foo') == f'{submission.event.slug}/images/{submission.code}/foo'
+
+
+@pytest.mark.django_db
+def test_submission_edit_keeps_published_speakers(slot):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    submission = Submission.objects.get(pk=slot.submission.pk)
+    submission.title = 'New title'
+    with CaptureQueriesContext(connection) as context:
+        submission.save()
+    assert not any(
+        query['sql'].startswith('SELECT') and 'is_published' in query['sql']
+        for query in context
+    )
+
+
+@pytest.mark.django_db
+def test_submission_removal_unpublishes_speakers(slot):
+    submission = Submission.objects.get(pk=slot.submission.pk)
+    speaker = submission.speakers.first()
+    assert speaker.event_profile(submission.event).is_published
+    submission.remove(force=True)
+    assert not speaker.event_profile(submission.event).is_published
@@ -0,0 +1,31 @@
+from contextlib import contextmanager
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from pretalx.common.profiling import duplicate_queries
+
+
+@contextmanager
+def assert_max_queries(budget, name='The code'):
+    """
+    Fails if the wrapped code runs more than ``budget`` queries, and lists the
+    queries that ran repeatedly.
+    """
+    with CaptureQueriesContext(connection) as context:
+        yield context
+    if budget is None or len(context) > budget:
+        fail_with_queries(
+            f'{name} ran {len(context)} queries, the budget is {budget}.', context
+        )
+
+
+def fail_with_queries(message, context):
+    """Fails with ``message`` and the queries that ran repeatedly in ``context``."""
+    message = [message]
+    duplicates = duplicate_queries(context.captured_queries)
+    if duplicates:
+        message.append('Repeated queries:')
+        message += [f'{count:>5} × {sql}' for count, sql in duplicates]
+    pytest.fail('\n'.join(message), pytrace=False)